@@ -0,0 +1,885 @@
+#!/usr/bin/env python3
+"""
+Mock Jenkins Server for Jenkins Dashboard Benchmarks
+This module serves synthetic Jenkins payloads (api/json with tree expressions,
+computer, queue, pluginManager, updateCenter, config.xml, console logs,
+systemInfo and configuration pages) at a configurable scale and latency. Data
+is generated deterministically from a seed, and build histories and logs are
+generated on request, so large controllers cost little memory. Every response
+is counted, which lets the benchmark harness report requests and bytes.
+
+Run it on its own to point the dashboard at it:
+
+    python -m benchmarks.mock_jenkins --num-jobs 5000 --folder-depth 2 --port 8080
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from collections import namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+MOCK_JENKINS_VERSION = "2.440.3"
+
+Scale = namedtuple('Scale', ['jobs', 'nodes', 'folder_depth', 'folder_width', 'builds', 'log_kb',
+                             'plugins', 'queue_items', 'users', 'latency_ms', 'seed'],
+                   defaults=[200, 20, 1, 5, 30, 64, 120, 10, 50, 0, 1])
+
+# Share of last build results, in the order results are drawn
+RESULT_WEIGHTS = (('SUCCESS', 75), ('FAILURE', 12), ('UNSTABLE', 6), ('ABORTED', 3), (None, 4))
+RESULT_COLORS = {'SUCCESS': 'blue', 'FAILURE': 'red', 'UNSTABLE': 'yellow', 'ABORTED': 'aborted', None: 'notbuilt'}
+
+# Fields returned when a request has no tree parameter (roughly depth=0)
+ROOT_DEFAULT_TREE = ("_class,mode,nodeDescription,nodeName,numExecutors,description,quietingDown,"
+                     "slaveAgentPort,useCrumbs,useSecurity,jobs[_class,name,url,color],"
+                     "primaryView[_class,name,url],views[_class,name,url]")
+FOLDER_DEFAULT_TREE = "_class,name,fullName,displayName,description,url,jobs[_class,name,url,color]"
+JOB_DEFAULT_TREE = ("_class,name,fullName,displayName,description,url,color,buildable,inQueue,"
+                    "nextBuildNumber,builds[_class,number,url],firstBuild[_class,number,url],"
+                    "lastBuild[_class,number,url],lastCompletedBuild[_class,number,url],"
+                    "lastFailedBuild[_class,number,url],lastSuccessfulBuild[_class,number,url],"
+                    "healthReport[description,score]")
+
+# Jenkins returns at most this many entries for 'builds'; 'allBuilds' has them all
+BUILDS_FIELD_LIMIT = 100
+
+# Bodies smaller than this are sent uncompressed
+GZIP_MIN_BYTES = 1024
+
+def parse_tree(text):
+    """
+    Parse a Jenkins tree expression
+
+    Args:
+        text: Tree expression such as "jobs[name,builds[number]{0,10}]"
+
+    Returns:
+        list: (name, subtree or None, slice or None) tuples
+    """
+    position = 0
+
+    def parse_items():
+        nonlocal position
+        items = []
+        while True:
+            start = position
+            while position < len(text) and text[position] not in ',[]{}':
+                position += 1
+            name = text[start:position].strip()
+
+            subtree = None
+            if position < len(text) and text[position] == '[':
+                position += 1
+                subtree = parse_items()
+                if position >= len(text) or text[position] != ']':
+                    raise ValueError(f"Unbalanced brackets in tree: {text}")
+                position += 1
+
+            selection = None
+            if position < len(text) and text[position] == '{':
+                end = text.find('}', position)
+                if end < 0:
+                    raise ValueError(f"Unbalanced braces in tree: {text}")
+                selection = _parse_range(text[position + 1:end])
+                position = end + 1
+
+            if name:
+                items.append((name, subtree, selection))
+            if position < len(text) and text[position] == ',':
+                position += 1
+                continue
+            return items
+
+    items = parse_items()
+    if position != len(text):
+        raise ValueError(f"Unexpected '{text[position]}' in tree: {text}")
+    return items
+
+def _parse_range(text):
+    if ',' not in text:
+        index = int(text)
+        return slice(index, index + 1)
+    low, high = (part.strip() for part in text.split(',', 1))
+    return slice(int(low) if low else None, int(high) if high else None)
+
+def apply_tree(value, tree):
+    """
+    Select the fields of a payload named by a parsed tree expression
+
+    Values may be callables, which are only evaluated when selected. Objects
+    selected without a subtree keep their scalar fields only, like Jenkins.
+
+    Args:
+        value: Payload (dict, list, scalar or callable)
+        tree: Parsed tree from parse_tree(), or None
+
+    Returns:
+        Selected JSON-compatible value
+    """
+    if callable(value):
+        value = value()
+    if isinstance(value, list):
+        return [apply_tree(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    if tree is None:
+        return {key: item for key, item in value.items()
+                if not callable(item) and not isinstance(item, (dict, list))}
+
+    selected = {}
+    if '_class' in value:
+        selected['_class'] = value['_class']
+    for name, subtree, selection in tree:
+        keys = list(value) if name == '*' else [name] if name in value else []
+        for key in keys:
+            item = value[key]
+            if callable(item):
+                item = item()
+            if selection is not None and isinstance(item, list):
+                item = item[selection]
+            selected[key] = apply_tree(item, subtree)
+    return selected
+
+class RequestStats:
+    """Thread-safe counters of the requests served"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all counters"""
+        with self._lock:
+            self._requests = 0
+            self._bytes = 0
+            self._endpoints = {}
+            self._statuses = {}
+
+    def record(self, endpoint, status, size):
+        """
+        Count one response
+
+        Args:
+            endpoint: Endpoint kind, such as "api/json" or "config.xml"
+            status: HTTP status code
+            size: Body bytes sent
+        """
+        with self._lock:
+            self._requests += 1
+            self._bytes += size
+            counts = self._endpoints.setdefault(endpoint, [0, 0])
+            counts[0] += 1
+            counts[1] += size
+            self._statuses[status] = self._statuses.get(status, 0) + 1
+
+    def snapshot(self):
+        """
+        Get the current counters
+
+        Returns:
+            dict: Totals plus requests and bytes per endpoint kind and status
+        """
+        with self._lock:
+            return {
+                'requests': self._requests,
+                'bytes': self._bytes,
+                'endpoints': {name: {'requests': counts[0], 'bytes': counts[1]}
+                              for name, counts in sorted(self._endpoints.items())},
+                'statuses': dict(sorted(self._statuses.items()))
+            }
+
+class _Item:
+    """A job or folder of the synthetic controller"""
+
+    def __init__(self, name, parent, index=None):
+        self.name = name
+        self.parent = parent
+        self.index = index
+        self.children = [] if index is None else None
+        self.path = f"{parent.path if parent else ''}job/{quote(name)}/" if parent is not None else ""
+        self.full_name = f"{parent.full_name}/{name}" if parent is not None and parent.full_name else name
+
+    @property
+    def is_folder(self):
+        return self.children is not None
+
+class MockJenkins:
+    """Synthetic Jenkins controller served over HTTP"""
+
+    def __init__(self, scale=Scale()):
+        """
+        Generate the controller
+
+        Args:
+            scale: Scale of the synthetic data
+        """
+        self.scale = scale
+        self.stats = RequestStats()
+        self.url = "http://127.0.0.1/"
+        self.now_ms = int(time.time() * 1000)
+        self._server = None
+        self._thread = None
+
+        self.root = _Item("", None)
+        self._build_items()
+        self._log_chunk = self._make_log_chunk()
+
+    def start(self, host='127.0.0.1', port=0):
+        """
+        Serve in a background thread
+
+        Args:
+            host: Address to bind
+            port: TCP port (0 picks a free port)
+
+        Returns:
+            str: Base URL of the server, ending with a slash
+        """
+        self._server = ThreadingHTTPServer((host, port), _MockJenkinsHandler)
+        self._server.daemon_threads = True
+        self._server.jenkins = self
+        self.url = f"http://{host}:{self._server.server_address[1]}/"
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-jenkins", daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        """Stop serving"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    # Synthetic data
+
+    def _build_items(self):
+        scale = self.scale
+        leaves = [self.root]
+        for level in range(scale.folder_depth):
+            # Never create more leaf folders than there are jobs to put in them
+            width = max(1, min(scale.folder_width, scale.jobs // len(leaves)))
+            next_leaves = []
+            for folder in leaves:
+                for position in range(width):
+                    child = _Item(f"folder-{level + 1}-{position}", folder)
+                    folder.children.append(child)
+                    next_leaves.append(child)
+            leaves = next_leaves
+
+        for index in range(scale.jobs):
+            folder = leaves[index % len(leaves)]
+            folder.children.append(_Item(f"job-{index:05d}", folder, index))
+
+    def _job_profile(self, item):
+        """Deterministic properties of a job: class, last build and build cadence"""
+        rng = random.Random(self.scale.seed * 1000003 + item.index)
+        result = rng.choices([result for result, _ in RESULT_WEIGHTS],
+                             [weight for _, weight in RESULT_WEIGHTS])[0]
+        builds = 0 if result is None else self.scale.builds
+        return {
+            'class': 'org.jenkinsci.plugins.workflow.job.WorkflowJob' if rng.random() < 0.3
+                     else 'hudson.model.FreeStyleProject',
+            'result': result,
+            'building': result is not None and rng.random() < 0.05,
+            'last_number': rng.randint(builds, builds * 5) if builds else 0,
+            'builds': builds,
+            'interval_ms': rng.randint(15, 720) * 60 * 1000,
+            'seed': rng.random()
+        }
+
+    def _builds(self, item, profile, limit=None):
+        """Build records of a job, newest first"""
+        count = profile['builds'] if limit is None else min(limit, profile['builds'])
+        rng = random.Random(profile['seed'])
+        job_url = f"{self.url}{item.path}"
+        builds = []
+        for offset in range(count):
+            number = profile['last_number'] - offset
+            if offset == 0:
+                result = None if profile['building'] else profile['result']
+            else:
+                result = rng.choices([result for result, _ in RESULT_WEIGHTS[:-1]],
+                                     [weight for _, weight in RESULT_WEIGHTS[:-1]])[0]
+            builds.append({
+                '_class': 'hudson.model.FreeStyleBuild',
+                'number': number,
+                'url': f"{job_url}{number}/",
+                'result': result,
+                'building': offset == 0 and profile['building'],
+                'timestamp': self.now_ms - offset * profile['interval_ms'] - rng.randint(0, 600000),
+                'duration': 0 if result is None else rng.randint(10, 1800) * 1000,
+                'displayName': f"#{number}",
+                'artifacts': [
+                    {'fileName': f"artifact-{position}.jar", 'relativePath': f"target/artifact-{position}.jar",
+                     'displayPath': f"artifact-{position}.jar"}
+                    for position in range(number % 3)
+                ]
+            })
+        return builds
+
+    def _build_ref(self, item, profile, offset):
+        if offset >= profile['builds']:
+            return None
+        return lambda: self._builds(item, profile, offset + 1)[offset]
+
+    def item_payload(self, item):
+        """
+        Payload of a job or folder with lazily generated build data
+
+        Args:
+            item: Job or folder
+
+        Returns:
+            dict: Payload for apply_tree()
+        """
+        payload = {
+            'name': item.name,
+            'fullName': item.full_name,
+            'displayName': item.name,
+            'description': "",
+            'url': f"{self.url}{item.path}",
+        }
+        if item.is_folder:
+            payload['_class'] = 'com.cloudbees.hudson.plugins.folder.Folder'
+            payload['jobs'] = lambda: [self.item_payload(child) for child in item.children]
+            return payload
+
+        profile = self._job_profile(item)
+        color = RESULT_COLORS[profile['result']]
+        builds = profile['builds']
+        payload.update({
+            '_class': profile['class'],
+            'color': f"{color}_anime" if profile['building'] else color,
+            'buildable': True,
+            'inQueue': False,
+            'nextBuildNumber': profile['last_number'] + 1,
+            'builds': lambda: self._builds(item, profile, BUILDS_FIELD_LIMIT),
+            'allBuilds': lambda: self._builds(item, profile),
+            'healthReport': [{'description': "Build stability", 'score': 80}] if builds else [],
+        })
+        if builds:
+            payload['firstBuild'] = lambda: self._builds(item, profile)[-1]
+            payload['lastBuild'] = self._build_ref(item, profile, 0)
+            payload['lastCompletedBuild'] = self._build_ref(item, profile, 1 if profile['building'] else 0)
+            payload['lastSuccessfulBuild'] = self._build_ref(item, profile, 1 if profile['building'] else 0) \
+                if profile['result'] == 'SUCCESS' else None
+            payload['lastFailedBuild'] = self._build_ref(item, profile, 0) \
+                if profile['result'] == 'FAILURE' else None
+        else:
+            payload.update({'firstBuild': None, 'lastBuild': None, 'lastCompletedBuild': None,
+                            'lastSuccessfulBuild': None, 'lastFailedBuild': None})
+        return payload
+
+    def root_payload(self):
+        """Payload of the controller's root api/json"""
+        return {
+            '_class': 'hudson.model.Hudson',
+            'mode': 'NORMAL',
+            'nodeDescription': "the Jenkins controller's built-in node",
+            'nodeName': "",
+            'numExecutors': 2,
+            'description': None,
+            'quietingDown': False,
+            'slaveAgentPort': 50000,
+            'useCrumbs': True,
+            'useSecurity': True,
+            'jobs': lambda: [self.item_payload(child) for child in self.root.children],
+            'primaryView': {'_class': 'hudson.model.AllView', 'name': 'all', 'url': self.url},
+            'views': [{'_class': 'hudson.model.AllView', 'name': 'all', 'url': self.url}]
+        }
+
+    def computer_payload(self):
+        """Payload of computer/api/json"""
+        rng = random.Random(self.scale.seed * 7919)
+        computers = []
+        busy_total = 0
+        executors_total = 0
+        for index in range(self.scale.nodes + 1):
+            builtin = index == 0
+            name = "Built-In Node" if builtin else f"agent-{index:04d}"
+            offline = not builtin and rng.random() < 0.1
+            executors = 2 if builtin else rng.choice((1, 2, 4, 8))
+            busy = 0 if offline else rng.randint(0, executors)
+            labels = ["built-in"] if builtin else [f"linux-{index % 4}", rng.choice(("docker", "maven", "node"))]
+            total_memory = rng.choice((8, 16, 32, 64)) * 1024 ** 3
+            disk_size = rng.choice((100, 250, 500)) * 1024 ** 3
+            computers.append({
+                '_class': 'hudson.model.Hudson$MasterComputer' if builtin else 'hudson.slaves.SlaveComputer',
+                'displayName': name,
+                'description': "" if builtin else f"Synthetic agent {index}",
+                'offline': offline,
+                'temporarilyOffline': offline and rng.random() < 0.3,
+                'offlineCauseReason': "Disconnected" if offline else "",
+                'connectTime': self.now_ms - rng.randint(1, 30 * 24 * 3600) * 1000,
+                'numExecutors': executors,
+                'idle': busy == 0,
+                'labelString': " ".join(labels),
+                'assignedLabels': [{'name': label} for label in [name] + labels],
+                'monitorData': {} if offline else {
+                    'hudson.node_monitors.ArchitectureMonitor': "Linux (amd64)",
+                    'hudson.node_monitors.ClockMonitor': {'_class': 'hudson.util.ClockDifference',
+                                                          'diff': rng.randint(-50, 50)},
+                    'hudson.node_monitors.DiskSpaceMonitor': {
+                        '_class': 'hudson.node_monitors.DiskSpaceMonitorDescriptor$DiskSpace',
+                        'timestamp': self.now_ms, 'path': "/var/jenkins",
+                        'size': disk_size, 'freeSpace': int(disk_size * rng.uniform(0.05, 0.9))},
+                    'hudson.node_monitors.ResponseTimeMonitor': {'_class': 'hudson.node_monitors.ResponseTimeMonitor$Data',
+                                                                 'timestamp': self.now_ms,
+                                                                 'average': rng.randint(5, 400)},
+                    'hudson.node_monitors.SwapSpaceMonitor': {
+                        '_class': 'hudson.node_monitors.SwapSpaceMonitor$MemoryUsage2',
+                        'totalPhysicalMemory': total_memory,
+                        'availablePhysicalMemory': int(total_memory * rng.uniform(0.1, 0.8)),
+                        'totalSwapSpace': 2 * 1024 ** 3, 'availableSwapSpace': 1024 ** 3},
+                    'hudson.node_monitors.TemporarySpaceMonitor': {
+                        '_class': 'hudson.node_monitors.DiskSpaceMonitorDescriptor$DiskSpace',
+                        'timestamp': self.now_ms, 'path': "/tmp",
+                        'size': 20 * 1024 ** 3, 'freeSpace': 10 * 1024 ** 3},
+                },
+                'executors': [
+                    {'idle': position >= busy,
+                     'progress': -1 if position >= busy else rng.randint(0, 99),
+                     'currentExecutable': None if position >= busy else {
+                         '_class': 'hudson.model.FreeStyleBuild',
+                         'number': rng.randint(1, 500),
+                         'url': f"{self.url}job/job-{rng.randint(0, max(0, self.scale.jobs - 1)):05d}/1/",
+                         'displayName': "#1"}}
+                    for position in range(executors)
+                ]
+            })
+            executors_total += 0 if offline else executors
+            busy_total += busy
+
+        return {
+            '_class': 'hudson.model.ComputerSet',
+            'busyExecutors': busy_total,
+            'totalExecutors': executors_total,
+            'displayName': "Nodes",
+            'computer': computers
+        }
+
+    def queue_payload(self):
+        """Payload of queue/api/json"""
+        rng = random.Random(self.scale.seed * 104729)
+        reasons = ("Waiting for next available executor", "Waiting for next available executor on 'docker'",
+                   "Build #12 is already in progress", "There are no nodes with the label 'gpu'")
+        items = []
+        for index in range(self.scale.queue_items):
+            job_name = f"job-{rng.randint(0, max(0, self.scale.jobs - 1)):05d}"
+            items.append({
+                '_class': 'hudson.model.Queue$BuildableItem',
+                'id': 1000 + index,
+                'blocked': False,
+                'buildable': True,
+                'stuck': rng.random() < 0.1,
+                'inQueueSince': self.now_ms - rng.randint(5, 7200) * 1000,
+                'why': rng.choice(reasons),
+                'task': {'_class': 'hudson.model.FreeStyleProject', 'name': job_name,
+                         'url': f"{self.url}job/{job_name}/", 'color': 'blue'}
+            })
+        return {'_class': 'hudson.model.Queue', 'discoverableItems': [], 'items': items}
+
+    def _plugins(self):
+        rng = random.Random(self.scale.seed * 1299709)
+        categories = ("Build Tools", "Source Code Management", "Pipelines and Continuous Delivery",
+                      "Security", "User Interface", "Library plugins (for use by other plugins)")
+        plugins = []
+        for index in range(self.scale.plugins):
+            short_name = f"plugin-{index:03d}"
+            plugins.append({
+                'active': rng.random() > 0.05,
+                'enabled': True,
+                'bundled': False,
+                'hasUpdate': rng.random() < 0.15,
+                'pinned': False,
+                'shortName': short_name,
+                'longName': f"Synthetic Plugin {index}",
+                'version': f"{rng.randint(1, 5)}.{rng.randint(0, 40)}",
+                'url': f"https://plugins.jenkins.io/{short_name}",
+                'categories': [rng.choice(categories)],
+                'releaseTimestamp': self.now_ms - rng.randint(1, 900) * 86400000,
+                'dependencies': [{'shortName': f"plugin-{rng.randint(0, self.scale.plugins - 1):03d}",
+                                  'version': "1.0", 'optional': False}
+                                 for _ in range(rng.randint(0, 4))]
+            })
+        return plugins
+
+    def plugin_manager_payload(self):
+        """Payload of pluginManager/api/json"""
+        return {'_class': 'hudson.LocalPluginManager', 'plugins': self._plugins()}
+
+    def update_center_payload(self):
+        """Payload of updateCenter/api/json"""
+        latest = {}
+        for plugin in self._plugins():
+            if plugin['hasUpdate']:
+                major, minor = plugin['version'].split('.')
+                latest[plugin['shortName']] = {'version': f"{major}.{int(minor) + 1}"}
+        return {
+            '_class': 'hudson.model.UpdateCenter',
+            'availables': [],
+            'jobs': [],
+            'restartRequiredForCompletion': False,
+            'sites': [{'id': 'default', 'url': "https://updates.jenkins.io/update-center.json",
+                       'plugins': latest}]
+        }
+
+    def people_payload(self):
+        """Payload of asynchPeople/api/json"""
+        return {
+            '_class': 'hudson.model.View$AsynchPeople$People',
+            'users': [{'lastChange': self.now_ms - index * 3600000,
+                       'project': None,
+                       'user': {'absoluteUrl': f"{self.url}user/user{index}", 'fullName': f"User {index}"}}
+                      for index in range(self.scale.users)]
+        }
+
+    def system_info_page(self, node_name=None):
+        """HTML of a systemInfo page with system properties and environment variables"""
+        rows = {
+            'file.encoding': "UTF-8",
+            'java.home': "/opt/java/openjdk",
+            'java.vendor': "Eclipse Adoptium",
+            'java.version': "17.0.10",
+            'java.vm.name': "OpenJDK 64-Bit Server VM",
+            'jenkins.home': "/var/jenkins_home",
+            'os.arch': "amd64",
+            'os.name': "Linux",
+            'os.version': "5.15.0-105-generic",
+            'user.name': "jenkins",
+            'user.timezone': "UTC",
+        }
+        for index in range(150):
+            rows[f"synthetic.property.{index:03d}"] = f"value-{index}-" + "x" * (index % 40)
+
+        environment = {
+            'HOME': "/var/jenkins_home",
+            'HOSTNAME': node_name or "jenkins-controller",
+            'JAVA_HOME': "/opt/java/openjdk",
+            'JENKINS_HOME': "/var/jenkins_home",
+            'PATH': "/opt/java/openjdk/bin:/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin",
+        }
+
+        def table(title, values):
+            body = "".join(f"<tr><td class='pane'>{key}</td><td class='pane' style='word-break:break-all'>"
+                           f"{value}</td></tr>" for key, value in values.items())
+            return f"<h2>{title}</h2><table class='pane sortable bigtable'><tr><th>Name</th><th>Value</th></tr>{body}</table>"
+
+        return (f"<html><head><title>System Information [Jenkins]</title></head><body>"
+                f"{table('System Properties', rows)}{table('Environment Variables', environment)}</body></html>")
+
+    def config_page(self, name):
+        """HTML of a configuration form (configure, configureTools, configureSecurity)"""
+        sections = {
+            'configure': [
+                ("Jenkins Location", [("_.url", self.url), ("_.adminAddress", "jenkins@example.com")]),
+                ("E-mail Notification", [("_.smtpHost", "smtp.example.com"), ("_.smtpPort", "25"),
+                                         ("_.defaultSuffix", "@example.com")]),
+                ("Extended E-mail Notification", [("_.smtpServer", "smtp.example.com"),
+                                                  ("_.defaultRecipients", "team@example.com")]),
+            ],
+            'configureTools': [
+                ("JDK installations", [("_.name", "jdk17"), ("_.home", "/opt/java/openjdk")]),
+                ("Maven installations", [("_.name", "maven3"), ("_.home", "/opt/maven")]),
+                ("Git installations", [("_.name", "Default"), ("_.home", "git")]),
+            ],
+            'configureSecurity': [
+                ("Security Realm", [("_.securityRealm", "hudson.security.HudsonPrivateSecurityRealm")]),
+                ("Authorization", [("_.authorizationStrategy",
+                                    "hudson.security.FullControlOnceLoggedInAuthorizationStrategy")]),
+                ("CSRF Protection", [("_.crumbIssuer", "hudson.security.csrf.DefaultCrumbIssuer")]),
+            ],
+        }[name]
+        # Real configuration pages are large; pad with descriptor sections
+        sections = sections + [(f"Descriptor {index}", [(f"_.setting{index}", f"value-{index}")])
+                               for index in range(200)]
+
+        body = "".join(
+            f"<div class='section'><h2>{title}</h2>" + "".join(
+                f"<div class='setting-main'><input name='{field}' type='text' value='{value}' "
+                f"class='jenkins-input setting-input'/></div>" for field, value in fields) + "</div>"
+            for title, fields in sections)
+        return f"<html><head><title>Configure [Jenkins]</title></head><body><form name='config'>{body}</form></body></html>"
+
+    def config_xml(self, item):
+        """config.xml of a job"""
+        profile = self._job_profile(item)
+        recipients = "team@example.com" if profile['seed'] < 0.4 else ""
+        return (f"<?xml version='1.1' encoding='UTF-8'?>\n<project>\n"
+                f"  <description>Synthetic job {item.full_name}</description>\n"
+                f"  <keepDependencies>false</keepDependencies>\n"
+                f"  <assignedNode>linux-{item.index % 4}</assignedNode>\n"
+                f"  <canRoam>false</canRoam>\n  <disabled>false</disabled>\n"
+                f"  <triggers>\n    <hudson.triggers.SCMTrigger>\n      <spec>H/15 * * * *</spec>\n"
+                f"    </hudson.triggers.SCMTrigger>\n  </triggers>\n"
+                f"  <builders>\n    <hudson.tasks.Shell>\n      <command>make test JOB={item.index}</command>\n"
+                f"    </hudson.tasks.Shell>\n  </builders>\n"
+                f"  <publishers>\n    <hudson.tasks.Mailer plugin=\"mailer@463.vedf8358e006b_\">\n"
+                f"      <recipients>{recipients}</recipients>\n"
+                f"      <dontNotifyEveryUnstableBuild>false</dontNotifyEveryUnstableBuild>\n"
+                f"    </hudson.tasks.Mailer>\n  </publishers>\n</project>\n")
+
+    def _make_log_chunk(self):
+        lines = [f"[2024-01-01T00:00:{index % 60:02d}Z] [INFO] Step {index}: compiling module-{index % 17} "
+                 f"({index * 37 % 1000} files)\n" for index in range(64)]
+        return "".join(lines).encode('utf-8')
+
+    def console_log(self, item, number):
+        """
+        Console log of a build, about log_kb kilobytes long
+
+        Args:
+            item: Job
+            number: Build number
+
+        Returns:
+            bytes: Log text
+        """
+        profile = self._job_profile(item)
+        size = self.scale.log_kb * 1024
+        repeats = max(1, size // len(self._log_chunk))
+        failed = number == profile['last_number'] and profile['result'] == 'FAILURE'
+        ending = (b"[ERROR] Tests run: 120, Failures: 2, Errors: 0, Skipped: 0\n"
+                  b"ERROR: Build step 'Execute shell' marked build as failure\nFinished: FAILURE\n"
+                  if failed else b"Finished: SUCCESS\n")
+        return b"Started by timer\n" + self._log_chunk * repeats + ending
+
+    def find_item(self, segments):
+        """
+        Resolve job/<name>/job/<name>/... path segments
+
+        Args:
+            segments: URL path segments
+
+        Returns:
+            tuple: (item or None, remaining segments)
+        """
+        item = self.root
+        position = 0
+        while position + 1 < len(segments) and segments[position] == 'job':
+            if not item.is_folder:
+                return None, segments
+            name = unquote(segments[position + 1])
+            item = next((child for child in item.children if child.name == name), None)
+            if item is None:
+                return None, segments
+            position += 2
+        return item, segments[position:]
+
+class _MockJenkinsHandler(BaseHTTPRequestHandler):
+    """Routes requests to the synthetic controller"""
+
+    protocol_version = "HTTP/1.1"
+
+    # Headers and body are written separately; without this, delayed ACKs
+    # add about 40 ms to every small keep-alive response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        jenkins = self.server.jenkins
+        if jenkins.scale.latency_ms:
+            time.sleep(jenkins.scale.latency_ms / 1000)
+
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        segments = [segment for segment in parts.path.split('/') if segment]
+
+        try:
+            endpoint, status, content_type, body, extra_headers = self._route(jenkins, segments, query)
+        except ValueError as e:
+            endpoint, status, content_type, body, extra_headers = 'bad-request', 400, 'text/plain', str(e), {}
+
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+
+        headers = {'X-Jenkins': MOCK_JENKINS_VERSION, 'Content-Type': content_type}
+        headers.update(extra_headers)
+        # Like Jenkins, start a web session for clients that don't send one
+        if 'JSESSIONID' not in self.headers.get('Cookie', ''):
+            headers['Set-Cookie'] = f"JSESSIONID.mock={uuid.uuid4().hex}; Path=/; HttpOnly"
+        # Like Jenkins, config.xml is sent without validators
+        if status == 200 and endpoint not in ('console', 'config.xml'):
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            headers['ETag'] = etag
+            if self.headers.get('If-None-Match') == etag:
+                status, body = 304, b''
+        if body and len(body) >= GZIP_MIN_BYTES and endpoint != 'console' \
+                and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body, compresslevel=5)
+            headers['Content-Encoding'] = 'gzip'
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        jenkins.stats.record(endpoint, status, len(body))
+
+    def _json(self, endpoint, payload, query, default_tree=None):
+        tree = query.get('tree', [default_tree])[0]
+        if tree:
+            payload = apply_tree(payload, parse_tree(tree))
+        return endpoint, 200, 'application/json;charset=utf-8', json.dumps(payload), {}
+
+    def _route(self, jenkins, segments, query):
+        html = 'text/html;charset=utf-8'
+        item, rest = jenkins.find_item(segments)
+
+        if item is None:
+            return 'not-found', 404, 'text/plain', "Not found", {}
+
+        if item.is_folder and rest == ['api', 'json']:
+            if item is jenkins.root:
+                return self._json('api/json', jenkins.root_payload(), query, ROOT_DEFAULT_TREE)
+            return self._json('api/json', jenkins.item_payload(item), query, FOLDER_DEFAULT_TREE)
+
+        if not item.is_folder:
+            return self._route_job(jenkins, item, rest, query)
+
+        if item is not jenkins.root:
+            return 'not-found', 404, 'text/plain', "Not found", {}
+
+        if rest and rest[0] == 'manage':
+            rest = rest[1:]
+
+        routes = {
+            (): lambda: ('root', 200, html, "<html><body>Dashboard [Jenkins]</body></html>", {}),
+            ('computer', 'api', 'json'): lambda: self._json('computer', jenkins.computer_payload(), query),
+            ('queue', 'api', 'json'): lambda: self._json('queue', jenkins.queue_payload(), query),
+            ('pluginManager', 'api', 'json'): lambda: self._json('pluginManager', jenkins.plugin_manager_payload(), query),
+            ('updateCenter', 'api', 'json'): lambda: self._json('updateCenter', jenkins.update_center_payload(), query),
+            ('asynchPeople', 'api', 'json'): lambda: self._json('people', jenkins.people_payload(), query),
+            ('securityRealm', 'api', 'json'): lambda: self._json(
+                'securityRealm', {'_class': 'hudson.security.HudsonPrivateSecurityRealm'}, query),
+            ('me', 'api', 'json'): lambda: self._json(
+                'me', {'_class': 'hudson.model.User', 'id': 'bench', 'fullName': 'Benchmark User'}, query),
+            ('crumbIssuer', 'api', 'json'): lambda: self._json(
+                'crumbIssuer', {'_class': 'hudson.security.csrf.DefaultCrumbIssuer',
+                                'crumb': 'mock-crumb', 'crumbRequestField': 'Jenkins-Crumb'}, query),
+            ('systemInfo',): lambda: ('systemInfo', 200, html, jenkins.system_info_page(), {}),
+            ('about',): lambda: ('page', 200, html, "<html><body>Jenkins " + MOCK_JENKINS_VERSION + "</body></html>", {}),
+            ('configure',): lambda: ('page', 200, html, jenkins.config_page('configure'), {}),
+            ('configureTools',): lambda: ('page', 200, html, jenkins.config_page('configureTools'), {}),
+            ('configureSecurity',): lambda: ('page', 200, html, jenkins.config_page('configureSecurity'), {}),
+        }
+        route = routes.get(tuple(rest))
+        if route:
+            return route()
+
+        if len(rest) == 3 and rest[0] == 'computer' and rest[2] == 'systemInfo':
+            return 'systemInfo', 200, html, jenkins.system_info_page(unquote(rest[1])), {}
+
+        return 'not-found', 404, 'text/plain', "Not found", {}
+
+    def _route_job(self, jenkins, item, rest, query):
+        if rest == ['api', 'json']:
+            return self._json('api/json', jenkins.item_payload(item), query, JOB_DEFAULT_TREE)
+        if rest == ['config.xml']:
+            return 'config.xml', 200, 'application/xml', jenkins.config_xml(item), {}
+        if not rest:
+            return 'page', 200, 'text/html;charset=utf-8', f"<html><body>{item.full_name}</body></html>", {}
+
+        profile = jenkins._job_profile(item)
+        if rest[0] == 'lastBuild':
+            number = profile['last_number'] if profile['builds'] else None
+        elif rest[0].isdigit():
+            number = int(rest[0])
+            if not profile['last_number'] - profile['builds'] < number <= profile['last_number']:
+                number = None
+        else:
+            number = None
+        if number is None:
+            return 'not-found', 404, 'text/plain', "Not found", {}
+
+        build_rest = rest[1:]
+        if build_rest == ['api', 'json']:
+            offset = profile['last_number'] - number
+            build = jenkins._builds(item, profile, offset + 1)[offset]
+            return self._json('build', build, query)
+        if build_rest == ['consoleText']:
+            return 'console', 200, 'text/plain;charset=utf-8', jenkins.console_log(item, number), {}
+        if build_rest == ['logText', 'progressiveText']:
+            log = jenkins.console_log(item, number)
+            start = int(query.get('start', ['0'])[0] or 0)
+            return 'console', 200, 'text/plain;charset=utf-8', log[start:], {
+                'X-Text-Size': str(len(log)), 'X-More-Data': 'false'}
+
+        return 'not-found', 404, 'text/plain', "Not found", {}
+
+    def log_message(self, format, *args):
+        # The dashboard makes many requests; keep them out of the console
+        pass
+
+def add_scale_arguments(parser):
+    """
+    Add the synthetic data scale options to an argument parser
+
+    Args:
+        parser: argparse.ArgumentParser
+    """
+    defaults = Scale()
+    parser.add_argument("--num-jobs", type=int, default=defaults.jobs, metavar="N",
+                        help=f"Number of jobs (default: {defaults.jobs})")
+    parser.add_argument("--num-nodes", type=int, default=defaults.nodes, metavar="N",
+                        help=f"Number of agents besides the built-in node (default: {defaults.nodes})")
+    parser.add_argument("--folder-depth", type=int, default=defaults.folder_depth, metavar="N",
+                        help=f"Folder levels above the jobs (default: {defaults.folder_depth})")
+    parser.add_argument("--folder-width", type=int, default=defaults.folder_width, metavar="N",
+                        help=f"Sub-folders per folder (default: {defaults.folder_width})")
+    parser.add_argument("--builds", type=int, default=defaults.builds, metavar="N",
+                        help=f"Builds kept per job (default: {defaults.builds})")
+    parser.add_argument("--log-kb", type=int, default=defaults.log_kb, metavar="KB",
+                        help=f"Console log size per build (default: {defaults.log_kb})")
+    parser.add_argument("--plugins", type=int, default=defaults.plugins, metavar="N",
+                        help=f"Installed plugins (default: {defaults.plugins})")
+    parser.add_argument("--queue-items", type=int, default=defaults.queue_items, metavar="N",
+                        help=f"Items in the build queue (default: {defaults.queue_items})")
+    parser.add_argument("--users", type=int, default=defaults.users, metavar="N",
+                        help=f"Known users (default: {defaults.users})")
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, metavar="MS",
+                        help=f"Delay added to every response (default: {defaults.latency_ms})")
+    parser.add_argument("--seed", type=int, default=defaults.seed,
+                        help=f"Random seed of the synthetic data (default: {defaults.seed})")
+
+def scale_from_args(args):
+    """
+    Build a Scale from parsed scale options
+
+    Args:
+        args: Arguments parsed with add_scale_arguments()
+
+    Returns:
+        Scale: Scale of the synthetic data
+    """
+    return Scale(args.num_jobs, args.num_nodes, args.folder_depth, args.folder_width, args.builds, args.log_kb,
+                 args.plugins, args.queue_items, args.users, args.latency_ms, args.seed)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic Jenkins controller")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="TCP port (default: 8080)")
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+
+    jenkins = MockJenkins(scale_from_args(args))
+    url = jenkins.start(args.host, args.port)
+    print(f"Mock Jenkins serving {args.num_jobs} jobs and {args.num_nodes} agents at {url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(60)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        jenkins.stop()
+        print(json.dumps(jenkins.stats.snapshot(), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Benchmark Harness for Jenkins Dashboard
+This module starts a mock Jenkins controller, runs jenkins_dashboard.py once
+per display option against it and reports, for every run, the requests the
+dashboard made, the bytes it received, its wall time and its peak RSS.
+
+    python -m benchmarks.run_benchmarks --num-jobs 2000 --folder-depth 2 --latency-ms 20
+
+Each run is a separate process, so peak RSS covers a single option. Runs use
+--no-cache unless --cache-dir is given, in which case each option runs once
+to warm the caches before it is measured.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from tabulate import tabulate
+
+from benchmarks.mock_jenkins import MockJenkins, add_scale_arguments, scale_from_args
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DASHBOARD = os.path.join(ROOT_DIR, "jenkins_dashboard.py")
+
+# Display options benchmarked by default ("" is the overview without options)
+DEFAULT_FLAGS = [
+    "", "--info", "--system", "--security", "--users", "--jobs", "--failed-jobs", "--build-stats",
+    "--artifacts", "--nodes", "--node-details", "--os", "--labels", "--executors", "--hardware",
+    "--plugins", "--queue", "--disk", "--tools", "--email", "--notifications", "--alerts", "--all"
+]
+
+DEFAULT_RUN_TIMEOUT = 600
+
+def _max_rss_bytes(usage):
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+
+def run_dashboard(url, flag, extra_args, timeout=DEFAULT_RUN_TIMEOUT):
+    """
+    Run the dashboard once and measure it
+
+    Args:
+        url: Jenkins URL
+        flag: Display option ("" for the default overview)
+        extra_args: Additional dashboard arguments
+        timeout: Seconds before the run is killed
+
+    Returns:
+        dict: exit_code, wall_seconds, peak_rss_bytes and stderr tail
+    """
+    command = [sys.executable, DASHBOARD, url, "bench", "bench"] + ([flag] if flag else []) + list(extra_args)
+    started = time.monotonic()
+    process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, cwd=ROOT_DIR)
+
+    # Drain stderr concurrently so a chatty run cannot block on a full pipe
+    stderr_chunks = []
+    reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+    reader.start()
+    killer = threading.Timer(timeout, process.kill)
+    killer.start()
+    try:
+        # wait4 reports the resource usage of this child alone
+        _, status, usage = os.wait4(process.pid, 0)
+    finally:
+        killer.cancel()
+    wall = time.monotonic() - started
+    process.returncode = os.waitstatus_to_exitcode(status)
+    reader.join()
+    process.stderr.close()
+
+    stderr = b"".join(stderr_chunks).decode('utf-8', 'replace').strip()
+    return {
+        'exit_code': process.returncode,
+        'wall_seconds': wall,
+        'peak_rss_bytes': _max_rss_bytes(usage),
+        'stderr': stderr[-500:]
+    }
+
+def benchmark_flag(jenkins, flag, extra_args, repeat, warm, timeout=DEFAULT_RUN_TIMEOUT):
+    """
+    Benchmark one display option
+
+    Args:
+        jenkins: Running MockJenkins
+        flag: Display option ("" for the default overview)
+        extra_args: Additional dashboard arguments
+        repeat: Number of measured runs
+        warm: Whether to run once unmeasured first (to fill local caches)
+        timeout: Seconds before a run is killed
+
+    Returns:
+        dict: Median wall time, highest peak RSS and the requests and bytes of the last run
+    """
+    if warm:
+        run_dashboard(jenkins.url, flag, extra_args, timeout)
+
+    runs = []
+    for _ in range(repeat):
+        jenkins.stats.reset()
+        run = run_dashboard(jenkins.url, flag, extra_args, timeout)
+        run['server'] = jenkins.stats.snapshot()
+        runs.append(run)
+
+    last = runs[-1]
+    return {
+        'flag': flag or "(overview)",
+        'exit_code': max((run['exit_code'] for run in runs), key=abs),
+        'requests': last['server']['requests'],
+        'bytes': last['server']['bytes'],
+        'wall_seconds': statistics.median(run['wall_seconds'] for run in runs),
+        'peak_rss_bytes': max(run['peak_rss_bytes'] for run in runs),
+        'endpoints': last['server']['endpoints'],
+        'statuses': last['server']['statuses'],
+        'stderr': last['stderr'] if last['exit_code'] else ""
+    }
+
+def display_results(scale, results):
+    """
+    Print benchmark results as a table
+
+    Args:
+        scale: Scale of the mock controller
+        results: Results from benchmark_flag()
+    """
+    print(f"Mock controller: {scale.jobs} jobs (folder depth {scale.folder_depth}), {scale.nodes} agents, "
+          f"{scale.builds} builds/job, {scale.log_kb} KB logs, {scale.latency_ms} ms latency")
+
+    rows = []
+    for result in results:
+        rows.append([
+            result['flag'],
+            result['exit_code'],
+            result['requests'],
+            f"{result['bytes'] / 1024:.1f}",
+            f"{result['wall_seconds']:.2f}",
+            f"{result['peak_rss_bytes'] / 1024 ** 2:.1f}"
+        ])
+    print(tabulate(rows, headers=['Option', 'Exit', 'Requests', 'KB Received', 'Wall (s)', 'Peak RSS (MB)'],
+                   tablefmt='grid'))
+
+    for result in results:
+        if result['exit_code']:
+            print(f"\n{result['flag']} exited with {result['exit_code']}:\n{result['stderr']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark jenkins_dashboard.py against a mock Jenkins controller")
+    add_scale_arguments(parser)
+    parser.add_argument("--flags", metavar="LIST",
+                        help="Comma-separated display options to benchmark, such as overview,jobs,all "
+                             "(default: the overview, every option and --all)")
+    parser.add_argument("--repeat", type=int, default=1, metavar="N",
+                        help="Measured runs per option; wall time is the median (default: 1)")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="Use local caches in DIR, warmed by an unmeasured run (default: --no-cache)")
+    parser.add_argument("--run-timeout", type=float, default=DEFAULT_RUN_TIMEOUT, metavar="SECONDS",
+                        help=f"Kill a run after this many seconds (default: {DEFAULT_RUN_TIMEOUT})")
+    parser.add_argument("--json", metavar="FILE", help="Also write the results (with per-endpoint counts) to FILE")
+    parser.add_argument("dashboard_args", nargs=argparse.REMAINDER,
+                        help="Extra dashboard arguments after --, e.g. -- --max-parallel 4")
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    extra_args = [arg for arg in args.dashboard_args if arg != '--']
+    extra_args += ["--cache-dir", args.cache_dir] if args.cache_dir else ["--no-cache"]
+    flags = DEFAULT_FLAGS
+    if args.flags:
+        flags = ["" if name == "overview" else f"--{name.strip().lstrip('-')}" for name in args.flags.split(',')]
+
+    scale = scale_from_args(args)
+    jenkins = MockJenkins(scale)
+    jenkins.start()
+
+    results = []
+    try:
+        for flag in flags:
+            print(f"Benchmarking {flag or '(overview)'}...", file=sys.stderr)
+            results.append(benchmark_flag(jenkins, flag, extra_args, args.repeat, bool(args.cache_dir),
+                                          args.run_timeout))
+    except KeyboardInterrupt:
+        print("Interrupted; reporting completed runs", file=sys.stderr)
+    finally:
+        jenkins.stop()
+
+    display_results(scale, results)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as output:
+            json.dump({'scale': scale._asdict(), 'results': results}, output, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Startup Time Benchmark for Jenkins Dashboard
+This module runs a single-option dashboard invocation against the mock Jenkins
+controller under "python -X importtime" and checks that the time spent
+importing modules stays under a target. It lists the most expensive imports
+and the collector and display modules the run loaded, which should only be
+those of the selected option.
+
+    python -m benchmarks.startup_time --flag queue --target-ms 300
+
+Exits with status 1 when the import time is over the target.
+"""
+
+import argparse
+import subprocess
+import sys
+
+from benchmarks.mock_jenkins import MockJenkins, Scale
+from benchmarks.run_benchmarks import DASHBOARD, ROOT_DIR
+
+DEFAULT_TARGET_MS = 300
+DEFAULT_REPEAT = 5
+TOP_IMPORTS = 10
+
+def parse_importtime(stderr):
+    """
+    Parse "python -X importtime" output
+
+    Args:
+        stderr: Standard error of the traced process
+
+    Returns:
+        list: (module, self microseconds, cumulative microseconds, nesting level) tuples
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        level = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        imports.append((name.strip(), int(fields[0]), int(fields[1]), level))
+    return imports
+
+def measure_startup(url, flag):
+    """
+    Run the dashboard once with import tracing
+
+    Args:
+        url: Jenkins URL
+        flag: Display option, such as "--queue"
+
+    Returns:
+        dict: total import time (ms), imports, loaded collector/display modules and exit code
+    """
+    command = [sys.executable, "-X", "importtime", DASHBOARD, url, "bench", "bench", flag, "--no-cache"]
+    process = subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                             stderr=subprocess.PIPE, cwd=ROOT_DIR, text=True)
+
+    imports = parse_importtime(process.stderr)
+    top_level = [item for item in imports if item[3] == 0]
+    return {
+        'exit_code': process.returncode,
+        'import_ms': sum(cumulative for _, _, cumulative, _ in top_level) / 1000,
+        'top_imports': sorted(top_level, key=lambda item: item[2], reverse=True)[:TOP_IMPORTS],
+        'loaded_modules': sorted(name for name, _, _, _ in imports
+                                 if name.startswith(('collectors.', 'displays.')))
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the import time of a single-option dashboard run")
+    parser.add_argument("--flag", default="queue",
+                        help="Display option to run, without the leading dashes (default: queue)")
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS, metavar="MS",
+                        help=f"Import time budget in milliseconds (default: {DEFAULT_TARGET_MS})")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, metavar="N",
+                        help=f"Runs to make; the fastest one is reported (default: {DEFAULT_REPEAT})")
+    args = parser.parse_args()
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    jenkins = MockJenkins(Scale(jobs=50, nodes=5))
+    url = jenkins.start()
+    try:
+        runs = [measure_startup(url, f"--{args.flag.lstrip('-')}") for _ in range(args.repeat)]
+    finally:
+        jenkins.stop()
+
+    failed = [run for run in runs if run['exit_code']]
+    if failed:
+        print(f"Dashboard run failed with exit code {failed[0]['exit_code']}")
+        sys.exit(2)
+
+    best = min(runs, key=lambda run: run['import_ms'])
+    print(f"Import time for --{args.flag.lstrip('-')}: {best['import_ms']:.1f} ms "
+          f"(fastest of {args.repeat}; target {args.target_ms:.0f} ms)")
+    print("\nMost expensive top-level imports:")
+    for name, _, cumulative, _ in best['top_imports']:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+    print("\nCollector and display modules loaded:")
+    for name in best['loaded_modules']:
+        print(f"  {name}")
+
+    if best['import_ms'] > args.target_ms:
+        print(f"\nOver target by {best['import_ms'] - args.target_ms:.1f} ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,104 @@ This module provides a base class for all data collectors.
 """
 
 import requests
-import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from utils.config_scanner import ConfigScanner, default_analyzers
+from utils.config_page import ConfigPage
+from utils.profiler import trace_request
+from utils.records import BuildRecord
+from utils.system_info import parse_system_info
+
+# Union of the computer/api/json fields needed by every node-related collector.
+# All of them read the same snapshot, so add fields here rather than issuing
+# a separate request with a different depth or tree.
+NODES_SNAPSHOT_TREE = (
+    "totalExecutors,busyExecutors,"
+    "computer[_class,displayName,description,offline,temporarilyOffline,connectTime,"
+    "numExecutors,labelString,assignedLabels[name],monitorData[*[*]],"
+    "executors[idle,progress,currentExecutable[number,url,displayName]]]"
+)
+
+# Union of the job fields needed by every job-related collector, requested for
+# jobs at every folder level of the shared jobs snapshot
+JOBS_SNAPSHOT_FIELDS = (
+    "_class,name,fullName,url,color,buildable,inQueue,firstBuild[number],"
+    "lastBuild[number,timestamp,result,duration]"
+)
+
+# Folder levels expanded in a single tree request. Folders nested deeper are
+# fetched separately, several at a time.
+JOB_TREE_DEPTH = 4
+FOLDER_FETCH_WORKERS = 8
+
+# Build fields shared by every build history analysis, the number of recent
+# builds kept per job, and the number of builds allowed in one response
+BUILD_HISTORY_FIELDS = "number,result,timestamp,duration"
+BUILD_HISTORY_LIMIT = 100
+BUILDS_PER_REQUEST = 5000
+
+# Snapshot key of the shared build history
+BUILD_HISTORY_SNAPSHOT = ("builds", BUILD_HISTORY_FIELDS, BUILD_HISTORY_LIMIT)
+
+# With a local build store, analyses see every recorded build from this many
+# days back, and builds older than the retention period are dropped
+BUILD_HISTORY_WINDOW_DAYS = 31
+BUILD_STORE_RETENTION_DAYS = 90
+
+# Most builds fetched for a recorded job that has had more than
+# BUILD_HISTORY_LIMIT builds since the last run; older ones are recorded as a gap
+BUILD_BACKFILL_LIMIT = 1000
+
+# Build limits are rounded up to one of these steps, so that a folder is
+# queried at a few depths only rather than at the largest limit of its jobs
+BUILD_LIMIT_STEPS = (10, BUILD_HISTORY_LIMIT, BUILD_BACKFILL_LIMIT)
+
+# Only the end of a console log is read when looking for failure causes
+CONSOLE_TAIL_BYTES = 1024 * 1024
+CONSOLE_CHUNK_SIZE = 64 * 1024
+
+# Worker threads behind each fetch_many fan-out; the number of requests in
+# flight across all collectors is bounded by the client's fetch semaphore
+FAN_OUT_WORKERS = 16
+
+def build_jobs_tree(fields, depth=JOB_TREE_DEPTH):
+    """
+    Build a tree expression that expands folders to a fixed depth
+
+    The innermost level only asks for child URLs, which is enough to tell
+    whether a folder at the depth limit still has contents to fetch.
+
+    Args:
+        fields: Comma-separated fields to request for each job
+        depth: Number of folder levels to expand
+
+    Returns:
+        str: Tree expression such as "jobs[name,url,jobs[name,url,jobs[url]]]"
+    """
+    tree = "jobs[url]"
+    for _ in range(depth):
+        tree = f"jobs[{fields},{tree}]"
+    return tree
+
+def job_config_signature(job):
+    """
+    Get a cheap signal of whether a job may have changed
+
+    Jenkins exposes no modification time for job configurations, so the
+    last build number from the jobs snapshot stands in for it: most
+    configuration changes are followed by a build.
+
+    Args:
+        job: Job dictionary from the jobs snapshot
+
+    Returns:
+        str: Signature to compare with the one stored with the config
+    """
+    return f"lastBuild:{(job.get('lastBuild') or {}).get('number')}"
 
 class BaseCollector:
     """Base class for all Jenkins data collectors"""
@@ -35,14 +131,7 @@ class BaseCollector:
             dict: JSON response or error dictionary
         """
         try:
-            # Build URL
-            if endpoint.startswith('http'):
-                url = endpoint
-            else:
-                # Add leading slash if missing
-                if not endpoint.startswith('/'):
-                    endpoint = f"/{endpoint}"
-                url = f"{self.url.rstrip('/')}{endpoint}"
+            url = self._endpoint_url(endpoint)
 
             # Add depth parameter if specified
             if params is None:
@@ -50,62 +139,828 @@ class BaseCollector:
             if depth > 0 and 'depth' not in params:
                 params['depth'] = depth
 
-            # Make the request
-            response = self.session.get(url, params=params)
+            with trace_request(self.client, type(self).__name__, url, params) as span:
+                # Make the request (rarely changing pages may come from the HTTP cache)
+                response = self.client.cached_get(url, params=params)
+                span.set_response(response)
 
-            # Handle response
-            if response.status_code == 200:
-                if 'application/json' in response.headers.get('Content-Type', ''):
-                    return response.json()
-                return {"content": response.text, "html": True}
-            else:
-                return {"error": f"Failed with status code: {response.status_code}"}
+                # Handle response
+                if response.status_code == 200:
+                    if 'application/json' in response.headers.get('Content-Type', ''):
+                        return span.decode_json(response)
+                    return {"content": response.text, "html": True}
+                else:
+                    return {"error": f"Failed with status code: {response.status_code}"}
 
         except requests.exceptions.RequestException as e:
             return {"error": f"Connection error: {str(e)}"}
         except Exception as e:
             return {"error": f"Error: {str(e)}"}
 
-    def extract_property(self, html, key):
+    def fetch_response(self, endpoint, params=None, headers=None):
         """
-        Extract a property from HTML content
+        Fetch an endpoint and return the response itself, for callers that
+        need its headers or status rather than its decoded body
 
         Args:
-            html: HTML content
-            key: Property key to extract
+            endpoint: API endpoint (relative to Jenkins URL) or full URL
+            params: Query parameters
+            headers: Extra request headers, such as conditional request validators
 
         Returns:
-            str: Property value or 'Unknown'
+            Response (or cached equivalent), or error dictionary if the request failed
         """
         try:
-            # Find the property in the page
-            if key not in html:
-                return "Unknown"
-
-            patterns = [
-                f"{key}</td><td[^>]*>(.*?)</td>",
-                f"{key}:</td><td[^>]*>(.*?)</td>",
-                f"{key}:(.*?)<",
-            ]
-
-            for pattern in patterns:
-                match = re.search(pattern, html, re.DOTALL)
-                if match:
-                    value = match.group(1).strip()
-                    # Clean up HTML tags
-                    value = re.sub(r'<[^>]+>', '', value)
-
-                    # Clean up "Hidden value" text
-                    if "Hidden value, click to show this value" in value:
-                        parts = value.split("Hidden value, click to show this value")
-                        if len(parts) > 1 and parts[1].strip():
-                            return parts[1].strip()
-
-                    return value
+            url = self._endpoint_url(endpoint)
+            with trace_request(self.client, type(self).__name__, url, params) as span:
+                response = self.client.cached_get(url, params=params, headers=headers)
+                span.set_response(response)
+            return response
 
-            return "Unknown"
-        except Exception:
-            return "Unknown"
+        except requests.exceptions.RequestException as e:
+            return {"error": f"Connection error: {str(e)}"}
+        except Exception as e:
+            return {"error": f"Error: {str(e)}"}
+
+    def fetch_jenkins_version(self):
+        """
+        Get the Jenkins version without downloading a page for it
+
+        Returns:
+            str: Version from the X-Jenkins header seen at login, or from that
+                 of a minimal API request if the client did not log in; 'Unknown'
+                 if neither is available
+        """
+        version = getattr(self.client, 'version', None)
+        if version:
+            return version
+
+        response = self.fetch_response("api/json", params={"tree": "mode"})
+        if isinstance(response, dict):
+            return 'Unknown'
+        return response.headers.get('X-Jenkins', 'Unknown')
+
+    def fetch_root_headers(self):
+        """
+        Fetch the response headers of the Jenkins root page once per run
+
+        Returns:
+            dict: {"headers": case-insensitive header mapping} or error dictionary
+        """
+        def fetch():
+            response = self.fetch_response(self.url)
+            if isinstance(response, dict):
+                return response
+            return {"headers": response.headers}
+
+        return self._get_snapshot(("root_headers",), fetch)
+
+    def _endpoint_url(self, endpoint):
+        """Build the full URL of an endpoint relative to the Jenkins URL"""
+        if endpoint.startswith('http'):
+            return endpoint
+        # Add leading slash if missing
+        if not endpoint.startswith('/'):
+            endpoint = f"/{endpoint}"
+        return f"{self.url.rstrip('/')}{endpoint}"
+
+    async def afetch(self, endpoint, params=None, depth=0):
+        """
+        Async equivalent of fetch_jenkins_data
+
+        The request runs on the pooled session in the event loop's executor
+        while holding the client's fetch semaphore, which caps the number of
+        concurrent requests across all collectors.
+
+        Args:
+            endpoint: API endpoint (relative to Jenkins URL)
+            params: Query parameters
+            depth: API depth parameter
+
+        Returns:
+            dict: JSON response or error dictionary
+        """
+        params = dict(params) if params else None
+        return await self._run_limited(partial(self.fetch_jenkins_data, endpoint, params=params, depth=depth))
+
+    async def _run_limited(self, func):
+        """Run a blocking fetch in the loop's executor under the client's fetch semaphore"""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._call_limited, func)
+
+    def _call_limited(self, func):
+        with self.client.fetch_semaphore:
+            return func()
+
+    def _gather(self, coroutines):
+        """
+        Run coroutines concurrently on a fresh event loop
+
+        Args:
+            coroutines: List of coroutine objects
+
+        Returns:
+            list: Their results, in order
+        """
+        if not coroutines:
+            return []
+
+        # asyncio is only needed for fan-outs, which many single-section runs never make
+        import asyncio
+
+        async def fan_out():
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=min(FAN_OUT_WORKERS, len(coroutines))))
+            return await asyncio.gather(*coroutines)
+
+        return asyncio.run(fan_out())
+
+    def fetch_many(self, endpoints, params=None, depth=0):
+        """
+        Fetch many endpoints concurrently
+
+        Args:
+            endpoints: API endpoints or full URLs
+            params: Query parameters used for every request
+            depth: API depth parameter
+
+        Returns:
+            list: Responses (JSON or error dictionaries) in the order of endpoints
+        """
+        return self._gather([self.afetch(endpoint, params, depth) for endpoint in endpoints])
+
+    def fetch_job_config(self, job_url, signature=None):
+        """
+        Fetch a job's config.xml
+
+        With a local config store, every downloaded config is recorded there
+        with the job's signature. A stored copy is reused without a request
+        while the signature is unchanged and the copy is recent (see
+        utils.config_store.CONFIG_MAX_AGE); copies that came with validators
+        are otherwise revalidated with a conditional request.
+
+        Args:
+            job_url: URL of the job (ending with a slash)
+            signature: Change signature of the job (see job_config_signature),
+                       or None to always ask Jenkins
+
+        Returns:
+            dict: {"content": config text, "html": True} or error dictionary
+        """
+        return self._fetch_config(f"{job_url}config.xml", signature)
+
+    def iter_job_configs(self, jobs):
+        """
+        Fetch the config.xml of many jobs concurrently, yielding each as it arrives
+
+        Configs are yielded in the order of jobs. At most 2 * FAN_OUT_WORKERS
+        fetches run ahead of the caller, so only that many configs are held
+        in memory at a time, whatever the number of jobs.
+
+        Args:
+            jobs: Job dictionaries with a 'url' key
+
+        Yields:
+            tuple: (job, response) pairs
+        """
+        jobs = [job for job in jobs if job.get('url')]
+        if not jobs:
+            return
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=min(FAN_OUT_WORKERS, len(jobs))) as pool:
+            for job in jobs:
+                if len(pending) >= 2 * FAN_OUT_WORKERS:
+                    done_job, future = pending.popleft()
+                    yield done_job, future.result()
+                future = pool.submit(self._call_limited, partial(self.fetch_job_config, job['url'],
+                                                                 job_config_signature(job)))
+                pending.append((job, future))
+
+            while pending:
+                done_job, future = pending.popleft()
+                yield done_job, future.result()
+
+    def fetch_config_analysis(self):
+        """
+        Analyze every job's config.xml once per run
+
+        Each config is parsed a single time, as soon as it has been
+        downloaded, and handed to all analyzers (tools, notifications, labels
+        and SCM); only the analyzers' results are kept, and the combined
+        result is shared between collectors.
+
+        Returns:
+            dict: 'jobs_checked' plus the result of each analyzer keyed by
+                  its name, or error dictionary
+        """
+        return self._get_snapshot(("config_analysis",), self._analyze_job_configs)
+
+    def _analyze_job_configs(self):
+        """
+        Scan all job configs with the default analyzers
+
+        Returns:
+            dict: Analysis results or error dictionary
+        """
+        response = self.fetch_jobs_snapshot()
+        if "error" in response:
+            return response
+
+        scanner = ConfigScanner(default_analyzers())
+        for job, config in self.iter_job_configs(response.get('jobs', [])):
+            if "error" in config or "html" not in config:
+                continue
+            scanner.scan(job.get('fullName', job.get('name', 'Unknown')), config["content"])
+
+        results = scanner.results()
+        results['jobs_checked'] = scanner.jobs_scanned
+        return results
+
+    def _fetch_config(self, url, signature=None):
+        """
+        Get a config.xml from the local store or download it
+
+        Args:
+            url: config.xml URL
+            signature: Change signature of the job, or None if unknown
+
+        Returns:
+            dict: {"content": config text, "html": True} or error dictionary
+        """
+        store = getattr(self.client, 'config_store', None)
+        if store is None:
+            return self.fetch_jenkins_data(url)
+
+        try:
+            content = store.get_current(url, signature)
+            if content is not None:
+                return {"content": content, "html": True}
+
+            stored = store.get(url)
+            headers = {}
+            if stored:
+                etag, last_modified = stored[0], stored[1]
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+
+            response = self.fetch_response(url, headers=headers or None)
+            if isinstance(response, dict):
+                return response
+
+            if response.status_code == 304 and stored:
+                store.put(url, stored[0], stored[1], stored[4], signature)
+                return {"content": stored[4], "html": True}
+            if response.status_code == 200:
+                store.put(url, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                          response.text, signature)
+                return {"content": response.text, "html": True}
+            return {"error": f"Failed with status code: {response.status_code}"}
+
+        except Exception as e:
+            return {"error": f"Error: {str(e)}"}
+
+    def stream_console_tail(self, build_url, max_bytes=CONSOLE_TAIL_BYTES):
+        """
+        Stream the last lines of a build's console log
+
+        The log is read through logText/progressiveText, which reports the
+        full log size in the X-Text-Size header. If the log is larger than
+        max_bytes, the first response is dropped before its body is read and
+        the log is requested again from size - max_bytes. Lines are yielded
+        as they arrive, so memory use does not depend on the log size.
+
+        Args:
+            build_url: URL of the build (ending with a slash)
+            max_bytes: Maximum number of bytes to read from the end of the log
+
+        Yields:
+            str: Log lines, without line endings
+        """
+        url = f"{build_url.rstrip('/')}/logText/progressiveText"
+        collector = type(self).__name__
+
+        # Each span stays open until its body has been streamed, so its
+        # duration and bytes include the download
+        with trace_request(self.client, collector, url, {"start": 0}) as span:
+            response = self.session.get(url, params={"start": 0}, stream=True)
+            span.set_response(response, read_body=False)
+            try:
+                if response.status_code != 200:
+                    return
+
+                size = int(response.headers.get('X-Text-Size') or 0)
+                if size <= max_bytes:
+                    yield from self._iter_log_lines(response, span)
+                    return
+            finally:
+                response.close()
+
+        start = size - max_bytes
+        with trace_request(self.client, collector, url, {"start": start}) as span:
+            response = self.session.get(url, params={"start": start}, stream=True)
+            span.set_response(response, read_body=False)
+            try:
+                if response.status_code != 200:
+                    return
+
+                lines = self._iter_log_lines(response, span)
+                # The tail most likely starts in the middle of a line
+                next(lines, None)
+                yield from lines
+            finally:
+                response.close()
+
+    def _iter_log_lines(self, response, span):
+        """
+        Read the lines of a streamed log response, counting their bytes on its span
+
+        Args:
+            response: Streamed requests response
+            span: RequestSpan of the request
+
+        Yields:
+            str: Log lines, without line endings
+        """
+        if response.encoding is None:
+            response.encoding = 'utf-8'
+
+        for line in response.iter_lines(chunk_size=CONSOLE_CHUNK_SIZE, decode_unicode=True):
+            span.add_bytes(len(line) + 1)
+            yield line
+
+    def fetch_snapshot(self, endpoint, params=None):
+        """
+        Fetch data once per run and share the parsed response between collectors
+
+        The response is stored on the client, so every collector created from the
+        same client gets the same object. Callers must treat it as read-only.
+        Errors are not cached. Safe to call from several threads at once.
+
+        Args:
+            endpoint: API endpoint (relative to Jenkins URL)
+            params: Query parameters
+
+        Returns:
+            dict: JSON response or error dictionary
+        """
+        params = dict(params or {})
+        key = (endpoint, tuple(sorted(params.items())))
+        return self._get_snapshot(key, lambda: self.fetch_jenkins_data(endpoint, params=params))
+
+    def _get_snapshot(self, key, fetch):
+        """
+        Return the cached snapshot for key, fetching it if needed
+
+        Args:
+            key: Snapshot cache key
+            fetch: Callable returning the response to cache
+
+        Returns:
+            dict: Cached response or error dictionary
+        """
+        # One lock per snapshot so concurrent collectors wait for a single fetch
+        with self.client.snapshot_lock:
+            key_lock = self.client.snapshot_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            snapshots = self.client.snapshots
+            if key not in snapshots:
+                response = fetch()
+                if "error" in response:
+                    return response
+                snapshots[key] = response
+
+            return snapshots[key]
+
+    def fetch_config_page(self, endpoint):
+        """
+        Fetch a configuration page once per run and share its parsed form
+
+        Args:
+            endpoint: Page endpoint, such as "configure" or "manage/configureSecurity/"
+
+        Returns:
+            dict: {"page": ConfigPage} or error dictionary
+        """
+        def fetch():
+            response = self.fetch_jenkins_data(endpoint)
+            if "error" in response:
+                return response
+            if "content" not in response:
+                return {"error": f"Unexpected response for {endpoint}"}
+            return {"page": ConfigPage(response["content"])}
+
+        return self._get_snapshot(("page", endpoint), fetch)
+
+    def fetch_system_info(self, node=None):
+        """
+        Fetch a systemInfo page once per run and share its parsed properties
+
+        Args:
+            node: Agent name, or None for the controller
+
+        Returns:
+            dict: {"properties": dict} or error dictionary
+        """
+        endpoint = f"computer/{node}/systemInfo" if node else "systemInfo"
+
+        def fetch():
+            response = self.fetch_jenkins_data(endpoint)
+            if "error" in response:
+                return response
+            if "content" not in response:
+                return {"error": f"Unexpected response for {endpoint}"}
+            return {"properties": parse_system_info(response["content"])}
+
+        return self._get_snapshot(("systemInfo", endpoint), fetch)
+
+    def fetch_nodes_snapshot(self):
+        """
+        Fetch the shared computer/api/json snapshot used by all node collectors
+
+        Returns:
+            dict: JSON response or error dictionary
+        """
+        return self.fetch_snapshot("computer/api/json", params={"tree": NODES_SNAPSHOT_TREE})
+
+    def fetch_all_jobs(self, fields, depth=JOB_TREE_DEPTH):
+        """
+        Fetch every job on the controller, including jobs inside folders
+
+        Folders and multibranch projects are expanded with nested tree
+        expressions, so most controllers need a single request. Folders nested
+        deeper than the tree depth are fetched concurrently, one request each.
+
+        Args:
+            fields: Comma-separated fields to request for each job (must include url)
+            depth: Number of folder levels to expand per request
+
+        Returns:
+            dict: {'jobs': [...], 'folders': [...]} as flat lists of job
+                  dictionaries, or an error dictionary
+        """
+        tree = build_jobs_tree(fields, depth)
+        response = self.fetch_jenkins_data("api/json", params={"tree": tree})
+        if "error" in response:
+            return response
+
+        jobs = []
+        folders = []
+        pending = self._flatten_jobs(response.get('jobs', []), depth, jobs, folders)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=FOLDER_FETCH_WORKERS) as pool:
+                while pending:
+                    responses = pool.map(
+                        lambda folder: self.fetch_jenkins_data(f"{folder.get('url', '')}api/json",
+                                                               params={"tree": tree}),
+                        pending
+                    )
+
+                    pending = []
+                    for folder_response in responses:
+                        # Skip folders we cannot read and keep what we have
+                        if "error" in folder_response:
+                            continue
+                        pending.extend(self._flatten_jobs(folder_response.get('jobs', []), depth, jobs, folders))
+
+        return {
+            'jobs': jobs,
+            'folders': folders
+        }
+
+    def _flatten_jobs(self, items, depth, jobs, folders):
+        """
+        Flatten one tree response into job and folder lists
+
+        Args:
+            items: 'jobs' array of a tree response
+            depth: Number of folder levels expanded in the response
+            jobs: List that receives jobs in display order
+            folders: List that receives folders
+
+        Returns:
+            list: Folders at the depth limit whose contents still need fetching
+        """
+        truncated = []
+        stack = [(item, 1) for item in reversed(items)]
+
+        while stack:
+            job, level = stack.pop()
+            if not isinstance(job, dict):
+                continue
+
+            # Only items that can contain jobs have a 'jobs' property
+            children = job.get('jobs')
+            if children is None:
+                jobs.append(job)
+                continue
+
+            folders.append(job)
+            if level < depth:
+                stack.extend((child, level + 1) for child in reversed(children))
+            elif children and job.get('url'):
+                truncated.append(job)
+
+        return truncated
+
+    def fetch_jobs_snapshot(self):
+        """
+        Fetch the shared job tree used by all job collectors
+
+        Returns:
+            dict: {'jobs': [...], 'folders': [...]} or error dictionary
+        """
+        return self._get_snapshot(("jobs", JOBS_SNAPSHOT_FIELDS),
+                                  lambda: self.fetch_all_jobs(JOBS_SNAPSHOT_FIELDS))
+
+    def fetch_build_history(self, jobs, limit=BUILD_HISTORY_LIMIT, limits=None):
+        """
+        Fetch recent builds for many jobs with a few nested tree queries
+
+        Jobs are grouped by the folder that contains them and by their limit,
+        rounded up to one of BUILD_LIMIT_STEPS, and each group is queried with
+        jobs[url,builds[...]{0,limit}] on its folder. Large folders are split
+        into slices of jobs so that no response holds more than about
+        BUILDS_PER_REQUEST builds. A folder query returns builds for every
+        item of the folder, so a group that has no more jobs than the folder
+        needs slices is queried job by job instead. All requests are made
+        concurrently.
+
+        Args:
+            jobs: Job dictionaries with a 'url' key
+            limit: Maximum number of recent builds per job
+            limits: Optional mapping of job URL to its own limit
+
+        Returns:
+            dict: Mapping of job URL to its BuildRecords, newest first
+        """
+        limits = limits or {}
+
+        wanted = {}
+        groups = {}
+        for job in jobs:
+            job_url = job.get('url')
+            if job_url:
+                wanted[job_url] = limits.get(job_url, limit)
+                step = next((step for step in BUILD_LIMIT_STEPS if step >= wanted[job_url]), wanted[job_url])
+                groups.setdefault((self._parent_url(job_url), step), []).append(job_url)
+
+        # Count the items of every folder (positions include sibling folders)
+        folder_sizes = {parent: 0 for parent, _ in groups}
+        snapshot = self.fetch_jobs_snapshot()
+        if "error" not in snapshot:
+            for item in snapshot.get('jobs', []) + snapshot.get('folders', []):
+                parent = self._parent_url(item.get('url', ''))
+                if parent in folder_sizes:
+                    folder_sizes[parent] += 1
+
+        # (URL queried, tree, step, whether the URL is the folder of the jobs)
+        requests_to_make = []
+        job_steps = {}
+        for (parent, step), job_urls in groups.items():
+            job_steps.update((job_url, step) for job_url in job_urls)
+            size = folder_sizes[parent]
+            slice_size = max(1, BUILDS_PER_REQUEST // max(1, step))
+
+            if len(job_urls) <= size // slice_size:
+                tree = self._build_history_tree(step, folder=False)
+                requests_to_make.extend((job_url, tree, step, False) for job_url in job_urls)
+                continue
+
+            tree = self._build_history_tree(step)
+            for start in range(0, max(size, 1), slice_size):
+                # Leave the last slice open so jobs added since the listing are included
+                end = start + slice_size if start + slice_size < size else ""
+                requests_to_make.append((parent, f"{tree}{{{start},{end}}}", step, True))
+
+        history = {}
+        with ThreadPoolExecutor(max_workers=FOLDER_FETCH_WORKERS) as pool:
+            responses = pool.map(
+                lambda request: self.fetch_jenkins_data(f"{request[0]}api/json", params={"tree": request[1]}),
+                requests_to_make
+            )
+
+            for (url, _, step, folder), response in zip(requests_to_make, responses):
+                # Skip requests we cannot read; their jobs simply have no history
+                if "error" in response:
+                    continue
+                items = response.get('jobs', []) if folder else [dict(response, url=url)]
+                for job in items:
+                    # Folder queries also return the jobs of other groups
+                    if not isinstance(job, dict) or job_steps.get(job.get('url')) != step:
+                        continue
+                    builds = job.get('builds') or job.get('allBuilds') or []
+                    history[job['url']] = [BuildRecord.from_api(build) for build in builds
+                                           if isinstance(build, dict)][:wanted[job['url']]]
+
+        return history
+
+    def _build_history_tree(self, limit, folder=True):
+        """
+        Build the tree expression asking for recent builds
+
+        Args:
+            limit: Maximum number of recent builds per job
+            folder: Whether the expression is for a folder's jobs rather than a single job
+
+        Returns:
+            str: Tree expression
+        """
+        # Jenkins caps 'builds' at 100 entries; 'allBuilds' can go further
+        builds_field = "builds" if limit <= 100 else "allBuilds"
+        fields = f"url,{builds_field}[{BUILD_HISTORY_FIELDS}]{{0,{limit}}}"
+        return f"jobs[{fields}]" if folder else fields
+
+    def fetch_build_history_snapshot(self):
+        """
+        Fetch the shared build history of every job that has been built
+
+        Returns:
+            dict: {'builds': {job_url: [builds]}, 'gaps': {job_url: [(first, last)]}}
+                  or error dictionary; 'gaps' is only set with a local build store
+        """
+        def fetch():
+            jobs_response = self.fetch_jobs_snapshot()
+            if "error" in jobs_response:
+                return jobs_response
+
+            built_jobs = [job for job in jobs_response.get('jobs', []) if job.get('lastBuild')]
+
+            store = getattr(self.client, 'build_store', None)
+            if store is None:
+                return {'builds': self.fetch_build_history(built_jobs)}
+            return self._sync_build_store(store, built_jobs)
+
+        return self._get_snapshot(BUILD_HISTORY_SNAPSHOT, fetch)
+
+    def fetch_recent_builds(self, jobs, limit):
+        """
+        Fetch the last builds of a few jobs
+
+        The shared build history is used if another section has already
+        fetched it; otherwise only the given jobs are queried, rather than
+        fetching the history of every job.
+
+        Args:
+            jobs: Job dictionaries with a 'url' key
+            limit: Maximum number of recent builds per job (at most BUILD_HISTORY_LIMIT)
+
+        Returns:
+            dict: Mapping of job URL to its BuildRecords, newest first
+        """
+        history = self.client.snapshots.get(BUILD_HISTORY_SNAPSHOT)
+        if history is None:
+            return self.fetch_build_history(jobs, limit=limit)
+
+        builds = history.get('builds', {})
+        return {job['url']: builds.get(job['url'], [])[:limit] for job in jobs if job.get('url')}
+
+    def _sync_build_store(self, store, jobs):
+        """
+        Fetch only builds newer than those in the local store, then read history from it
+
+        Args:
+            store: BuildHistoryStore instance
+            jobs: Job dictionaries with url, fullName and lastBuild
+
+        Returns:
+            dict: 'builds' (mapping of job URL to its recorded builds, newest
+                  first) and 'gaps' (mapping of job URL to the build number
+                  ranges missing from its history)
+        """
+        names = {job['url']: job.get('fullName', job.get('name', job['url']))
+                 for job in jobs if job.get('url')}
+        recorded = store.get_last_numbers(self.url)
+
+        # Ask each job for as many builds as it has had since the last run
+        limits = {}
+        for job in jobs:
+            job_url = job.get('url')
+            if not job_url:
+                continue
+            name = names[job_url]
+            last_number = (job.get('lastBuild') or {}).get('number') or 0
+
+            # A lower build number than recorded means the job was recreated or renumbered
+            if last_number < recorded.get(name, 0):
+                store.reset_job(self.url, name)
+                recorded.pop(name)
+
+            new_builds = last_number - recorded.get(name, 0)
+            if new_builds > 0:
+                # Jobs seen before get the builds they missed, up to a backfill limit
+                limit = BUILD_BACKFILL_LIMIT if name in recorded else BUILD_HISTORY_LIMIT
+                limits[job_url] = min(new_builds, limit)
+
+        if limits:
+            changed_jobs = [job for job in jobs if job.get('url') in limits]
+            fetched = self.fetch_build_history(changed_jobs, limits=limits)
+            for job_url, builds in fetched.items():
+                name = names[job_url]
+                store.add_builds(self.url, name, builds)
+
+                # Record builds between the last recorded one and the oldest fetched one
+                numbered = [build for build in builds if isinstance(build.number, int)]
+                if name in recorded and numbered:
+                    oldest = min(numbered, key=lambda build: build.number)
+                    if oldest.number - 1 > recorded[name]:
+                        store.add_gap(self.url, name, recorded[name] + 1, oldest.number - 1, oldest.timestamp)
+
+        now = time.time() * 1000
+        store.prune(self.url, now - BUILD_STORE_RETENTION_DAYS * 24 * 60 * 60 * 1000, keep=BUILD_HISTORY_LIMIT)
+
+        since = now - BUILD_HISTORY_WINDOW_DAYS * 24 * 60 * 60 * 1000
+        gaps = store.get_gaps(self.url)
+        return {
+            'builds': {
+                job_url: store.get_builds(self.url, name, since=since, min_count=BUILD_HISTORY_LIMIT)
+                for job_url, name in names.items()
+            },
+            'gaps': {job_url: gaps[name] for job_url, name in names.items() if name in gaps}
+        }
+
+    def _parent_url(self, job_url):
+        """
+        Get the URL of the folder (or Jenkins root) containing a job
+
+        Args:
+            job_url: Absolute job URL ending in /job/<name>/
+
+        Returns:
+            str: Parent URL with trailing slash
+        """
+        head, separator, _ = job_url.rstrip('/').rpartition('/job/')
+        return f"{head}/" if separator else self.url
+
+    def _count_job_types(self, jobs):
+        """
+        Count job types
+
+        Args:
+            jobs: List of jobs and folders that include _class
+
+        Returns:
+            dict: Number of jobs per human-readable type
+        """
+        job_types = {}
+
+        for job in jobs:
+            job_class = job.get('_class')
+            if job_class:
+                job_type = self._map_job_class_to_type(job_class.split('.')[-1])
+                job_types[job_type] = job_types.get(job_type, 0) + 1
+
+        return job_types
+
+    def _map_job_class_to_type(self, class_name):
+        """
+        Map Jenkins job class to human-readable type
+
+        Args:
+            class_name: Jenkins job class name
+
+        Returns:
+            str: Human-readable job type
+        """
+        type_map = {
+            'FreeStyleProject': 'Freestyle',
+            'WorkflowJob': 'Pipeline',
+            'WorkflowMultiBranchProject': 'Multi-branch Pipeline',
+            'ExternalJob': 'External',
+            'MatrixProject': 'Matrix',
+            'MavenModuleSet': 'Maven',
+            'IvyModuleSet': 'Ivy',
+            'MultiJobProject': 'Multi-job',
+            'OrganizationFolder': 'Organization Folder'
+        }
+
+        # Check for partial matches
+        for key, value in type_map.items():
+            if key in class_name:
+                return value
+
+        return class_name  # Return the original class name if no mapping found
+
+    def extract_property(self, properties, key):
+        """
+        Look up a systemInfo property
+
+        Args:
+            properties: Parsed properties from fetch_system_info(), or raw
+                        systemInfo HTML (parsed on the spot)
+            key: Property key to extract
+
+        Returns:
+            str: Property value or 'Unknown'
+        """
+        if isinstance(properties, str):
+            properties = parse_system_info(properties)
+        return properties.get(key, "Unknown")
 
     def format_timestamp(self, timestamp):
         """
@@ -20,8 +20,8 @@ class JenkinsBuildArtifactsCollector(BaseCollector):
             dict: Build artifacts information
         """
         try:
-            # Get jobs with basic info
-            response = self.fetch_jenkins_data("api/json", params={"tree": "jobs[name,url,lastBuild[number]]"})
+            # Get all jobs, including those inside folders
+            response = self.fetch_jobs_snapshot()
             if "error" in response:
                 return response
 
@@ -30,19 +30,15 @@ class JenkinsBuildArtifactsCollector(BaseCollector):
             # Process artifacts
             artifacts_info = []
 
-            for job in jobs:
-                job_name = job.get('name', 'Unknown')
-                job_url = job.get('url', '')
+            # Get the last build of every built job concurrently
+            built_jobs = [job for job in jobs if job.get('lastBuild')]
+            last_builds = self.fetch_many((f"{job.get('url', '')}lastBuild/api/json" for job in built_jobs),
+                                          params={"tree": "number,artifacts[*],timestamp"})
 
-                # Skip jobs with no builds
-                if not job.get('lastBuild'):
-                    continue
+            for job, response in zip(built_jobs, last_builds):
+                job_name = job.get('fullName', job.get('name', 'Unknown'))
 
                 try:
-                    # Get last build with artifacts
-                    response = self.fetch_jenkins_data(f"{job_url}lastBuild/api/json",
-                                                   params={"tree": "number,artifacts[*],timestamp"})
-
                     if "error" in response:
                         continue
 
@@ -4,12 +4,51 @@ Jenkins Build Statistics Collector
 This module collects information about Jenkins build durations and frequencies.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
+
+import numpy as np
+
 from collectors.base_collector import BaseCollector
+from utils.build_table import BuildTable, PERCENTILES
+
+# Number of most recent builds of each job the duration statistics look at
+DURATION_BUILDS = 10
+
+# Days of builds per day kept in the frequency statistics
+DAILY_HISTOGRAM_DAYS = 30
 
 class JenkinsBuildStatsCollector(BaseCollector):
     """Collects statistics about Jenkins builds"""
 
+    def fetch_build_table(self):
+        """
+        Fetch the build history of every built job as a columnar table, once per run
+
+        Returns:
+            dict: {'table': BuildTable, 'gaps': {job_url: missing build number ranges}}
+                  or error dictionary
+        """
+        def fetch():
+            # Get all jobs, including those inside folders
+            response = self.fetch_jobs_snapshot()
+            if "error" in response:
+                return response
+
+            # Recent builds of every job, fetched once and shared with the failed jobs analysis
+            history = self.fetch_build_history_snapshot()
+            if "error" in history:
+                return history
+
+            # Jobs with no builds are skipped
+            built_jobs = [(job.get('url', ''), job.get('fullName', job.get('name', 'Unknown')))
+                          for job in response.get('jobs', []) if job.get('lastBuild')]
+            return {
+                'table': BuildTable.from_history(built_jobs, history.get('builds', {})),
+                'gaps': history.get('gaps', {})
+            }
+
+        return self._get_snapshot(("build_table",), fetch)
+
     def get_build_durations(self, limit=10):
         """
         Fetches information about jobs with longest build durations
@@ -21,86 +60,45 @@ class JenkinsBuildStatsCollector(BaseCollector):
             dict: Build duration information
         """
         try:
-            # Get jobs with basic info
-            response = self.fetch_jenkins_data("api/json", params={"tree": "jobs[name,url,lastBuild[number]]"})
+            response = self.fetch_build_table()
             if "error" in response:
                 return response
+            table = response['table']
 
-            jobs = response.get('jobs', [])
-
-            # Process job build durations
-            job_durations = []
-
-            for job in jobs:
-                job_name = job.get('name', 'Unknown')
-                job_url = job.get('url', '')
-
-                # Skip jobs with no builds
-                if not job.get('lastBuild'):
-                    continue
-
-                try:
-                    # Get build history
-                    response = self.fetch_jenkins_data(f"{job_url}api/json",
-                                                     params={"tree": "builds[number,duration,result,timestamp]{0,10}"})
-
-                    if "error" in response:
-                        continue
-
-                    builds = response.get('builds', [])
-
-                    if not builds:
-                        continue
-
-                    # Calculate build statistics
-                    durations = [build.get('duration', 0) for build in builds if build.get('duration', 0) > 0]
-
-                    if not durations:
-                        continue
+            # Average, shortest and longest of the last builds, and percentiles over all of them
+            stats = table.duration_stats(last=DURATION_BUILDS)
+            percentile_jobs, percentiles = table.duration_percentiles()
+            percentile_rows = np.full(len(table.job_names), -1, dtype=np.int64)
+            percentile_rows[percentile_jobs] = np.arange(len(percentile_jobs))
 
-                    avg_duration = sum(durations) / len(durations)
-                    min_duration = min(durations)
-                    max_duration = max(durations)
+            # Sort by average duration (descending), keeping job order for ties
+            order = np.argsort(-stats['avg'], kind='stable')[:limit]
 
-                    # Get latest build duration
-                    last_duration = builds[0].get('duration', 0) if builds else 0
-
-                    # Calculate trend (positive means getting longer)
-                    trend = 0
-                    if len(durations) > 1:
-                        # Use simple trend calculation - compare first half with second half
-                        half = len(durations) // 2
-                        first_half = durations[:half]
-                        second_half = durations[half:]
-
-                        if first_half and second_half:
-                            first_avg = sum(first_half) / len(first_half)
-                            second_avg = sum(second_half) / len(second_half)
-
-                            trend = ((second_avg - first_avg) / first_avg * 100) if first_avg > 0 else 0
-
-                    job_durations.append({
-                        'job_name': job_name,
-                        'avg_duration': avg_duration,
-                        'min_duration': min_duration,
-                        'max_duration': max_duration,
-                        'last_duration': last_duration,
-                        'trend': trend,
-                        'trend_direction': "up" if trend > 5 else "down" if trend < -5 else "stable"
-                    })
-                except Exception:
-                    # Skip on error and continue with other jobs
-                    continue
-
-            # Sort by average duration (descending)
-            job_durations.sort(key=lambda x: x['avg_duration'], reverse=True)
-
-            # Limit to requested number
-            job_durations = job_durations[:limit]
+            job_durations = []
+            for index in order.tolist():
+                job_id = int(stats['job_ids'][index])
+                trend = float(stats['trend'][index])
+                row = int(percentile_rows[job_id])
+
+                job_duration = {
+                    'job_name': table.job_names[job_id],
+                    'avg_duration': float(stats['avg'][index]),
+                    'min_duration': float(stats['min'][index]),
+                    'max_duration': float(stats['max'][index]),
+                    'last_duration': float(stats['last'][index]),
+                    'trend': trend,
+                    'trend_direction': "up" if trend > 5 else "down" if trend < -5 else "stable"
+                }
+                for percentile in PERCENTILES:
+                    job_duration[f'p{percentile}_duration'] = float(percentiles[percentile][row]) if row >= 0 else None
+                job_durations.append(job_duration)
 
             return {
                 'job_durations': job_durations,
-                'total_jobs_analyzed': len(job_durations)
+                'total_jobs_analyzed': len(job_durations),
+                'total_builds_analyzed': len(table),
+                'duration_percentiles': {f'p{percentile}': value
+                                         for percentile, value in table.overall_percentiles().items()}
             }
 
         except Exception as e:
@@ -117,83 +115,36 @@ class JenkinsBuildStatsCollector(BaseCollector):
             dict: Build frequency information
         """
         try:
-            # Get jobs with basic info
-            response = self.fetch_jenkins_data("api/json", params={"tree": "jobs[name,url,lastBuild[number]]"})
+            response = self.fetch_build_table()
             if "error" in response:
                 return response
+            table = response['table']
 
-            jobs = response.get('jobs', [])
-
-            # Get current time for period calculations
+            # Count builds by period (the last month when a local build store is used)
             now = datetime.now().timestamp() * 1000  # milliseconds
-            today = now - (24 * 60 * 60 * 1000)  # 24 hours ago
-            week_ago = now - (7 * 24 * 60 * 60 * 1000)  # 7 days ago
-            month_ago = now - (30 * 24 * 60 * 60 * 1000)  # 30 days ago
-
-            # Process job build frequencies
-            job_frequencies = []
-
-            for job in jobs:
-                job_name = job.get('name', 'Unknown')
-                job_url = job.get('url', '')
-
-                # Skip jobs with no builds
-                if not job.get('lastBuild'):
-                    continue
-
-                try:
-                    # Get build history with timestamps
-                    response = self.fetch_jenkins_data(f"{job_url}api/json",
-                                                    params={"tree": "builds[number,timestamp]{0,100}"})
-
-                    if "error" in response:
-                        continue
-
-                    builds = response.get('builds', [])
-
-                    if not builds:
-                        continue
-
-                    # Count builds by period
-                    total_builds = len(builds)
-                    builds_today = sum(1 for build in builds if build.get('timestamp', 0) >= today)
-                    builds_this_week = sum(1 for build in builds if build.get('timestamp', 0) >= week_ago)
-                    builds_this_month = sum(1 for build in builds if build.get('timestamp', 0) >= month_ago)
-
-                    # Calculate average builds per day
-                    if builds_this_month > 0:
-                        avg_builds_per_day = builds_this_month / 30
-                    else:
-                        # If no builds in the last month, use all-time average if available
-                        first_build_time = builds[-1].get('timestamp', now) if builds else now
-                        days_since_first_build = (now - first_build_time) / (24 * 60 * 60 * 1000)
-
-                        if days_since_first_build > 0:
-                            avg_builds_per_day = total_builds / days_since_first_build
-                        else:
-                            avg_builds_per_day = 0
-
-                    job_frequencies.append({
-                        'job_name': job_name,
-                        'total_builds': total_builds,
-                        'builds_today': builds_today,
-                        'builds_this_week': builds_this_week,
-                        'builds_this_month': builds_this_month,
-                        'avg_builds_per_day': avg_builds_per_day
-                    })
-                except Exception:
-                    # Skip on error and continue with other jobs
-                    continue
-
-            # Sort by builds today (descending)
-            job_frequencies.sort(key=lambda x: x['builds_today'], reverse=True)
-
-            # Limit to requested number
-            job_frequencies = job_frequencies[:limit]
+            stats = table.frequency_stats(now)
+
+            # Sort by builds today (descending), keeping job order for ties
+            built = np.flatnonzero(stats['total'] > 0)
+            order = built[np.argsort(-stats['today'][built], kind='stable')][:limit]
+
+            job_frequencies = [
+                {
+                    'job_name': table.job_names[job_id],
+                    'total_builds': int(stats['total'][job_id]),
+                    'builds_today': int(stats['today'][job_id]),
+                    'builds_this_week': int(stats['week'][job_id]),
+                    'builds_this_month': int(stats['month'][job_id]),
+                    'avg_builds_per_day': float(stats['avg_per_day'][job_id])
+                }
+                for job_id in order.tolist()
+            ]
 
             return {
                 'job_frequencies': job_frequencies,
-                'total_jobs_analyzed': len(job_frequencies)
+                'total_jobs_analyzed': len(job_frequencies),
+                'jobs_with_history_gaps': len(response.get('gaps', {})),
+                'daily_builds': table.daily_histogram(days=DAILY_HISTOGRAM_DAYS)
             }
 
         except Exception as e:
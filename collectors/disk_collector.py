@@ -18,7 +18,7 @@ class JenkinsDiskCollector(BaseCollector):
         """
         try:
             # Get disk space monitor data from nodes to estimate total disk usage
-            response = self.fetch_jenkins_data("computer/api/json", depth=2)
+            response = self.fetch_nodes_snapshot()
             if "error" in response:
                 return response
 
@@ -18,71 +18,53 @@ class JenkinsEmailCollector(BaseCollector):
             dict: Email settings information
         """
         try:
-            # Try to access email configuration page
-            response = self.fetch_jenkins_data("configure")
+            # The configure page is fetched and parsed once per run
+            response = self.fetch_config_page("configure")
             if "error" in response:
                 return {"error": "Could not access email configuration"}
 
-            html = response.get("content", "")
+            page = response["page"]
 
             # Check if email notification is enabled
             email_settings = {
-                'enabled': 'E-mail Notification' in html or 'Email Notification' in html,
-                'extended_email': 'Extended E-mail Notification' in html
+                'enabled': page.contains('E-mail Notification') or page.contains('Email Notification'),
+                'extended_email': page.contains('Extended E-mail Notification')
             }
 
-            # Try to extract SMTP server
-            smtp_server_match = re.search(r'SMTP Server"?.*?value="(.*?)"', html)
-            if smtp_server_match:
-                email_settings['smtp_server'] = smtp_server_match.group(1).strip()
-
-            # Try to extract default email suffix
-            suffix_match = re.search(r'[dD]efault [sS]uffix"?.*?value="(.*?)"', html)
-            if suffix_match:
-                email_settings['default_suffix'] = suffix_match.group(1).strip()
-
-            # Try to extract admin email address
-            admin_email_match = re.search(r'[aA]dmin [eE]-?mail [aA]ddress"?.*?value="(.*?)"', html)
-            if admin_email_match:
-                email_settings['admin_email'] = admin_email_match.group(1).strip()
-
-            # Try to extract reply-to address
-            reply_to_match = re.search(r'[rR]eply-?[tT]o [aA]ddress"?.*?value="(.*?)"', html)
-            if reply_to_match:
-                email_settings['reply_to'] = reply_to_match.group(1).strip()
+            # Look up the settings by their form labels
+            settings = [
+                ('smtp_server', ('SMTP Server',)),
+                ('default_suffix', ('Default user e-mail suffix', 'Default Suffix')),
+                ('admin_email', ('System Admin e-mail address', 'Admin e-mail address', 'Admin email address')),
+                ('reply_to', ('Reply-To Address', 'ReplyTo Address')),
+                ('smtp_port', ('SMTP Port',))
+            ]
+            for key, labels in settings:
+                value = page.value_after_label(*labels)
+                if value:
+                    email_settings[key] = value
 
             # Check for SMTP authentication
-            email_settings['smtp_auth'] = 'Use SMTP Authentication' in html
+            email_settings['smtp_auth'] = page.contains('Use SMTP Authentication')
 
             # Try to extract SMTP username if auth is enabled
             if email_settings['smtp_auth']:
-                username_match = re.search(r'User Name"?.*?value="(.*?)"', html)
-                if username_match:
-                    email_settings['smtp_username'] = username_match.group(1).strip()
-
-            # Try to extract SMTP port
-            port_match = re.search(r'SMTP Port"?.*?value="(.*?)"', html)
-            if port_match:
-                email_settings['smtp_port'] = port_match.group(1).strip()
+                username = page.value_after_label('User Name')
+                if username:
+                    email_settings['smtp_username'] = username
 
             # Try to get advanced settings for extended email
             if email_settings['extended_email']:
-                # Try to extract content type
-                content_type_match = re.search(r'Default Content Type"?.*?value="(.*?)"', html)
-                if content_type_match:
-                    email_settings['content_type'] = content_type_match.group(1).strip()
+                content_type = page.value_after_label('Default Content Type')
+                if content_type:
+                    email_settings['content_type'] = content_type
 
                 # Check for default triggers
-                email_settings['triggers'] = []
-
                 common_triggers = [
                     'Always', 'Success', 'Failure', 'Unstable', 'Fixed', 'Still Failing',
                     'Still Unstable', 'Regression', 'Improvement'
                 ]
-
-                for trigger in common_triggers:
-                    if f'"{trigger}"' in html or f"'{trigger}'" in html or f">{trigger}<" in html:
-                        email_settings['triggers'].append(trigger)
+                email_settings['triggers'] = [trigger for trigger in common_triggers if page.has_text(trigger)]
 
             # Try to get email notification test settings
             try:
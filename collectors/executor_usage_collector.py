@@ -18,7 +18,7 @@ class JenkinsExecutorUsageCollector(BaseCollector):
         """
         try:
             # Get nodes with executor information
-            response = self.fetch_jenkins_data("computer/api/json", depth=2)
+            response = self.fetch_nodes_snapshot()
             if "error" in response:
                 return response
 
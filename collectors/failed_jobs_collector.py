@@ -6,6 +6,21 @@ This module collects information about failing Jenkins jobs.
 
 from datetime import datetime
 from collectors.base_collector import BaseCollector
+from utils.log_scanner import LogPatternScanner
+
+# Common error patterns, most significant first
+FAILURE_SCANNER = LogPatternScanner([
+    "BUILD FAILURE",
+    "Compilation failure",
+    "Test failures",
+    "Error:",
+    "Exception:",
+    "NullPointerException",
+    "OutOfMemoryError",
+    "Connection refused",
+    "java.io.IOException",
+    "Timeout"
+])
 
 class JenkinsFailedJobsCollector(BaseCollector):
     """Collects information about failing Jenkins jobs"""
@@ -21,39 +36,28 @@ class JenkinsFailedJobsCollector(BaseCollector):
             dict: Failed jobs information
         """
         try:
-            # Get jobs with basic info
-            response = self.fetch_jenkins_data("api/json", params={"tree": "jobs[name,url,color,lastBuild[number,timestamp,result]]"})
+            # Get all jobs, including those inside folders
+            response = self.fetch_jobs_snapshot()
             if "error" in response:
                 return response
 
-            jobs = response.get('jobs', [])
+            # Failed or unstable jobs that have builds
+            failing_jobs = [job for job in response.get('jobs', [])
+                            if job.get('color', '') in ['red', 'red_anime', 'yellow', 'yellow_anime']
+                            and job.get('lastBuild')]
+
+            # Last 10 builds of each failing job
+            builds_by_job = self.fetch_recent_builds(failing_jobs, 10)
 
             # Filter for failed jobs
             failed_jobs = []
 
-            for job in jobs:
-                job_name = job.get('name', 'Unknown')
+            for job in failing_jobs:
+                job_name = job.get('fullName', job.get('name', 'Unknown'))
                 job_url = job.get('url', '')
-                color = job.get('color', '')
-
-                # Check if job is failed or unstable
-                if color not in ['red', 'red_anime', 'yellow', 'yellow_anime']:
-                    continue
-
-                # Skip jobs with no builds
-                last_build = job.get('lastBuild', {})
-                if not last_build:
-                    continue
 
                 try:
-                    # Get build history
-                    response = self.fetch_jenkins_data(f"{job_url}api/json",
-                                                   params={"tree": "builds[number,result,timestamp,duration]{0,10}"})
-
-                    if "error" in response:
-                        continue
-
-                    builds = response.get('builds', [])
+                    builds = builds_by_job.get(job_url, [])
 
                     if not builds:
                         continue
@@ -138,40 +142,15 @@ class JenkinsFailedJobsCollector(BaseCollector):
 
             build_number = failed_build.get('number')
 
-            # Get build log (truncated)
-            response = self.fetch_jenkins_data(f"{job_url}{build_number}/consoleText")
-            if "error" in response or "html" not in response:
+            # Scan the tail of the build log for the error patterns in one pass
+            line = FAILURE_SCANNER.scan(self.stream_console_tail(f"{job_url}{build_number}/"))
+            if line is None:
                 return "Unknown"
 
-            log = response["content"]
-
-            # Look for common error patterns
-            error_patterns = [
-                "BUILD FAILURE",
-                "Compilation failure",
-                "Test failures",
-                "Error:",
-                "Exception:",
-                "NullPointerException",
-                "OutOfMemoryError",
-                "Connection refused",
-                "java.io.IOException",
-                "Timeout"
-            ]
-
-            # Check for error patterns
-            for pattern in error_patterns:
-                if pattern in log:
-                    # Get the line containing the error
-                    lines = log.split('\n')
-                    for line in lines:
-                        if pattern in line:
-                            # Truncate to reasonable length
-                            if len(line) > 100:
-                                return line[:97] + "..."
-                            return line
-
-            return "Unknown"
+            # Truncate to reasonable length
+            if len(line) > 100:
+                return line[:97] + "..."
+            return line
 
         except Exception:
             return "Unknown"
@@ -4,7 +4,6 @@ Jenkins System Information Collector
 This module collects detailed Jenkins system information.
 """
 
-import re
 from datetime import datetime, timedelta
 from collectors.base_collector import BaseCollector
 
@@ -31,13 +30,13 @@ class JenkinsInfoCollector(BaseCollector):
                 info['useSecurity'] = response.get('useSecurity', False)
                 info['views'] = len(response.get('views', []))
 
-            # Get system info from About page (this contains more detailed information)
-            response = self.fetch_jenkins_data("systemInfo")
-            if "error" not in response and "html" in response:
-                html_content = response["content"]
+            # Get system info from the systemInfo page (parsed once per run and shared)
+            response = self.fetch_system_info()
+            if "error" not in response:
+                properties = response["properties"]
 
                 # Extract Jenkins version (in header if available)
-                info['version'] = self.session.get(f"{self.url}").headers.get('X-Jenkins', 'Unknown')
+                info['version'] = self.fetch_jenkins_version()
 
                 # Look for JVM-specific information in the HTML content
                 system_properties = {
@@ -52,17 +51,16 @@ class JenkinsInfoCollector(BaseCollector):
                     'osArch': 'os.arch'
                 }
 
-                # Extract each property from the HTML
+                # Look up each property
                 for key, prop in system_properties.items():
-                    if prop in html_content:
-                        info[key] = self.extract_property(html_content, prop)
+                    if prop in properties:
+                        info[key] = self.extract_property(properties, prop)
 
-            # Get more system information directly
+            # Get more system information from the same parsed page
             try:
-                # Directly access system information endpoint for more details
-                response = self.fetch_jenkins_data("systemInfo")
-                if "error" not in response and "html" in response:
-                    html = response["content"]
+                response = self.fetch_system_info()
+                if "error" not in response:
+                    properties = response["properties"]
 
                     # Extract Jenkins-specific directories and configurations
                     jenkins_specific = {
@@ -78,18 +76,8 @@ class JenkinsInfoCollector(BaseCollector):
                     }
 
                     for key, prop in jenkins_specific.items():
-                        if prop in html:
-                            info[key] = self.extract_property(html, prop)
-
-                    # Additional manual extraction for important values that may have
-                    # different HTML structure
-                    if 'JENKINS_HOME' in html:
-                        # Try an alternative approach if the standard one failed
-                        if info.get('jenkinsHome') == 'Unknown':
-                            pattern = "JENKINS_HOME:</td><td[^>]*>(.*?)</td>"
-                            match = re.search(pattern, html, re.DOTALL)
-                            if match:
-                                info['jenkinsHome'] = match.group(1).strip()
+                        if prop in properties:
+                            info[key] = self.extract_property(properties, prop)
             except Exception as e:
                 # Don't fail completely on extraction error
                 pass
@@ -4,8 +4,8 @@ Jenkins Jobs Information Collector
 This module collects information about Jenkins jobs.
 """
 
-from datetime import datetime
 from collectors.base_collector import BaseCollector
+from utils.records import BuildRecord, JobRecord
 
 class JenkinsJobsCollector(BaseCollector):
     """Collects detailed information about Jenkins jobs"""
@@ -18,9 +18,8 @@ class JenkinsJobsCollector(BaseCollector):
             dict: Jobs overview information
         """
         try:
-            # Get the list of all jobs with detailed information
-            tree_param = "jobs[name,url,color,buildable,inQueue,firstBuild[number],lastBuild[number,timestamp,result,duration]]"
-            response = self.fetch_jenkins_data("api/json", params={"tree": tree_param})
+            # Get all jobs, including those inside folders, with detailed information
+            response = self.fetch_jobs_snapshot()
 
             if "error" in response:
                 return response
@@ -33,46 +32,28 @@ class JenkinsJobsCollector(BaseCollector):
                 if not isinstance(job, dict):
                     continue
 
-                job_info = {
-                    'name': job.get('name', 'Unknown'),
-                    'url': job.get('url', ''),
-                    'color': self._parse_job_color(job.get('color', '')),
-                    'buildable': job.get('buildable', False),
-                    'inQueue': job.get('inQueue', False),
-                    'firstBuildNumber': 'N/A',
-                }
+                job_info = JobRecord(
+                    name=job.get('fullName', job.get('name', 'Unknown')),
+                    url=job.get('url', ''),
+                    type=self._map_job_class_to_type(job.get('_class', '').split('.')[-1]),
+                    color=self._parse_job_color(job.get('color', '')),
+                    buildable=job.get('buildable', False),
+                    in_queue=job.get('inQueue', False)
+                )
 
                 # Get first build info if available
                 first_build = job.get('firstBuild')
                 if isinstance(first_build, dict):
-                    job_info['firstBuildNumber'] = first_build.get('number', 'N/A')
+                    job_info.first_build_number = first_build.get('number')
 
-                # Get last build information if available
+                # Get last build information if available (timestamps and durations
+                # stay in milliseconds; the displays format them)
                 last_build = job.get('lastBuild')
                 if isinstance(last_build, dict):
-                    job_info['lastBuildNumber'] = last_build.get('number', 'N/A')
-
-                    # Format timestamp to human-readable date
-                    timestamp = last_build.get('timestamp')
-                    if timestamp:
-                        job_info['lastBuildTime'] = self.format_timestamp(timestamp)
-                    else:
-                        job_info['lastBuildTime'] = 'N/A'
-
-                    # Get build result
-                    job_info['lastBuildResult'] = last_build.get('result', 'N/A')
-
-                    # Format duration to human-readable time
-                    duration = last_build.get('duration')
-                    if duration:
-                        job_info['lastBuildDuration'] = self.format_duration(duration)
-                    else:
-                        job_info['lastBuildDuration'] = 'N/A'
-                else:
-                    job_info['lastBuildNumber'] = 'N/A'
-                    job_info['lastBuildTime'] = 'N/A'
-                    job_info['lastBuildResult'] = 'N/A'
-                    job_info['lastBuildDuration'] = 'N/A'
+                    job_info.last_build_number = last_build.get('number')
+                    job_info.last_build_timestamp = last_build.get('timestamp') or None
+                    job_info.last_build_result = last_build.get('result')
+                    job_info.last_build_duration = last_build.get('duration') or None
 
                 # Add to processed jobs list
                 processed_jobs.append(job_info)
@@ -82,7 +63,7 @@ class JenkinsJobsCollector(BaseCollector):
             status_counts = {'Success': 0, 'Failed': 0, 'Unstable': 0, 'Disabled': 0, 'In progress': 0, 'Not built': 0}
 
             for job in processed_jobs:
-                status = job['color'].split()[0] if job['color'] else "Not built"  # Get the status part without the details
+                status = job.color.split()[0] if job.color else "Not built"  # Get the status part without the details
                 if status == 'Success':
                     status_counts['Success'] += 1
                 elif status == 'Failed':
@@ -91,7 +72,7 @@ class JenkinsJobsCollector(BaseCollector):
                     status_counts['Unstable'] += 1
                 elif status == 'Disabled':
                     status_counts['Disabled'] += 1
-                elif status == 'In' and 'progress' in job['color']:
+                elif status == 'In' and 'progress' in job.color:
                     status_counts['In progress'] += 1
                 else:
                     status_counts['Not built'] += 1
@@ -104,7 +85,8 @@ class JenkinsJobsCollector(BaseCollector):
                 'total_jobs': total_jobs,
                 'status_counts': status_counts,
                 'success_rate': success_rate,
-                'jobs': processed_jobs
+                'jobs': processed_jobs,
+                'job_type_counts': self._count_job_types(jobs + response.get('folders', []))
             }
 
         except Exception as e:
@@ -118,49 +100,15 @@ class JenkinsJobsCollector(BaseCollector):
             dict: Job types information
         """
         try:
-            # To get job types, we need to make additional API calls to each job
+            # Job classes come with the overview, including folders and their contents
             overview = self.get_jobs_overview()
             if "error" in overview:
                 return overview
 
-            jobs = overview.get('jobs', [])
-            if not jobs:
+            job_types = overview.get('job_type_counts', {})
+            if not job_types:
                 return {"error": "No jobs found or unable to retrieve jobs"}
 
-            # Process a sample of jobs (limit to 50 for performance)
-            job_types = {}
-            sample_size = min(50, len(jobs))
-            sample_jobs = jobs[:sample_size]
-
-            for job in sample_jobs:
-                try:
-                    job_url = job.get('url')
-                    if not job_url:
-                        continue
-
-                    response = self.fetch_jenkins_data(f"{job_url}api/json", params={"tree": "_class"})
-                    if "error" in response:
-                        continue
-
-                    job_class = response.get('_class', 'Unknown')
-                    if not job_class:
-                        continue
-
-                    # Extract the simple class name (last part after the dot)
-                    simple_class = job_class.split('.')[-1]
-
-                    # Map to common name
-                    job_type = self._map_job_class_to_type(simple_class)
-
-                    # Count job types
-                    if job_type in job_types:
-                        job_types[job_type] += 1
-                    else:
-                        job_types[job_type] = 1
-                except Exception:
-                    # If we can't determine the type, skip this job
-                    continue
-
             # Calculate percentages
             total = sum(job_types.values())
             job_types_with_percent = []
@@ -207,25 +155,18 @@ class JenkinsJobsCollector(BaseCollector):
             recent_builds = []
 
             for job in jobs:
-                if job.get('lastBuildNumber', 'N/A') != 'N/A':
+                if job.last_build_number is not None:
                     # Only include jobs that have actual builds
-                    build_info = {
-                        'job_name': job.get('name', 'Unknown'),
-                        'build_number': job.get('lastBuildNumber', 'N/A'),
-                        'timestamp': job.get('lastBuildTime', 'N/A'),
-                        'result': job.get('lastBuildResult', 'N/A'),
-                        'duration': job.get('lastBuildDuration', 'N/A')
-                    }
-                    recent_builds.append(build_info)
-
-            # Sort by timestamp (most recent first)
-            def get_sort_key(build):
-                timestamp = build.get('timestamp', 'N/A')
-                if timestamp == 'N/A':
-                    return ''  # This will sort to the end
-                return timestamp
-
-            recent_builds.sort(key=get_sort_key, reverse=True)
+                    recent_builds.append(BuildRecord(
+                        job.last_build_number,
+                        result=job.last_build_result,
+                        timestamp=job.last_build_timestamp,
+                        duration=job.last_build_duration,
+                        job_name=job.name
+                    ))
+
+            # Sort by timestamp (most recent first, builds without one last)
+            recent_builds.sort(key=lambda build: build.timestamp or 0, reverse=True)
 
             # Limit the number of builds
             recent_builds = recent_builds[:limit]
@@ -285,32 +226,3 @@ class JenkinsJobsCollector(BaseCollector):
             return dt.strftime("%Y-%m-%d %H:%M:%S")
         except Exception:
             return str(timestamp)
-
-    def _map_job_class_to_type(self, class_name):
-        """
-        Map Jenkins job class to human-readable type
-
-        Args:
-            class_name: Jenkins job class name
-
-        Returns:
-            str: Human-readable job type
-        """
-        type_map = {
-            'FreeStyleProject': 'Freestyle',
-            'WorkflowJob': 'Pipeline',
-            'WorkflowMultiBranchProject': 'Multi-branch Pipeline',
-            'ExternalJob': 'External',
-            'MatrixProject': 'Matrix',
-            'MavenModuleSet': 'Maven',
-            'IvyModuleSet': 'Ivy',
-            'MultiJobProject': 'Multi-job',
-            'OrganizationFolder': 'Organization Folder'
-        }
-
-        # Check for partial matches
-        for key, value in type_map.items():
-            if key in class_name:
-                return value
-
-        return class_name  # Return the original class name if no mapping found
@@ -18,16 +18,14 @@ class JenkinsJobsStatCollector(BaseCollector):
             dict: Jobs summary information
         """
         try:
-            # Get the list of all jobs with minimal information
-            response = self.fetch_jenkins_data(
-                "api/json",
-                params={"tree": "jobs[name,color,buildable,inQueue]"}
-            )
+            # Get all jobs, including those inside folders
+            response = self.fetch_jobs_snapshot()
 
             if "error" in response:
                 return response
 
             jobs = response.get('jobs', [])
+            folders = response.get('folders', [])
 
             # Initialize counters
             total_jobs = len(jobs)
@@ -95,8 +93,8 @@ class JenkinsJobsStatCollector(BaseCollector):
             built_jobs = total_jobs - job_status['disabled'] - job_status['not_built']
             success_rate = (job_status['successful'] / built_jobs * 100) if built_jobs > 0 else 0
 
-            # Try to get job types information with minimal API calls
-            job_types = self._get_job_types_sample(jobs[:min(20, len(jobs))])
+            # Job types come from the _class already in the listing
+            job_types = self._count_job_types(jobs + folders)
 
             # Create summary object
             return {
@@ -110,57 +108,3 @@ class JenkinsJobsStatCollector(BaseCollector):
 
         except Exception as e:
             return {"error": f"Error retrieving jobs summary: {str(e)}"}
-
-    def _get_job_types_sample(self, jobs_sample):
-        """Get job types from a small sample of jobs"""
-        job_types = {}
-
-        for job in jobs_sample:
-            try:
-                job_url = job.get('url')
-                if not job_url:
-                    continue
-
-                response = self.fetch_jenkins_data(f"{job_url}api/json", params={"tree": "_class"})
-                if "error" in response:
-                    continue
-
-                job_class = response.get('_class', 'Unknown')
-                if not job_class:
-                    continue
-
-                # Extract the class name
-                simple_class = job_class.split('.')[-1]
-
-                # Map to common type
-                job_type = self._map_job_class_to_type(simple_class)
-
-                # Count job types
-                if job_type in job_types:
-                    job_types[job_type] += 1
-                else:
-                    job_types[job_type] = 1
-            except Exception:
-                continue
-
-        return job_types
-
-    def _map_job_class_to_type(self, class_name):
-        """Map class name to human-readable job type"""
-        type_map = {
-            'FreeStyleProject': 'Freestyle',
-            'WorkflowJob': 'Pipeline',
-            'WorkflowMultiBranchProject': 'Multi-branch Pipeline',
-            'ExternalJob': 'External',
-            'MatrixProject': 'Matrix',
-            'MavenModuleSet': 'Maven',
-            'IvyModuleSet': 'Ivy',
-            'MultiJobProject': 'Multi-job',
-            'OrganizationFolder': 'Organization Folder'
-        }
-
-        for key, value in type_map.items():
-            if key in class_name:
-                return value
-
-        return class_name
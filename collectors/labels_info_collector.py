@@ -18,7 +18,7 @@ class JenkinsLabelsCollector(BaseCollector):
         """
         try:
             # Get nodes information with labels
-            response = self.fetch_jenkins_data("computer/api/json", depth=2)
+            response = self.fetch_nodes_snapshot()
             if "error" in response:
                 return response
 
@@ -137,54 +137,19 @@ class JenkinsLabelsCollector(BaseCollector):
             if "error" in labels_info:
                 return labels_info
 
-            label_names = [label['name'] for label in labels_info.get('labels', [])]
-
-            # Get jobs information
-            response = self.fetch_jenkins_data("api/json", params={"tree": "jobs[name,url]"})
-            if "error" in response:
+            # Every job config is scanned once; the analysis indexes jobs by the labels they use
+            analysis = self.fetch_config_analysis()
+            if "error" in analysis:
                 return {"error": "Failed to fetch jobs information"}
 
-            jobs = response.get('jobs', [])
-
-            # Track label usage in jobs
-            label_usage = {}
-            for label in label_names:
-                label_usage[label] = {
-                    'jobs': [],
-                    'count': 0
-                }
-
-            # Check first 50 jobs for performance
-            for job in jobs[:50]:
-                job_name = job.get('name', 'Unknown')
-                job_url = job.get('url', '')
-
-                if not job_url:
-                    continue
-
-                # Check job config for label references
-                try:
-                    response = self.fetch_jenkins_data(f"{job_url}config.xml")
-                    if "error" not in response and "html" in response:
-                        config = response["content"]
-
-                        # Check each label
-                        for label in label_names:
-                            # Look for label in assignedNode or label elements
-                            label_pattern = f"<assignedNode>{label}</assignedNode>|<label>{label}</label>"
-                            if re.search(label_pattern, config) or f"'{label}'" in config or f"\"{label}\"" in config:
-                                label_usage[label]['jobs'].append(job_name)
-                                label_usage[label]['count'] += 1
-                except Exception:
-                    # Skip on error and continue with other jobs
-                    continue
+            jobs_by_label = analysis.get('labels', {})
 
             # Add usage info to labels
             labels_with_usage = []
             for label in labels_info.get('labels', []):
-                label_name = label['name']
-                label['jobs_count'] = label_usage.get(label_name, {}).get('count', 0)
-                label['jobs'] = label_usage.get(label_name, {}).get('jobs', [])
+                label_jobs = jobs_by_label.get(label['name'], [])
+                label['jobs_count'] = len(label_jobs)
+                label['jobs'] = label_jobs
                 labels_with_usage.append(label)
 
             return {
@@ -81,7 +81,7 @@ class JenkinsNodeDetailsCollector(BaseCollector):
                     'serial': 'Unknown',
                     'cpu': f"Estimated ~{node.get('num_executors', 1)} cores",
                     'ram': 'Unknown',
-                    'disk': node.get('disk_space', 'Unknown'),
+                    'disk': self.format_bytes(node.disk_bytes) if node.disk_bytes is not None else 'Unknown',
                     'swap': 'Unknown'
                 })
 
@@ -161,7 +161,7 @@ class JenkinsNodeDetailsCollector(BaseCollector):
                     'serial': 'Unknown',
                     'cpu': f"Estimated ~{node.get('num_executors', 1)} cores",
                     'ram': 'Unknown',
-                    'disk': node.get('disk_space', 'Unknown'),
+                    'disk': self.format_bytes(node.disk_bytes) if node.disk_bytes is not None else 'Unknown',
                     'swap': 'Unknown'
                 })
 
@@ -209,7 +209,7 @@ class JenkinsNodeDetailsCollector(BaseCollector):
                     "description": node.get('description', 'Unknown'),
                     "status": node.get('status', 'Unknown'),
                     "architecture": node.get('architecture', 'Unknown'),
-                    "disk_space": node.get('disk_space', 'Unknown'),
+                    "disk_space": self.format_bytes(node.disk_bytes) if node.disk_bytes is not None else 'Unknown',
                     "jdk_version": node.get('jvm_version', 'Unknown'),
                     "os_type": node.get('os_name', 'Unknown'),
                     "os_vendor": node.get('os_name', 'Unknown'),
@@ -233,5 +233,6 @@ class JenkinsNodeDetailsCollector(BaseCollector):
             return self._node_details_cache
 
         except Exception as e:
-            print(f"Debug - Overall exception: {str(e)}")
+            if self.client.debug_mode:
+                print(f"Debug - Overall exception: {str(e)}")
             return {"error": f"Error retrieving node details: {str(e)}"}
@@ -5,8 +5,8 @@ This module collects information about Jenkins nodes/agents.
 """
 
 import re
-from datetime import datetime
 from collectors.base_collector import BaseCollector
+from utils.records import NodeRecord
 
 class JenkinsNodesCollector(BaseCollector):
     """Collects information about Jenkins nodes/agents"""
@@ -192,21 +192,21 @@ class JenkinsNodesCollector(BaseCollector):
         Extract detailed OS information including specific versions
 
         Args:
-            node_info: Node information dictionary to update
+            node_info: NodeRecord to update
             architecture: Architecture string containing OS information
 
         Returns:
-            dict: Updated node_info dictionary with detailed OS information
+            NodeRecord: The updated node_info
         """
         # Default values
-        node_info['os_name'] = 'Unknown'
-        node_info['os_full_name'] = 'Unknown'
+        node_info.os_name = 'Unknown'
+        node_info.os_full_name = 'Unknown'
 
         # Extract OS info from labels first (most reliable for Linux distributions)
-        label_os_info = self._extract_os_info_from_labels(node_info.get('labels', ''))
+        label_os_info = self._extract_os_info_from_labels(node_info.labels)
         if label_os_info:
-            node_info['os_name'] = label_os_info['name']
-            node_info['os_full_name'] = label_os_info['full_name']
+            node_info.os_name = label_os_info['name']
+            node_info.os_full_name = label_os_info['full_name']
             return node_info
 
         # Try to extract from architecture string
@@ -215,16 +215,16 @@ class JenkinsNodesCollector(BaseCollector):
             os_family_match = re.match(r'^(Windows|Linux|Mac|macOS|Ubuntu|CentOS|RHEL|Debian|Fedora)', architecture)
             if os_family_match:
                 os_family = os_family_match.group(1)
-                node_info['os_name'] = os_family
+                node_info.os_name = os_family
 
                 # Extract detailed version information
                 if os_family == 'Windows':
                     # Handle Windows versions (Windows 10, Windows Server 2019, etc.)
                     win_version_match = re.match(r'^Windows\s+(Server\s+\d+|\d+|XP|Vista|7|8|8.1|10|11)', architecture)
                     if win_version_match:
-                        node_info['os_full_name'] = f"Windows {win_version_match.group(1)}"
+                        node_info.os_full_name = f"Windows {win_version_match.group(1)}"
                     else:
-                        node_info['os_full_name'] = "Windows"
+                        node_info.os_full_name = "Windows"
 
                 elif os_family == 'Linux':
                     # Try to extract Linux distribution and version
@@ -235,55 +235,55 @@ class JenkinsNodesCollector(BaseCollector):
                     fedora_match = re.search(r'Fedora\s+(\d+)', architecture)
 
                     if ubuntu_match:
-                        node_info['os_name'] = 'Ubuntu'
-                        node_info['os_full_name'] = f"Ubuntu {ubuntu_match.group(1)}"
+                        node_info.os_name = 'Ubuntu'
+                        node_info.os_full_name = f"Ubuntu {ubuntu_match.group(1)}"
                     elif centos_match:
-                        node_info['os_name'] = 'CentOS'
-                        node_info['os_full_name'] = f"CentOS {centos_match.group(1)}"
+                        node_info.os_name = 'CentOS'
+                        node_info.os_full_name = f"CentOS {centos_match.group(1)}"
                     elif rhel_match:
-                        node_info['os_name'] = 'RHEL'
-                        node_info['os_full_name'] = f"RHEL {rhel_match.group(1)}"
+                        node_info.os_name = 'RHEL'
+                        node_info.os_full_name = f"RHEL {rhel_match.group(1)}"
                     elif debian_match:
-                        node_info['os_name'] = 'Debian'
-                        node_info['os_full_name'] = f"Debian {debian_match.group(1)}"
+                        node_info.os_name = 'Debian'
+                        node_info.os_full_name = f"Debian {debian_match.group(1)}"
                     elif fedora_match:
-                        node_info['os_name'] = 'Fedora'
-                        node_info['os_full_name'] = f"Fedora {fedora_match.group(1)}"
+                        node_info.os_name = 'Fedora'
+                        node_info.os_full_name = f"Fedora {fedora_match.group(1)}"
                     else:
                         # Try to guess distribution from node name
-                        name_os_info = self._extract_os_info_from_name(node_info.get('name', ''))
+                        name_os_info = self._extract_os_info_from_name(node_info.name)
                         if name_os_info:
-                            node_info['os_name'] = name_os_info['name']
-                            node_info['os_full_name'] = name_os_info['full_name']
+                            node_info.os_name = name_os_info['name']
+                            node_info.os_full_name = name_os_info['full_name']
                         else:
-                            node_info['os_full_name'] = "Linux"
+                            node_info.os_full_name = "Linux"
 
                 elif os_family in ['Mac', 'macOS']:
                     # Handle macOS versions
                     mac_version_match = re.search(r'(Mac|macOS)\s+((\d+(\.\d+)*)|Catalina|Big Sur|Monterey|Ventura|Sonoma)', architecture)
                     if mac_version_match:
-                        node_info['os_name'] = 'macOS'
-                        node_info['os_full_name'] = f"macOS {mac_version_match.group(2)}"
+                        node_info.os_name = 'macOS'
+                        node_info.os_full_name = f"macOS {mac_version_match.group(2)}"
                     else:
-                        node_info['os_full_name'] = "macOS"
+                        node_info.os_full_name = "macOS"
                 else:
                     # For other OS types, just use what we found
-                    node_info['os_full_name'] = os_family
+                    node_info.os_full_name = os_family
         else:
             # If no architecture string, try to extract from node name
-            name_os_info = self._extract_os_info_from_name(node_info.get('name', ''))
+            name_os_info = self._extract_os_info_from_name(node_info.name)
             if name_os_info:
-                node_info['os_name'] = name_os_info['name']
-                node_info['os_full_name'] = name_os_info['full_name']
+                node_info.os_name = name_os_info['name']
+                node_info.os_full_name = name_os_info['full_name']
             else:
                 # Default to generic OS family if we couldn't determine version
-                if node_info['os_name'] == 'Linux':
-                    node_info['os_full_name'] = 'Linux'
-                elif node_info['os_name'] == 'Windows':
-                    node_info['os_full_name'] = 'Windows'
+                if node_info.os_name == 'Linux':
+                    node_info.os_full_name = 'Linux'
+                elif node_info.os_name == 'Windows':
+                    node_info.os_full_name = 'Windows'
                 else:
-                    node_info['os_name'] = 'Unknown'
-                    node_info['os_full_name'] = 'Unknown'
+                    node_info.os_name = 'Unknown'
+                    node_info.os_full_name = 'Unknown'
 
         return node_info
 
@@ -305,7 +305,7 @@ class JenkinsNodesCollector(BaseCollector):
         """
         try:
             # Get the list of all nodes/computers with detailed information
-            response = self.fetch_jenkins_data("computer/api/json", depth=2)
+            response = self.fetch_nodes_snapshot()
             if "error" in response:
                 return response
 
@@ -335,40 +335,34 @@ class JenkinsNodesCollector(BaseCollector):
                     continue
 
                 # Basic node info
-                node_info = {
-                    'name': node.get('displayName', 'Unknown'),
-                    'description': node.get('description', ''),
-                    'url': f"{self.url}computer/{node.get('displayName', '')}/"
-                }
+                node_info = NodeRecord(
+                    name=node.get('displayName', 'Unknown'),
+                    description=node.get('description', ''),
+                    url=f"{self.url}computer/{node.get('displayName', '')}/",
+                    offline=node.get('offline', True),
+                    temporarily_offline=node.get('temporarilyOffline', False)
+                )
 
                 # Get status information
-                node_info['offline'] = node.get('offline', True)
-                node_info['temporarily_offline'] = node.get('temporarilyOffline', False)
-
-                if node_info['offline']:
-                    if node_info['temporarily_offline']:
-                        node_info['status'] = 'Temporarily Offline'
+                if node_info.offline:
+                    if node_info.temporarily_offline:
                         status_counts['temp_offline'] += 1
                     else:
-                        node_info['status'] = 'Offline'
                         status_counts['offline'] += 1
                 else:
-                    node_info['status'] = 'Online'
                     status_counts['online'] += 1
 
                 # Store JVM version for later analysis
                 if 'hudson.node_monitors.JavaInfo' in node.get('monitorData', {}):
                     java_info = node.get('monitorData', {}).get('hudson.node_monitors.JavaInfo', {})
                     if isinstance(java_info, dict):
-                        node_info['jvm_version'] = java_info.get('version', 'Unknown')
+                        node_info.jvm_version = java_info.get('version', 'Unknown')
                     else:
-                        node_info['jvm_version'] = str(java_info) if java_info else 'Unknown'
-                else:
-                    node_info['jvm_version'] = 'Unknown'
+                        node_info.jvm_version = str(java_info) if java_info else 'Unknown'
 
                 # Get labels
                 labels_string = self._extract_labels(node)
-                node_info['labels'] = labels_string.strip() if labels_string else ""
+                node_info.labels = labels_string.strip() if labels_string else ""
 
                 # Add to all labels set
                 if labels_string:
@@ -378,51 +372,27 @@ class JenkinsNodesCollector(BaseCollector):
                 monitoring = node.get('monitorData', {})
 
                 # Get executor information
-                node_info['num_executors'] = node.get('numExecutors', 0)
+                node_info.num_executors = node.get('numExecutors', 0)
 
                 # Get idle executors
                 executors = node.get('executors', [])
-                idle_executors = sum(1 for executor in executors if executor.get('idle', True))
-                node_info['idle_executors'] = idle_executors
-                node_info['busy_executors'] = node_info['num_executors'] - idle_executors
-
-                # Get disk space
-                if 'hudson.node_monitors.DiskSpaceMonitor' in monitoring:
-                    disk_space = monitoring.get('hudson.node_monitors.DiskSpaceMonitor', {})
-                    if isinstance(disk_space, dict) and 'size' in disk_space and 'path' in disk_space:
-                        try:
-                            # Convert to GB and format
-                            size_gb = disk_space.get('size', 0) / (1024 ** 3)
-                            node_info['disk_space'] = f"{size_gb:.2f} GB"
-                            node_info['disk_path'] = disk_space.get('path', '')
-                        except (TypeError, ValueError):
-                            node_info['disk_space'] = 'Unknown'
-                            node_info['disk_path'] = ''
-                    else:
-                        node_info['disk_space'] = 'Unknown'
-                        node_info['disk_path'] = ''
-                else:
-                    node_info['disk_space'] = 'Unknown'
-                    node_info['disk_path'] = ''
-
-                # Get response time
-                if 'hudson.node_monitors.ResponseTimeMonitor' in monitoring:
-                    response_time = monitoring.get('hudson.node_monitors.ResponseTimeMonitor', {})
-                    if isinstance(response_time, dict) and 'average' in response_time:
-                        try:
-                            avg_ms = response_time.get('average', 0)
-                            node_info['response_time'] = f"{avg_ms:.2f} ms"
-                        except (TypeError, ValueError):
-                            node_info['response_time'] = 'Unknown'
-                    else:
-                        node_info['response_time'] = 'Unknown'
-                else:
-                    node_info['response_time'] = 'Unknown'
+                node_info.idle_executors = sum(1 for executor in executors if executor.get('idle', True))
+
+                # Get disk space (in bytes; formatted by the displays)
+                disk_space = monitoring.get('hudson.node_monitors.DiskSpaceMonitor')
+                if isinstance(disk_space, dict) and isinstance(disk_space.get('size'), (int, float)):
+                    node_info.disk_bytes = disk_space['size']
+                    node_info.disk_path = disk_space.get('path', '')
+
+                # Get response time (in milliseconds)
+                response_time = monitoring.get('hudson.node_monitors.ResponseTimeMonitor')
+                if isinstance(response_time, dict) and isinstance(response_time.get('average'), (int, float)):
+                    node_info.response_time_ms = response_time['average']
 
                 # Get architecture and OS info if available
                 if 'hudson.node_monitors.ArchitectureMonitor' in monitoring:
                     architecture = monitoring.get('hudson.node_monitors.ArchitectureMonitor', '')
-                    node_info['architecture'] = architecture if architecture else 'Unknown'
+                    node_info.architecture = architecture if architecture else 'Unknown'
 
                     # Extract OS info from architecture if available
                     if architecture and isinstance(architecture, str):
@@ -430,40 +400,19 @@ class JenkinsNodesCollector(BaseCollector):
                         node_info = self._extract_detailed_os_info(node_info, architecture)
 
                         # Update OS distribution counts
-                        os_key = node_info['os_full_name']
+                        os_key = node_info.os_full_name
                         if os_key in os_distribution:
                             os_distribution[os_key] += 1
                         else:
                             os_distribution[os_key] = 1
-                    else:
-                        node_info['os_name'] = 'Unknown'
-                        node_info['os_full_name'] = 'Unknown'
-                else:
-                    node_info['architecture'] = 'Unknown'
-                    node_info['os_name'] = 'Unknown'
-                    node_info['os_full_name'] = 'Unknown'
 
                 # Get connection details
                 if node.get('_class', ''):
-                    node_info['connection_type'] = self._extract_connection_type(node.get('_class', ''))
-                else:
-                    node_info['connection_type'] = 'Unknown'
-
-                # Get last connection time for agents that have been connected before
-                if not node_info['offline'] or node_info['temporarily_offline']:
-                    node_info['last_connection'] = 'Currently Connected'
-                elif 'connectTime' in node:
-                    try:
-                        connect_time = node.get('connectTime', 0)
-                        if connect_time > 0:
-                            dt = datetime.fromtimestamp(connect_time / 1000)  # Convert from ms to seconds
-                            node_info['last_connection'] = dt.strftime('%Y-%m-%d %H:%M:%S')
-                        else:
-                            node_info['last_connection'] = 'Never'
-                    except (ValueError, TypeError):
-                        node_info['last_connection'] = 'Unknown'
-                else:
-                    node_info['last_connection'] = 'Unknown'
+                    node_info.connection_type = self._extract_connection_type(node.get('_class', ''))
+
+                # Keep the last connection time of agents that have been connected before
+                if isinstance(node.get('connectTime'), (int, float)) and node['connectTime'] > 0:
+                    node_info.connect_time = node['connectTime']
 
                 processed_nodes.append(node_info)
 
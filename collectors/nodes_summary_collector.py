@@ -18,7 +18,7 @@ class JenkinsNodesStatCollector(BaseCollector):
         """
         try:
             # Get the list of all nodes/computers
-            response = self.fetch_jenkins_data("computer/api/json", depth=1)
+            response = self.fetch_nodes_snapshot()
             if "error" in response:
                 return response
 
@@ -4,9 +4,20 @@ Jenkins Notification Systems Collector
 This module collects information about notification systems configured in Jenkins.
 """
 
-import re
 from collectors.base_collector import BaseCollector
 
+# Other notification systems recognised on the configure page, by the words
+# or phrases that mention them
+OTHER_NOTIFICATIONS = [
+    ('Telegram', ('Telegram',)),
+    ('IRC', ('IRC', 'Internet Relay Chat')),
+    ('Jabber', ('Jabber', 'XMPP')),
+    ('Mattermost', ('Mattermost',)),
+    ('Discord', ('Discord',)),
+    ('Google Chat', ('Google Chat', 'Hangouts')),
+    ('Webhooks', ('Webhook', 'Webhooks'))
+]
+
 class JenkinsNotificationCollector(BaseCollector):
     """Collects information about notification systems in Jenkins"""
 
@@ -26,24 +37,13 @@ class JenkinsNotificationCollector(BaseCollector):
                 'other': []
             }
 
-            # Check for other notification systems
-            configure_response = self.fetch_jenkins_data("configure")
-            if "error" not in configure_response and "html" in configure_response:
-                html = configure_response["content"]
-
-                # Check for other common notification systems
-                other_notifications = [
-                    ('Telegram', r'[tT]elegram'),
-                    ('IRC', r'IRC|Internet Relay Chat'),
-                    ('Jabber', r'[jJ]abber|XMPP'),
-                    ('Mattermost', r'[mM]attermost'),
-                    ('Discord', r'[dD]iscord'),
-                    ('Google Chat', r'[gG]oogle\s+[cC]hat|Hangouts'),
-                    ('Webhooks', r'[wW]ebhooks?')
-                ]
-
-                for name, pattern in other_notifications:
-                    if re.search(pattern, html):
+            # Check for other notification systems on the shared configure page
+            configure_response = self.fetch_config_page("configure")
+            if "error" not in configure_response:
+                page = configure_response["page"]
+
+                for name, phrases in OTHER_NOTIFICATIONS:
+                    if any(page.mentions(phrase) for phrase in phrases):
                         notification_info['other'].append({
                             'name': name,
                             'enabled': True
@@ -70,7 +70,7 @@ class JenkinsNotificationCollector(BaseCollector):
 
         try:
             # Check if Slack plugin is installed
-            response = self.fetch_jenkins_data("pluginManager/api/json?depth=1")
+            response = self.fetch_snapshot("pluginManager/api/json?depth=1")
             if "error" not in response:
                 plugins = response.get('plugins', [])
 
@@ -81,46 +81,31 @@ class JenkinsNotificationCollector(BaseCollector):
                         slack_info['version'] = plugin.get('version', 'Unknown')
                         break
 
-            # If Slack is enabled, try to get configuration
+            # If Slack is enabled, read its settings from the Slack descriptor page,
+            # falling back to the general configure page
             if slack_info['enabled']:
-                # Try to access Slack configuration
-                response = self.fetch_jenkins_data("jenkins/descriptorByName/jenkins.plugins.slack.SlackNotifier/configure")
-                if "error" not in response and "html" in response:
-                    html = response["content"]
+                for endpoint in ("jenkins/descriptorByName/jenkins.plugins.slack.SlackNotifier/configure", "configure"):
+                    response = self.fetch_config_page(endpoint)
+                    if "error" in response:
+                        continue
+
+                    page = response["page"]
+                    if endpoint == "configure" and not page.contains('Slack'):
+                        break
 
-                    # Extract workspace
-                    workspace_match = re.search(r'[tT]eam [sS]ubdomain.*?value="(.*?)"', html)
-                    if workspace_match:
-                        slack_info['workspace'] = workspace_match.group(1).strip()
+                    workspace = page.value_after_label('Team Subdomain')
+                    if workspace:
+                        slack_info['workspace'] = workspace
 
-                    # Extract channel
-                    channel_match = re.search(r'[dD]efault [cC]hannel.*?value="(.*?)"', html)
-                    if channel_match:
-                        slack_info['default_channel'] = channel_match.group(1).strip()
+                    channel = page.value_after_label('Default Channel')
+                    if channel:
+                        slack_info['default_channel'] = channel
 
                     # Check if token is configured
-                    slack_info['token_configured'] = 'Integration Token' in html and 'value="••••••••"' in html
-
-            # If no specific Slack page, try general configuration
-            if 'workspace' not in slack_info and slack_info['enabled']:
-                response = self.fetch_jenkins_data("configure")
-                if "error" not in response and "html" in response:
-                    html = response["content"]
-
-                    # Look for Slack section
-                    if 'Slack' in html:
-                        # Extract workspace
-                        workspace_match = re.search(r'[tT]eam [sS]ubdomain.*?value="(.*?)"', html)
-                        if workspace_match:
-                            slack_info['workspace'] = workspace_match.group(1).strip()
-
-                        # Extract channel
-                        channel_match = re.search(r'[dD]efault [cC]hannel.*?value="(.*?)"', html)
-                        if channel_match:
-                            slack_info['default_channel'] = channel_match.group(1).strip()
-
-                        # Check if token is configured
-                        slack_info['token_configured'] = 'Integration Token' in html and 'value="••••••••"' in html
+                    slack_info['token_configured'] = bool(page.value_after_label('Integration Token'))
+
+                    if 'workspace' in slack_info:
+                        break
         except Exception:
             # Don't fail completely if Slack info can't be retrieved
             pass
@@ -140,7 +125,7 @@ class JenkinsNotificationCollector(BaseCollector):
 
         try:
             # Check if Teams plugin is installed
-            response = self.fetch_jenkins_data("pluginManager/api/json?depth=1")
+            response = self.fetch_snapshot("pluginManager/api/json?depth=1")
             if "error" not in response:
                 plugins = response.get('plugins', [])
 
@@ -153,19 +138,19 @@ class JenkinsNotificationCollector(BaseCollector):
 
             # If Teams is enabled, try to get configuration
             if teams_info['enabled']:
-                response = self.fetch_jenkins_data("configure")
-                if "error" not in response and "html" in response:
-                    html = response["content"]
+                response = self.fetch_config_page("configure")
+                if "error" not in response:
+                    page = response["page"]
 
                     # Look for Teams section
-                    if 'Microsoft Teams' in html or 'Office 365' in html:
+                    if page.contains('Microsoft Teams') or page.contains('Office 365'):
                         # Extract webhook URL (partial for security)
-                        webhook_match = re.search(r'[wW]ebhook [uU][rR][lL].*?value="https://(.*?)"', html)
-                        if webhook_match:
-                            teams_info['webhook'] = f"https://{webhook_match.group(1)[:10]}..."
+                        webhook = page.value_after_label('Webhook URL')
+                        if webhook and webhook.startswith('https://'):
+                            teams_info['webhook'] = f"https://{webhook[len('https://'):][:10]}..."
 
                         # Check if webhook is configured
-                        teams_info['webhook_configured'] = 'Webhook URL' in html and 'value="https://' in html
+                        teams_info['webhook_configured'] = bool(webhook and webhook.startswith('https://'))
         except Exception:
             # Don't fail completely if Teams info can't be retrieved
             pass
@@ -184,19 +169,19 @@ class JenkinsNotificationCollector(BaseCollector):
         }
 
         try:
-            # Check configure page for email notification
-            response = self.fetch_jenkins_data("configure")
-            if "error" not in response and "html" in response:
-                html = response["content"]
+            # Check the shared configure page for email notification
+            response = self.fetch_config_page("configure")
+            if "error" not in response:
+                page = response["page"]
 
                 # Check if email notification is enabled
-                email_info['enabled'] = 'E-mail Notification' in html or 'Email Notification' in html
-                email_info['extended_email'] = 'Extended E-mail Notification' in html
+                email_info['enabled'] = page.contains('E-mail Notification') or page.contains('Email Notification')
+                email_info['extended_email'] = page.contains('Extended E-mail Notification')
 
                 # Try to extract SMTP server
-                smtp_server_match = re.search(r'SMTP Server"?.*?value="(.*?)"', html)
-                if smtp_server_match:
-                    email_info['smtp_server'] = smtp_server_match.group(1).strip()
+                smtp_server = page.value_after_label('SMTP Server')
+                if smtp_server:
+                    email_info['smtp_server'] = smtp_server
         except Exception:
             # Don't fail completely if email info can't be retrieved
             pass
@@ -219,44 +204,13 @@ class JenkinsNotificationCollector(BaseCollector):
         }
 
         try:
-            # Get a sample of jobs
-            response = self.fetch_jenkins_data("api/json", params={"tree": "jobs[name,url]"})
-            if "error" in response:
+            # Every job config is scanned once and shared with the other collectors
+            analysis = self.fetch_config_analysis()
+            if "error" in analysis:
                 return usage_info
 
-            jobs = response.get('jobs', [])
-
-            # Check a sample of jobs for notification usage
-            for job in jobs[:20]:  # Limit to 20 jobs for performance
-                job_url = job.get('url', '')
-
-                if not job_url:
-                    continue
-
-                usage_info['total_jobs_checked'] += 1
-
-                # Get job config
-                try:
-                    response = self.fetch_jenkins_data(f"{job_url}config.xml")
-                    if "error" not in response and "html" in response:
-                        config = response["content"]
-
-                        # Check for notification systems in the config
-                        if 'slack' in config.lower():
-                            usage_info['slack'] += 1
-
-                        if 'teams' in config.lower() or 'office365' in config.lower() or 'office-365' in config.lower():
-                            usage_info['teams'] += 1
-
-                        if 'mailto' in config.lower() or 'email' in config.lower() or 'e-mail' in config.lower():
-                            usage_info['email'] += 1
-
-                        # Check for other notification systems
-                        other_patterns = ['telegram', 'irc', 'jabber', 'xmpp', 'mattermost', 'discord', 'webhook', 'notification']
-                        if any(pattern in config.lower() for pattern in other_patterns):
-                            usage_info['other'] += 1
-                except Exception:
-                    continue
+            usage_info.update(analysis.get('notifications', {}))
+            usage_info['total_jobs_checked'] = analysis.get('jobs_checked', 0)
         except Exception:
             # Don't fail completely if usage info can't be retrieved
             pass
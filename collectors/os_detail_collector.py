@@ -19,7 +19,7 @@ class JenkinsOSDetailCollector(BaseCollector):
         """
         try:
             # Get the nodes with detailed information
-            response = self.fetch_jenkins_data("computer/api/json", depth=2)
+            response = self.fetch_nodes_snapshot()
             if "error" in response:
                 return response
 
@@ -167,13 +167,13 @@ class JenkinsOSDetailCollector(BaseCollector):
             # Check for specific Linux properties
             for node in linux_nodes:
                 # Try to extract additional Linux info from JVM version
-                response = self.fetch_jenkins_data(f"computer/{node['node_name']}/systemInfo")
-                if "error" not in response and "html" in response:
-                    html = response["content"]
+                response = self.fetch_system_info(node['node_name'])
+                if "error" not in response:
+                    properties = response["properties"]
 
                     # Check for specific Linux properties
                     for key in ['lsb.release', 'lsb_release', 'DISTRIB_ID', 'DISTRIB_RELEASE']:
-                        value = self.extract_property(html, key)
+                        value = self.extract_property(properties, key)
                         if value != "Unknown":
                             node[key] = value
 
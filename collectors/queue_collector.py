@@ -103,7 +103,8 @@ class JenkinsQueueCollector(BaseCollector):
                 'items_in_queue': total_items,
                 'avg_wait_time': avg_wait,
                 'blocking_reasons': blocked_reasons,
-                'queue_items': queue_items_info
+                'queue_items': queue_items_info,
+                'wait_seconds': [wait_time / 1000 for wait_time in wait_times]
             }
 
         except Exception as e:
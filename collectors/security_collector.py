@@ -5,8 +5,6 @@ This module collects information about Jenkins security configuration.
 """
 
 from collectors.base_collector import BaseCollector
-import re
-import requests
 
 class JenkinsSecurityCollector(BaseCollector):
     """Collects information about Jenkins security configuration"""
@@ -20,62 +18,58 @@ class JenkinsSecurityCollector(BaseCollector):
         """
         try:
             # Skip the API approach and go directly to HTML parsing
-            print("Using HTML parsing for security configuration...")
+            if self.client.debug_mode:
+                print("Using HTML parsing for security configuration...")
 
             # Initialize security configuration
             security_config = {}
 
-            # Try to get security configuration page
-            try:
-                response = self.session.get(f"{self.url}manage/configureSecurity/")
-                if response.status_code == 200:
-                    html_content = response.text
-                    print("Successfully accessed security config page via HTML")
-                else:
-                    return {"error": f"Could not access security configuration page: HTTP {response.status_code}"}
-            except requests.RequestException as e:
-                return {"error": f"Error accessing security configuration page: {str(e)}"}
+            # Get the security configuration page (parsed once and shared with the users collector)
+            response = self.fetch_config_page("manage/configureSecurity/")
+            if "error" in response:
+                return {"error": f"Could not access security configuration page: {response['error']}"}
 
-            # Parse HTML to extract security information
+            page = response["page"]
+            if self.client.debug_mode:
+                print("Successfully accessed security config page via HTML")
 
             # Check for LDAP
-            if 'LDAP' in html_content:
+            if page.contains('LDAP'):
                 security_config['security_realm'] = 'LDAPSecurityRealm'
 
                 # Try to extract LDAP server
-                server_match = re.search(r'name="_.?server"[^>]*value="([^"]+)"', html_content)
-                if server_match:
-                    if 'realm_details' not in security_config:
-                        security_config['realm_details'] = {}
-                    security_config['realm_details']['server'] = server_match.group(1)
+                server = page.field('server')
+                if server:
+                    security_config['realm_details'] = {'server': server}
             else:
                 security_config['security_realm'] = 'Unknown'
 
             # Check for authorization strategy
-            if 'Matrix Authorization' in html_content:
+            if page.contains('Matrix Authorization'):
                 security_config['authorization_strategy'] = 'GlobalMatrixAuthorizationStrategy'
-            elif 'Project-based Matrix' in html_content:
+            elif page.contains('Project-based Matrix'):
                 security_config['authorization_strategy'] = 'ProjectMatrixAuthorizationStrategy'
-            elif 'Role-Based Strategy' in html_content:
+            elif page.contains('Role-Based Strategy'):
                 security_config['authorization_strategy'] = 'RoleBasedAuthorizationStrategy'
-            elif 'Logged-in users can do anything' in html_content:
+            elif page.contains('Logged-in users can do anything'):
                 security_config['authorization_strategy'] = 'FullControlOnceLoggedInAuthorizationStrategy'
             else:
                 security_config['authorization_strategy'] = 'Unknown'
 
             # Check for CSRF protection
-            security_config['csrf_protection'] = 'CSRF Protection' in html_content
+            security_config['csrf_protection'] = page.contains('CSRF Protection')
 
             # Check for security headers
-            try:
-                headers = self.session.get(f"{self.url}").headers
+            response = self.fetch_root_headers()
+            if "error" in response:
+                security_config['headers'] = {"error": response["error"]}
+            else:
+                headers = response["headers"]
                 security_config['headers'] = {
                     'content_security_policy': 'Content-Security-Policy' in headers,
                     'x_content_type_options': 'X-Content-Type-Options' in headers,
                     'x_frame_options': 'X-Frame-Options' in headers
                 }
-            except Exception as e:
-                security_config['headers'] = {"error": str(e)}
 
             # Recommended security options
             security_recommendations = [
@@ -27,7 +27,7 @@ class JenkinsSystemCollector(BaseCollector):
             basic_info = response
 
             # Get version from headers
-            version = self.session.get(f"{self.url}").headers.get('X-Jenkins', 'Unknown')
+            version = self.fetch_jenkins_version()
 
             # Prepare system info dictionary
             system_info = {
@@ -40,13 +40,13 @@ class JenkinsSystemCollector(BaseCollector):
                 'primaryView': basic_info.get('primaryView', {}).get('name', 'Unknown'),
             }
 
-            # Get more system details from the system info page
-            response = self.fetch_jenkins_data("systemInfo")
-            if "error" not in response and "html" in response:
-                html = response["content"]
+            # Get more system details from the system info page (parsed once per run)
+            response = self.fetch_system_info()
+            if "error" not in response:
+                properties = response["properties"]
 
-                # Extract key properties using regex
-                properties = {
+                # Look up key properties
+                wanted = {
                     'javaVersion': 'java.runtime.version',
                     'osName': 'os.name',
                     'osVersion': 'os.version',
@@ -55,8 +55,8 @@ class JenkinsSystemCollector(BaseCollector):
                     'timezone': 'user.timezone',
                 }
 
-                for key, prop in properties.items():
-                    system_info[key] = self.extract_property(html, prop)
+                for key, prop in wanted.items():
+                    system_info[key] = self.extract_property(properties, prop)
 
                 # Try to get uptime
                 system_info['uptime'] = self._extract_uptime()
@@ -84,16 +84,12 @@ class JenkinsUsersCollector(BaseCollector):
                     return users
 
         # If all API attempts fail, try to extract from HTML
-        try:
-            response = self.session.get(f"{self.url}manage/securityRealm/")
-            if response.status_code == 200:
-                html = response.text
-                # Very basic regex to find users
-                user_matches = re.findall(r'user-([^"]+)"[^>]*>([^<]+)<', html)
-                if user_matches:
-                    return [{"id": user_id, "name": user_name} for user_id, user_name in user_matches]
-        except Exception:
-            pass
+        response = self.fetch_jenkins_data("manage/securityRealm/")
+        if "html" in response:
+            # Very basic regex to find users
+            user_matches = re.findall(r'user-([^"]+)"[^>]*>([^<]+)<', response["content"])
+            if user_matches:
+                return [{"id": user_id, "name": user_name} for user_id, user_name in user_matches]
 
         return []
 
@@ -116,44 +112,27 @@ class JenkinsUsersCollector(BaseCollector):
         except Exception:
             pass
 
-        if not ldap_config['configured']:
-            # If not found through API, try to check security configuration page
-            try:
-                response = self.session.get(f"{self.url}manage/configureSecurity/")
-                if response.status_code == 200 and "LDAP" in response.text:
-                    ldap_config['configured'] = True
-            except Exception:
-                pass
+        # The security configuration page is fetched and parsed once per run
+        response = self.fetch_config_page("manage/configureSecurity/")
+        page = response.get("page")
 
-        # If LDAP is configured, try to get details
-        if ldap_config['configured']:
-            # Try to get LDAP settings from configureSecurity page
-            try:
-                response = self.session.get(f"{self.url}manage/configureSecurity/")
-                if response.status_code == 200:
-                    html = response.text
-
-                    # Extract server URL
-                    server_match = re.search(r'name="_.?server"[^>]*value="([^"]+)"', html)
-                    if server_match:
-                        ldap_config['settings']['server'] = server_match.group(1)
-
-                    # Extract root DN
-                    root_dn_match = re.search(r'name="_.?rootDN"[^>]*value="([^"]+)"', html)
-                    if root_dn_match:
-                        ldap_config['settings']['root_dn'] = root_dn_match.group(1)
-
-                    # Extract user search base
-                    user_search_match = re.search(r'name="_.?userSearchBase"[^>]*value="([^"]+)"', html)
-                    if user_search_match:
-                        ldap_config['settings']['user_search_base'] = user_search_match.group(1)
-
-                    # Extract group search base
-                    group_search_match = re.search(r'name="_.?groupSearchBase"[^>]*value="([^"]+)"', html)
-                    if group_search_match:
-                        ldap_config['settings']['group_search_base'] = group_search_match.group(1)
-            except Exception:
-                pass
+        if not ldap_config['configured']:
+            # If not found through API, check the security configuration page
+            if page is not None and page.contains("LDAP"):
+                ldap_config['configured'] = True
+
+        # If LDAP is configured, read its settings from the form fields
+        if ldap_config['configured'] and page is not None:
+            ldap_fields = [
+                ('server', 'server'),
+                ('root_dn', 'rootDN'),
+                ('user_search_base', 'userSearchBase'),
+                ('group_search_base', 'groupSearchBase')
+            ]
+            for key, field_name in ldap_fields:
+                value = page.field(field_name)
+                if value:
+                    ldap_config['settings'][key] = value
 
         return ldap_config
 
@@ -194,28 +173,22 @@ class JenkinsUsersCollector(BaseCollector):
         # If we couldn't get from API, try to extract from HTML
         if permissions_config['strategy'] == 'Unknown' or not permissions_config['matrix']:
             try:
-                response = self.session.get(f"{self.url}manage/configureSecurity/")
-                if response.status_code == 200:
-                    html = response.text
+                response = self.fetch_config_page("manage/configureSecurity/")
+                if "error" not in response:
+                    page = response["page"]
 
                     # Check for Matrix Authorization
-                    if "Matrix Authorization" in html:
+                    if page.contains("Matrix Authorization"):
                         permissions_config['strategy'] = "Matrix Authorization"
-                    elif "Project-based Matrix" in html:
+                    elif page.contains("Project-based Matrix"):
                         permissions_config['strategy'] = "Project-based Matrix Authorization"
-                    elif "Role-Based Strategy" in html:
+                    elif page.contains("Role-Based Strategy"):
                         permissions_config['strategy'] = "Role-based Authorization"
 
-                    # Try to find users and their permissions
-                    # This is complex to extract from HTML without proper parsing
-                    # Just extract user list from the matrix
-                    users = set()
-                    user_matches = re.findall(r'row-group-(\w+)"', html)
-                    if user_matches:
-                        for user in user_matches:
-                            users.add(user)
-
-                        permissions_config['matrix']['users'] = list(users)
+                    # Just extract the user list from the matrix rows' classes
+                    users = [name[len('row-group-'):] for name in page.class_names('row-group-')]
+                    if users:
+                        permissions_config['matrix']['users'] = users
             except Exception:
                 pass
 
@@ -7,6 +7,9 @@ This module displays build durations and frequencies.
 from tabulate import tabulate
 from utils.formatting import Colors, format_subheader, format_duration
 
+# Days shown in the builds per day table
+DAILY_BUILDS_SHOWN = 14
+
 def display_build_durations(info):
     """
     Display jobs with longest build durations
@@ -35,6 +38,7 @@ def display_build_durations(info):
         min_duration = format_duration(job.get('min_duration', 0))
         max_duration = format_duration(job.get('max_duration', 0))
         last_duration = format_duration(job.get('last_duration', 0))
+        p90_duration = format_duration(job.get('p90_duration'))
 
         # Format trend with color and arrow
         trend = job.get('trend', 0)
@@ -52,6 +56,7 @@ def display_build_durations(info):
             avg_duration,
             min_duration,
             max_duration,
+            p90_duration,
             last_duration,
             trend_str
         ])
@@ -60,10 +65,25 @@ def display_build_durations(info):
     print(format_subheader("Build Duration Table (Jobs with Longest Builds)"))
     print(tabulate(
         table_data,
-        headers=['Job Name', 'Average', 'Shortest', 'Longest', 'Last Build', 'Trend'],
+        headers=['Job Name', 'Average', 'Shortest', 'Longest', 'p90', 'Last Build', 'Trend'],
         tablefmt='grid'
     ))
 
+    # Percentiles over every build of every job
+    percentiles = info.get('duration_percentiles', {})
+    if percentiles:
+        print(format_subheader(f"Build Duration Percentiles ({info.get('total_builds_analyzed', 0)} builds)"))
+        print(tabulate(
+            [[name, format_duration(value)] for name, value in percentiles.items()],
+            headers=['Percentile', 'Duration'],
+            tablefmt='grid'
+        ))
+
+    # Builds skipped because more arrived between runs than could be fetched
+    gap_jobs = info.get('jobs_with_history_gaps', 0)
+    if gap_jobs:
+        print(f"\n{Colors.WARNING}{gap_jobs} job(s) have builds missing from the local build history{Colors.RESET}")
+
     return True
 
 def display_build_frequencies(info):
@@ -115,4 +135,30 @@ def display_build_frequencies(info):
         tablefmt='grid'
     ))
 
+    # Builds per day across all jobs, most recent days first
+    daily_builds = info.get('daily_builds', [])[-DAILY_BUILDS_SHOWN:]
+    if daily_builds:
+        daily_data = []
+        for day in reversed(daily_builds):
+            failures = day.get('failures', 0)
+            daily_data.append([
+                day.get('date', 'Unknown'),
+                day.get('builds', 0),
+                f"{Colors.STATUS_FAILED}{failures}{Colors.RESET}" if failures else failures,
+                format_duration(day.get('avg_duration')) if day.get('avg_duration') is not None else 'N/A',
+                f"{day.get('builds_moving_avg', 0):.1f}"
+            ])
+
+        print(format_subheader(f"Builds per Day (Last {len(daily_builds)} Days)"))
+        print(tabulate(
+            daily_data,
+            headers=['Date', 'Builds', 'Failures', 'Avg Duration', '7-Day Avg'],
+            tablefmt='grid'
+        ))
+
+    # Builds skipped because more arrived between runs than could be fetched
+    gap_jobs = info.get('jobs_with_history_gaps', 0)
+    if gap_jobs:
+        print(f"\n{Colors.WARNING}{gap_jobs} job(s) have builds missing from the local build history{Colors.RESET}")
+
     return True
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Jenkins Fleet Display Module
+This module displays aggregated information across several Jenkins controllers.
+"""
+
+from tabulate import tabulate
+from utils.formatting import Colors, format_subheader, format_timestamp
+
+def display_fleet_summary(info):
+    """
+    Display per-controller rows, fleet totals, failing jobs and plugin skew
+
+    Args:
+        info (dict): Fleet information from utils.federation.aggregate_fleet
+
+    Returns:
+        bool: Success status
+    """
+    if not info or "error" in info:
+        print(f"{Colors.ERROR}Error: {info.get('error', 'Unknown error aggregating fleet information')}{Colors.RESET}")
+        return False
+
+    # One row per controller
+    controller_rows = []
+    for row in info.get('controllers', []):
+        if 'error' in row:
+            controller_rows.append([row['controller'], row.get('version', 'Unknown'),
+                                    f"{Colors.ERROR}{row['error']}{Colors.RESET}", '', '', '', ''])
+            continue
+
+        offline = row.get('nodes_offline', 0)
+        failing = row.get('failing_jobs', 0)
+        controller_rows.append([
+            row['controller'],
+            row.get('version', 'Unknown'),
+            row.get('nodes', 'N/A'),
+            f"{Colors.WARNING}{offline}{Colors.RESET}" if offline else offline,
+            f"{row.get('busy_executors', 0)}/{row.get('total_executors', 0)}",
+            f"{Colors.ERROR}{failing}/{row.get('jobs', 0)}{Colors.RESET}" if failing else f"0/{row.get('jobs', 0)}",
+            row.get('queue_items', 'N/A')
+        ])
+
+    print(format_subheader("Controllers"))
+    print(tabulate(
+        controller_rows,
+        headers=['Controller', 'Version', 'Nodes', 'Offline', 'Busy/Total Executors', 'Failing/Total Jobs', 'Queue'],
+        tablefmt='grid'
+    ))
+
+    # Fleet totals
+    totals = info.get('totals', {})
+    total_executors = totals.get('total_executors', 0)
+    utilization = (totals.get('busy_executors', 0) / total_executors * 100) if total_executors else 0
+    totals_table = [
+        ['Controllers Reachable', f"{totals.get('reachable', 0)}/{totals.get('controllers', 0)}"],
+        ['Nodes (Online/Offline)', f"{totals.get('nodes', 0)} ({totals.get('nodes_online', 0)}/{totals.get('nodes_offline', 0)})"],
+        ['Executors (Busy/Idle)', f"{total_executors} ({totals.get('busy_executors', 0)}/{totals.get('idle_executors', 0)})"],
+        ['Executor Utilization', f"{utilization:.1f}%"],
+        ['Jobs', totals.get('jobs', 0)],
+        ['Failing Jobs', totals.get('failing_jobs', 0)],
+        ['Items in Queue', totals.get('queue_items', 0)]
+    ]
+
+    print(format_subheader("Fleet Totals"))
+    print(tabulate(totals_table, headers=['Metric', 'Value'], tablefmt='grid'))
+
+    # Failing jobs across all controllers
+    failing_jobs = info.get('failing_jobs', [])
+    if failing_jobs:
+        print(format_subheader(f"Failing Jobs Across the Fleet ({len(failing_jobs)} jobs)"))
+        print(tabulate(
+            [[job['controller'], job['name'], job['last_build'],
+              format_timestamp(job['last_build_time']) if job['last_build_time'] else 'N/A'] for job in failing_jobs],
+            headers=['Controller', 'Job Name', 'Last Build', 'Last Build Time'],
+            tablefmt='grid'
+        ))
+    else:
+        print(f"\n{Colors.STATUS_SUCCESS}No failing jobs across the fleet{Colors.RESET}")
+
+    # Plugins running different versions on different controllers
+    plugin_skew = info.get('plugin_skew', [])
+    if plugin_skew:
+        skew_rows = []
+        for plugin in plugin_skew:
+            by_version = {}
+            for controller, version in plugin['versions'].items():
+                by_version.setdefault(version, []).append(controller)
+            skew_rows.append([
+                plugin['plugin'],
+                "\n".join(f"{version}: {', '.join(controllers)}" for version, controllers in sorted(by_version.items()))
+            ])
+
+        print(format_subheader(f"Plugin Version Skew ({len(plugin_skew)} plugins)"))
+        print(tabulate(skew_rows, headers=['Plugin', 'Versions (Controllers)'], tablefmt='grid'))
+    else:
+        print(f"\n{Colors.STATUS_SUCCESS}All controllers run the same plugin versions{Colors.RESET}")
+
+    return True
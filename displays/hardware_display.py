@@ -5,7 +5,7 @@ This module displays hardware information about Jenkins nodes.
 """
 
 from tabulate import tabulate
-from utils.formatting import Colors, format_subheader, format_percentage
+from utils.formatting import Colors, format_subheader, format_percentage, format_size
 
 def display_hardware_summary(info):
     """
@@ -30,8 +30,8 @@ def display_hardware_summary(info):
         ['Online Nodes', summary.get('online_nodes', 0)],
         ['Offline Nodes', summary.get('offline_nodes', 0)],
         ['Total CPU Cores', summary.get('total_cpu_cores', 0)],
-        ['Total Memory', summary.get('total_memory_formatted', 'Unknown')],
-        ['Total Disk Space', summary.get('total_disk_space_formatted', 'Unknown')]
+        ['Total Memory', format_size(summary.get('total_memory'))],
+        ['Total Disk Space', format_size(summary.get('total_disk_space'))]
     ]
 
     print(format_subheader("Jenkins Hardware Summary"))
@@ -54,15 +54,15 @@ def display_hardware_summary(info):
             status_str = f"{Colors.STATUS_OFFLINE}Offline{Colors.RESET}"
 
         # Format memory usage with color
-        memory_usage = node.get('memory_usage_percent', 'Unknown')
-        if memory_usage != 'Unknown':
+        memory_usage = node.get('memory_usage_percent')
+        if memory_usage is not None:
             memory_usage_str = format_percentage(memory_usage, reverse=True)
         else:
             memory_usage_str = 'Unknown'
 
         # Format disk usage with color
-        disk_usage = node.get('disk_usage_percent', 'Unknown')
-        if disk_usage != 'Unknown':
+        disk_usage = node.get('disk_usage_percent')
+        if disk_usage is not None:
             disk_usage_str = format_percentage(disk_usage, reverse=True)
         else:
             disk_usage_str = 'Unknown'
@@ -70,13 +70,13 @@ def display_hardware_summary(info):
         node_data.append([
             node.get('name', 'Unknown'),
             status_str,
-            node.get('cpu_cores', 'Unknown'),
-            node.get('cpu_load', 'Unknown'),
-            node.get('memory_total', 'Unknown'),
+            node['cpu_cores'] if node.get('cpu_cores') is not None else 'Unknown',
+            f"{node['cpu_load']:.2f}" if node.get('cpu_load') is not None else 'Unknown',
+            format_size(node.get('memory_total')),
             memory_usage_str,
-            node.get('disk_space', 'Unknown'),
+            format_size(node.get('disk_space')),
             disk_usage_str,
-            node.get('response_time', 'Unknown'),
+            f"{node['response_time']:.2f} ms" if node.get('response_time') is not None else 'Unknown',
         ])
 
     # Sort by status first (online nodes first) then by name
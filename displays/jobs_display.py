@@ -5,7 +5,7 @@ This module displays detailed Jenkins jobs information.
 """
 
 from tabulate import tabulate
-from utils.formatting import Colors, format_subheader, format_status, format_percentage
+from utils.formatting import Colors, format_subheader, format_status, format_percentage, format_duration, format_timestamp
 
 def display_jobs_overview(info):
     """
@@ -48,10 +48,10 @@ def display_jobs_overview(info):
         table_data.append([
             job.get('name', 'Unknown'),
             format_status(job.get('color', 'Unknown')),
-            job.get('lastBuildNumber', 'N/A'),
-            job.get('lastBuildTime', 'N/A'),
-            job.get('lastBuildResult', 'N/A'),
-            job.get('lastBuildDuration', 'N/A')
+            job.get('last_build_number', 'N/A'),
+            format_timestamp(job['last_build_timestamp']) if job.get('last_build_timestamp') else 'N/A',
+            job.get('last_build_result', 'N/A'),
+            format_duration(job['last_build_duration']) if job.get('last_build_duration') else 'N/A'
         ])
 
     # Sort by status and then by name
@@ -151,10 +151,10 @@ def display_recent_builds(info):
 
         table_data.append([
             build.get('job_name', 'Unknown'),
-            build.get('build_number', 'N/A'),
+            build.get('number', 'N/A'),
             result_str,
-            build.get('timestamp', 'N/A'),
-            build.get('duration', 'N/A')
+            format_timestamp(build['timestamp']) if build.get('timestamp') else 'N/A',
+            format_duration(build['duration']) if build.get('duration') else 'N/A'
         ])
 
     print(format_subheader("Recent Builds"))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Jenkins Metrics Display Module
+This module turns collector results into OpenMetrics families for scraping.
+"""
+
+from utils.metrics import MetricFamily, gauge, gauge_histogram
+
+# Upper bounds (seconds) of the queue wait-time histogram buckets
+QUEUE_WAIT_BUCKETS = (10, 30, 60, 300, 900, 1800, 3600, 14400)
+
+GB = 1024 ** 3
+
+def _ok(info):
+    return isinstance(info, dict) and "error" not in info
+
+def _label(text):
+    return text.lower().replace(' ', '_')
+
+def build_metric_families(results):
+    """
+    Build metric families from collector results
+
+    Results that are missing or contain an error are skipped and reported
+    through jenkins_dashboard_collector_up.
+
+    Args:
+        results (dict): Collector results keyed by 'nodes_overview', 'executors',
+                        'queue', 'jobs_overview', 'disk', 'plugins' and 'alerts'
+
+    Returns:
+        list: MetricFamily objects
+    """
+    families = []
+    up = MetricFamily('jenkins_dashboard_collector_up', 'gauge',
+                      "Whether the collector returned data in the last refresh")
+    for name in ('nodes_overview', 'executors', 'queue', 'jobs_overview', 'disk', 'plugins', 'alerts'):
+        up.add(_ok(results.get(name)), {'collector': name})
+    families.append(up)
+
+    nodes = results.get('nodes_overview')
+    if _ok(nodes):
+        node_status = gauge('jenkins_nodes', "Nodes by status")
+        for status, count in nodes.get('status_counts', {}).items():
+            node_status.add(count, {'status': status})
+        families.append(node_status)
+
+    executors = results.get('executors')
+    if _ok(executors):
+        families.append(gauge('jenkins_executors', "Executors on online nodes by state")
+                        .add(executors.get('busy_executors', 0), {'state': 'busy'})
+                        .add(executors.get('idle_executors', 0), {'state': 'idle'}))
+
+        node_executors = gauge('jenkins_node_executors', "Executors per online node by state")
+        for node in executors.get('executor_usage', []):
+            node_executors.add(node.get('busy_executors', 0), {'node': node.get('node_name', 'Unknown'), 'state': 'busy'})
+            node_executors.add(node.get('idle_executors', 0), {'node': node.get('node_name', 'Unknown'), 'state': 'idle'})
+        families.append(node_executors)
+
+    queue = results.get('queue')
+    if _ok(queue):
+        families.append(gauge('jenkins_queue_items', "Items waiting in the build queue",
+                              queue.get('items_in_queue', 0)))
+        families.append(gauge_histogram('jenkins_queue_wait_seconds', "Time queued items have been waiting",
+                                        queue.get('wait_seconds', []), QUEUE_WAIT_BUCKETS))
+
+    jobs = results.get('jobs_overview')
+    if _ok(jobs):
+        job_status = gauge('jenkins_jobs', "Jobs by status of their last build")
+        for status, count in jobs.get('status_counts', {}).items():
+            job_status.add(count, {'status': _label(status)})
+        families.append(job_status)
+        families.append(gauge('jenkins_jobs_success_ratio', "Share of built jobs whose last build succeeded",
+                              jobs.get('success_rate', 0) / 100))
+
+    disk = results.get('disk')
+    if _ok(disk):
+        families.append(gauge('jenkins_disk_bytes', "Disk space of the controller's JENKINS_HOME volume")
+                        .add(disk.get('total_disk_gb', 0) * GB, {'kind': 'total'})
+                        .add(disk.get('used_disk_gb', 0) * GB, {'kind': 'used'})
+                        .add(disk.get('free_disk_gb', 0) * GB, {'kind': 'free'}))
+        families.append(gauge('jenkins_disk_usage_ratio', "Used share of the controller's disk",
+                              disk.get('usage_percent', 0) / 100))
+
+    plugins = results.get('plugins')
+    if _ok(plugins):
+        families.append(gauge('jenkins_plugins', "Installed plugins by state")
+                        .add(plugins.get('total_plugins', 0), {'state': 'installed'})
+                        .add(plugins.get('active_plugins', 0), {'state': 'active'}))
+        families.append(gauge('jenkins_plugin_updates_available', "Plugins with an update available",
+                              plugins.get('updates_available', 0)))
+
+    alerts = results.get('alerts')
+    if _ok(alerts):
+        families.append(gauge('jenkins_alerts', "Dashboard alerts by severity")
+                        .add(alerts.get('critical_count', 0), {'severity': 'critical'})
+                        .add(alerts.get('warning_count', 0), {'severity': 'warning'}))
+
+    return families
@@ -5,7 +5,7 @@ This module displays detailed Jenkins nodes information.
 """
 
 from tabulate import tabulate
-from utils.formatting import Colors, format_subheader
+from utils.formatting import Colors, format_subheader, format_size
 
 def display_nodes_overview(info):
     """
@@ -77,9 +77,9 @@ def display_nodes_overview(info):
             f"{node.get('busy_executors', 0)}/{node.get('num_executors', 0)}",
             utilization,
             node.get('connection_type', 'Unknown'),
-            node.get('disk_space', 'Unknown'),
+            format_size(node.get('disk_bytes')),
             node.get('os_full_name', node.get('architecture', 'Unknown')),
-            node.get('response_time', 'Unknown')
+            f"{node['response_time_ms']:.2f} ms" if node.get('response_time_ms') is not None else 'Unknown'
         ])
 
     # Sort by status (online first) and then by name
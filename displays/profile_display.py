@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Jenkins Request Profile Display Module
+This module displays the requests made during a run, as recorded by --profile.
+"""
+
+from tabulate import tabulate
+from utils.formatting import Colors, format_subheader, format_size
+
+# Number of duplicate URLs listed
+DUPLICATES_SHOWN = 15
+
+# Longest URL shown before it is shortened
+URL_WIDTH = 100
+
+def _shorten(text, width=URL_WIDTH):
+    return text if len(text) <= width else f"{text[:width - 3]}..."
+
+def display_profile(summary):
+    """
+    Display requests and bytes per collector, the slowest endpoints and duplicate URLs
+
+    Args:
+        summary (dict): Summary from utils.profiler.RequestProfiler.summary
+
+    Returns:
+        bool: Success status
+    """
+    if not summary or "error" in summary:
+        print(f"{Colors.ERROR}Error: {summary.get('error', 'Unknown error profiling requests')}{Colors.RESET}")
+        return False
+
+    totals = summary.get('totals', {})
+    totals_table = [
+        ['Requests', totals.get('requests', 0)],
+        ['Served from Local Cache', totals.get('cached', 0)],
+        ['Failed', totals.get('errors', 0)],
+        ['Bytes Received', format_size(totals.get('bytes', 0))],
+        ['Time in Requests (all threads)', f"{totals.get('request_seconds', 0):.2f}s"],
+        ['Time Decoding JSON', f"{totals.get('decode_seconds', 0):.2f}s"],
+        ['Wall Time', f"{totals.get('wall_seconds', 0):.2f}s"]
+    ]
+    print(format_subheader("Request Totals"))
+    print(tabulate(totals_table, headers=['Metric', 'Value'], tablefmt='grid'))
+
+    collector_rows = [[
+        row['collector'],
+        row['requests'],
+        row['cached'],
+        f"{Colors.ERROR}{row['errors']}{Colors.RESET}" if row['errors'] else 0,
+        format_size(row['bytes']),
+        f"{row['request_seconds']:.2f}s",
+        f"{row['decode_seconds']:.2f}s"
+    ] for row in summary.get('collectors', [])]
+    print(format_subheader("Requests per Collector"))
+    print(tabulate(collector_rows,
+                   headers=['Collector', 'Requests', 'Cached', 'Failed', 'Bytes', 'Request Time', 'JSON Decode'],
+                   tablefmt='grid'))
+
+    endpoint_rows = [[
+        _shorten(row['endpoint']),
+        row['requests'],
+        format_size(row['bytes']),
+        f"{row['total_seconds']:.2f}s",
+        f"{row['total_seconds'] / row['requests'] * 1000:.0f} ms",
+        f"{row['max_seconds'] * 1000:.0f} ms",
+        f"{row['decode_seconds']:.2f}s"
+    ] for row in summary.get('slowest_endpoints', [])]
+    print(format_subheader("Slowest Endpoints (by total time)"))
+    print(tabulate(endpoint_rows,
+                   headers=['Endpoint', 'Requests', 'Bytes', 'Total', 'Average', 'Max', 'JSON Decode'],
+                   tablefmt='grid'))
+
+    duplicates = summary.get('duplicates', [])
+    if duplicates:
+        duplicate_rows = [[
+            _shorten(row['url']),
+            f"{Colors.WARNING}{row['count']}{Colors.RESET}",
+            format_size(row['bytes']),
+            ", ".join(row['collectors'])
+        ] for row in duplicates[:DUPLICATES_SHOWN]]
+        title = f"URLs Fetched More Than Once ({len(duplicates)} URLs"
+        title += f", top {DUPLICATES_SHOWN})" if len(duplicates) > DUPLICATES_SHOWN else ")"
+        print(format_subheader(title))
+        print(tabulate(duplicate_rows, headers=['URL', 'Fetches', 'Bytes', 'Collectors'], tablefmt='grid'))
+    else:
+        print(f"\n{Colors.STATUS_SUCCESS}No URL was fetched more than once{Colors.RESET}")
+
+    return True
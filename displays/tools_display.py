@@ -114,4 +114,11 @@ def display_tools_info(info):
             print(format_subheader("Tool Usage in Jobs"))
             print(tabulate(usage_table, headers=['Tool', 'Jobs', 'Example Jobs'], tablefmt='grid'))
 
+    # Display source control systems used by jobs
+    scm_usage = info.get('scm_usage', {})
+    if scm_usage:
+        scm_table = sorted(scm_usage.items(), key=lambda item: item[1], reverse=True)
+        print(format_subheader("Source Control in Jobs"))
+        print(tabulate(scm_table, headers=['SCM', 'Jobs'], tablefmt='grid'))
+
     return True
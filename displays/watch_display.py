@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Jenkins Watch Display Module
+This module displays what changed in a section between two watch mode
+refreshes: the values that changed and only the table rows that were added,
+changed or removed.
+"""
+
+from collections.abc import Mapping
+
+from tabulate import tabulate
+from utils.formatting import Colors, format_duration, format_size, format_timestamp
+
+def _path_title(path):
+    return " / ".join(str(part).replace('_', ' ').title() for part in path) or "Result"
+
+def _format_value(key, value):
+    """Format a raw result value for a change table, guessing its unit from its key"""
+    key = str(key)
+    if value is None:
+        return "N/A"
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    if isinstance(value, (int, float)):
+        if key.endswith('_bytes'):
+            return format_size(value)
+        if key.endswith('timestamp') or (key.endswith('_time') and value > 10**11):
+            return format_timestamp(value)
+        if key.endswith('duration'):
+            return format_duration(value)
+        return f"{value:.1f}" if isinstance(value, float) else str(value)
+    if isinstance(value, Mapping):
+        return f"{len(value)} entries"
+    if isinstance(value, list):
+        return f"{len(value)} items"
+    return str(value)
+
+def display_result_changes(changes):
+    """
+    Display the changes of a section result in console tables
+
+    Args:
+        changes (dict): 'values' and 'rows' changes from ResultDiffer.update
+
+    Returns:
+        bool: Success status
+    """
+    if not changes:
+        return False
+
+    values = changes.get('values', [])
+    if values:
+        print(tabulate(
+            [[_path_title(path), _format_value(path[-1] if path else '', old),
+              _format_value(path[-1] if path else '', new)] for path, old, new in values],
+            headers=['Value', 'Before', 'Now'],
+            tablefmt='grid'
+        ))
+
+    for path, changed, removed in changes.get('rows', []):
+        print(f"\n{Colors.INFO}{_path_title(path)}:{Colors.RESET}")
+
+        if changed:
+            # Columns of every changed row, nested tables left out
+            columns = []
+            for _, row in changed:
+                for key, value in row.items():
+                    if key not in columns and not isinstance(value, (Mapping, list)):
+                        columns.append(key)
+
+            table_data = []
+            for status, row in changed:
+                color = Colors.STATUS_SUCCESS if status == "added" else Colors.WARNING
+                table_data.append([f"{color}{status}{Colors.RESET}"] +
+                                  [_format_value(key, row.get(key)) for key in columns])
+
+            print(tabulate(
+                table_data,
+                headers=['Change'] + [key.replace('_', ' ').title() for key in columns],
+                tablefmt='grid'
+            ))
+
+        for key in removed:
+            # Rows without identifying fields are keyed by their content
+            identity = ", ".join(f"{field}={value}" if field != 'row' else str(value)[:80] for field, value in key)
+            print(f"{Colors.STATUS_FAILED}removed{Colors.RESET} {identity}")
+
+    return True
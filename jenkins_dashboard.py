@@ -5,6 +5,7 @@ A comprehensive CLI dashboard for Jenkins monitoring and information display
 
 Usage:
   python jenkins_dashboard.py <jenkins_url> <username> <password> [OPTIONS]
+  python jenkins_dashboard.py --inventory <file> [OPTIONS]
 
 Options:
   --no-ssl-verify       Disable SSL certificate verification
@@ -35,10 +36,29 @@ Options:
   --node-hw             Display hardware information for nodes
   --node-sw             Display software and system information for nodes
   --all                 Display all information (default if no options specified)
+  --max-parallel N      Maximum number of collectors run concurrently with --all
+  --cache-dir DIR       Directory for the local build history, config, HTTP and session caches
+  --no-cache            Do not keep any cache between runs
+  --timeout SECONDS     Read timeout for each request to Jenkins
+  --retries N           Retries for connection errors and 502/503/504 responses
+  --watch SECONDS       Keep running, refresh each section on its own cadence and print only changes
+  --serve-metrics PORT  Serve collector results as OpenMetrics on http://HOST:PORT/metrics
+  --metrics-interval SECONDS
+                        Seconds between background metric refreshes with --serve-metrics
+  --format FORMAT       Output format: text (default), json, ndjson or csv
+  --inventory FILE      Query every controller listed in a JSON inventory file and aggregate the fleet
+  --profile             Record every request and print per-collector and per-endpoint totals at exit
+  --profile-trace FILE  Also write the recorded requests as Chrome trace events (implies --profile)
 """
 
+import os
 import sys
+import time
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
+from functools import partial
 from colorama import init
 
 # Initialize colorama
@@ -47,60 +67,94 @@ init(autoreset=True)
 # Utils imports
 from utils.formatting import Colors, format_header, format_subheader
 from utils.api_helpers import get_jenkins_api_url, extract_crumb
+from utils.scheduler import CollectorScheduler, DEFAULT_MAX_PARALLEL
+from utils.results_registry import ResultsRegistry
+from utils.cache import default_cache_dir
+from utils.build_store import BuildHistoryStore
+from utils.config_store import ConfigStore
+from utils.http_cache import HttpCache
+from utils.session_store import SessionStore
+from utils.transport import DEFAULT_POOL_SIZE, DEFAULT_READ_TIMEOUT, DEFAULT_RETRIES
+from utils.watch import CadenceTracker, ResultDiffer, capture_output
+from utils.metrics import MetricsExporter, DEFAULT_METRICS_INTERVAL
+from utils.output import StructuredWriter, STRUCTURED_FORMATS
+from utils.federation import load_inventory, aggregate_fleet
+from utils.profiler import RequestProfiler
+from utils.lazy_import import lazy_import
 
 # Client imports
 from login_client import JenkinsClient
 
 # Collector imports
-from collectors.system_collector import JenkinsSystemCollector
-from collectors.jobs_collector import JenkinsJobsCollector
-from collectors.jobs_summary_collector import JenkinsJobsStatCollector
-from collectors.nodes_collector import JenkinsNodesCollector
-from collectors.nodes_summary_collector import JenkinsNodesStatCollector
-from collectors.queue_collector import JenkinsQueueCollector
-from collectors.plugins_collector import JenkinsPluginsCollector
-from collectors.disk_collector import JenkinsDiskCollector
-from collectors.alerts_collector import JenkinsAlertsCollector
-from collectors.hardware_collector import JenkinsHardwareCollector
-from collectors.info_collector import JenkinsInfoCollector
-from collectors.os_detail_collector import JenkinsOSDetailCollector
-from collectors.labels_info_collector import JenkinsLabelsCollector
-from collectors.executor_usage_collector import JenkinsExecutorUsageCollector
-from collectors.build_stats_collector import JenkinsBuildStatsCollector
-from collectors.failed_jobs_collector import JenkinsFailedJobsCollector
-from collectors.security_collector import JenkinsSecurityCollector
-from collectors.build_artifacts_collector import JenkinsBuildArtifactsCollector
-from collectors.users_permissions_collector import JenkinsUsersCollector
-from collectors.email_notification_collector import JenkinsEmailCollector
-from collectors.tools_collector import JenkinsToolsCollector
-from collectors.notification_collector import JenkinsNotificationCollector
-from collectors.node_details_collector import JenkinsNodeDetailsCollector
-
-# Display imports
-from displays.system_display import display_system_summary
-from displays.jobs_display import display_jobs_overview, display_job_types, display_recent_builds
-from displays.jobs_summary_display import display_jobs_summary
-from displays.nodes_display import display_nodes_overview, display_node_labels_distribution
-from displays.nodes_summary_display import display_nodes_summary
-from displays.queue_display import display_queue_summary
-from displays.plugins_display import display_plugins_summary
-from displays.disk_display import display_disk_summary
-from displays.alerts_display import display_alerts
-from displays.hardware_display import display_hardware_summary
-from displays.info_display import display_jenkins_info
-from displays.os_display import display_os_distribution, display_linux_details, display_os_details_table
-from displays.os_display import display_detailed_os_distribution, display_os_distribution_summary
-from displays.labels_display import display_node_labels_table, display_label_usage
-from displays.executor_display import display_executor_usage
-from displays.build_stats_display import display_build_durations, display_build_frequencies
-from displays.failed_jobs_display import display_failed_jobs
-from displays.security_display import display_security_config
-from displays.build_artifacts_display import display_build_artifacts
-from displays.users_display import display_users_info, display_ldap_settings, display_permissions_info
-from displays.email_notification_display import display_email_settings
-from displays.tools_display import display_tools_info
-from displays.notification_display import display_notification_info
-from displays.node_details_display import display_os_details, display_hardware_details, display_software_details, display_all_node_details
+from collectors.base_collector import BaseCollector, FOLDER_FETCH_WORKERS
+
+# Collectors and displays are imported when first used, so a run only loads the
+# modules of the sections it shows
+JenkinsSystemCollector = lazy_import('collectors.system_collector', 'JenkinsSystemCollector')
+JenkinsJobsCollector = lazy_import('collectors.jobs_collector', 'JenkinsJobsCollector')
+JenkinsJobsStatCollector = lazy_import('collectors.jobs_summary_collector', 'JenkinsJobsStatCollector')
+JenkinsNodesCollector = lazy_import('collectors.nodes_collector', 'JenkinsNodesCollector')
+JenkinsNodesStatCollector = lazy_import('collectors.nodes_summary_collector', 'JenkinsNodesStatCollector')
+JenkinsQueueCollector = lazy_import('collectors.queue_collector', 'JenkinsQueueCollector')
+JenkinsPluginsCollector = lazy_import('collectors.plugins_collector', 'JenkinsPluginsCollector')
+JenkinsDiskCollector = lazy_import('collectors.disk_collector', 'JenkinsDiskCollector')
+JenkinsAlertsCollector = lazy_import('collectors.alerts_collector', 'JenkinsAlertsCollector')
+JenkinsHardwareCollector = lazy_import('collectors.hardware_collector', 'JenkinsHardwareCollector')
+JenkinsInfoCollector = lazy_import('collectors.info_collector', 'JenkinsInfoCollector')
+JenkinsOSDetailCollector = lazy_import('collectors.os_detail_collector', 'JenkinsOSDetailCollector')
+JenkinsLabelsCollector = lazy_import('collectors.labels_info_collector', 'JenkinsLabelsCollector')
+JenkinsExecutorUsageCollector = lazy_import('collectors.executor_usage_collector', 'JenkinsExecutorUsageCollector')
+JenkinsBuildStatsCollector = lazy_import('collectors.build_stats_collector', 'JenkinsBuildStatsCollector')
+JenkinsFailedJobsCollector = lazy_import('collectors.failed_jobs_collector', 'JenkinsFailedJobsCollector')
+JenkinsSecurityCollector = lazy_import('collectors.security_collector', 'JenkinsSecurityCollector')
+JenkinsBuildArtifactsCollector = lazy_import('collectors.build_artifacts_collector', 'JenkinsBuildArtifactsCollector')
+JenkinsUsersCollector = lazy_import('collectors.users_permissions_collector', 'JenkinsUsersCollector')
+JenkinsEmailCollector = lazy_import('collectors.email_notification_collector', 'JenkinsEmailCollector')
+JenkinsToolsCollector = lazy_import('collectors.tools_collector', 'JenkinsToolsCollector')
+JenkinsNotificationCollector = lazy_import('collectors.notification_collector', 'JenkinsNotificationCollector')
+JenkinsNodeDetailsCollector = lazy_import('collectors.node_details_collector', 'JenkinsNodeDetailsCollector')
+
+display_system_summary = lazy_import('displays.system_display', 'display_system_summary')
+display_jobs_overview = lazy_import('displays.jobs_display', 'display_jobs_overview')
+display_job_types = lazy_import('displays.jobs_display', 'display_job_types')
+display_recent_builds = lazy_import('displays.jobs_display', 'display_recent_builds')
+display_jobs_summary = lazy_import('displays.jobs_summary_display', 'display_jobs_summary')
+display_nodes_overview = lazy_import('displays.nodes_display', 'display_nodes_overview')
+display_node_labels_distribution = lazy_import('displays.nodes_display', 'display_node_labels_distribution')
+display_nodes_summary = lazy_import('displays.nodes_summary_display', 'display_nodes_summary')
+display_queue_summary = lazy_import('displays.queue_display', 'display_queue_summary')
+display_plugins_summary = lazy_import('displays.plugins_display', 'display_plugins_summary')
+display_disk_summary = lazy_import('displays.disk_display', 'display_disk_summary')
+display_alerts = lazy_import('displays.alerts_display', 'display_alerts')
+display_result_changes = lazy_import('displays.watch_display', 'display_result_changes')
+display_hardware_summary = lazy_import('displays.hardware_display', 'display_hardware_summary')
+display_jenkins_info = lazy_import('displays.info_display', 'display_jenkins_info')
+display_os_distribution = lazy_import('displays.os_display', 'display_os_distribution')
+display_linux_details = lazy_import('displays.os_display', 'display_linux_details')
+display_os_details_table = lazy_import('displays.os_display', 'display_os_details_table')
+display_detailed_os_distribution = lazy_import('displays.os_display', 'display_detailed_os_distribution')
+display_os_distribution_summary = lazy_import('displays.os_display', 'display_os_distribution_summary')
+display_node_labels_table = lazy_import('displays.labels_display', 'display_node_labels_table')
+display_label_usage = lazy_import('displays.labels_display', 'display_label_usage')
+display_executor_usage = lazy_import('displays.executor_display', 'display_executor_usage')
+display_build_durations = lazy_import('displays.build_stats_display', 'display_build_durations')
+display_build_frequencies = lazy_import('displays.build_stats_display', 'display_build_frequencies')
+display_failed_jobs = lazy_import('displays.failed_jobs_display', 'display_failed_jobs')
+display_security_config = lazy_import('displays.security_display', 'display_security_config')
+display_build_artifacts = lazy_import('displays.build_artifacts_display', 'display_build_artifacts')
+display_users_info = lazy_import('displays.users_display', 'display_users_info')
+display_ldap_settings = lazy_import('displays.users_display', 'display_ldap_settings')
+display_permissions_info = lazy_import('displays.users_display', 'display_permissions_info')
+display_email_settings = lazy_import('displays.email_notification_display', 'display_email_settings')
+display_tools_info = lazy_import('displays.tools_display', 'display_tools_info')
+display_notification_info = lazy_import('displays.notification_display', 'display_notification_info')
+display_os_details = lazy_import('displays.node_details_display', 'display_os_details')
+display_hardware_details = lazy_import('displays.node_details_display', 'display_hardware_details')
+display_software_details = lazy_import('displays.node_details_display', 'display_software_details')
+display_all_node_details = lazy_import('displays.node_details_display', 'display_all_node_details')
+build_metric_families = lazy_import('displays.metrics_display', 'build_metric_families')
+display_fleet_summary = lazy_import('displays.fleet_display', 'display_fleet_summary')
+display_profile = lazy_import('displays.profile_display', 'display_profile')
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -115,12 +169,16 @@ Examples:
   python jenkins_dashboard.py https://jenkins.example.com admin password --system
   python jenkins_dashboard.py https://jenkins.example.com admin password --jobs
   python jenkins_dashboard.py https://jenkins.example.com admin password --all
+  python jenkins_dashboard.py https://jenkins.example.com admin password --queue --executors --watch 10
+  python jenkins_dashboard.py https://jenkins.example.com admin password --serve-metrics 9118
+  python jenkins_dashboard.py https://jenkins.example.com admin password --jobs --format ndjson
+  python jenkins_dashboard.py --inventory controllers.json --max-parallel 16
         """
     )
 
-    parser.add_argument("url", help="Jenkins URL")
-    parser.add_argument("username", help="Jenkins username")
-    parser.add_argument("password", help="Jenkins password")
+    parser.add_argument("url", nargs="?", help="Jenkins URL")
+    parser.add_argument("username", nargs="?", help="Jenkins username")
+    parser.add_argument("password", nargs="?", help="Jenkins password")
     parser.add_argument("--no-ssl-verify", action="store_true",
                       help="Disable SSL certificate verification")
 
@@ -193,8 +251,113 @@ Examples:
     # Combined options
     parser.add_argument("--all", action="store_true",
                       help="Display all information")
+    parser.add_argument("--max-parallel", type=int, default=DEFAULT_MAX_PARALLEL, metavar="N",
+                      help=f"Maximum number of collectors run concurrently with --all (default: {DEFAULT_MAX_PARALLEL})")
+
+    # Cache options
+    parser.add_argument("--cache-dir", default=default_cache_dir(), metavar="DIR",
+                      help="Directory for the local build history, config, HTTP and session caches (default: %(default)s)")
+    parser.add_argument("--no-cache", action="store_true",
+                      help="Do not keep any cache between runs")
+
+    # Connection options
+    parser.add_argument("--timeout", type=float, default=DEFAULT_READ_TIMEOUT, metavar="SECONDS",
+                      help=f"Read timeout for each request to Jenkins (default: {DEFAULT_READ_TIMEOUT})")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, metavar="N",
+                      help=f"Retries for connection errors and 502/503/504 responses (default: {DEFAULT_RETRIES})")
+
+    # Watch mode
+    parser.add_argument("--watch", type=float, metavar="SECONDS",
+                      help="Keep running, refresh each section on its own cadence and print only changes")
+
+    # Metrics exporter mode
+    parser.add_argument("--serve-metrics", type=int, metavar="PORT",
+                      help="Serve collector results as OpenMetrics on http://HOST:PORT/metrics")
+    parser.add_argument("--metrics-interval", type=float, default=DEFAULT_METRICS_INTERVAL, metavar="SECONDS",
+                      help=f"Seconds between background metric refreshes with --serve-metrics (default: {DEFAULT_METRICS_INTERVAL})")
+
+    # Output options
+    parser.add_argument("--format", choices=('text',) + STRUCTURED_FORMATS, default='text',
+                      help="Output format: colored tables (text, default), json, ndjson or csv")
+
+    # Federation
+    parser.add_argument("--inventory", metavar="FILE",
+                      help="Query every controller listed in a JSON inventory file instead of a single URL")
+
+    # Diagnostics
+    parser.add_argument("--profile", action="store_true",
+                      help="Record every request and print requests, bytes and time per collector and endpoint at exit")
+    parser.add_argument("--profile-trace", metavar="FILE",
+                      help="Also write the recorded requests as Chrome trace events to FILE (implies --profile)")
+
+    args = parser.parse_args()
+    if args.inventory is None and not (args.url and args.username and args.password):
+        parser.error("url, username and password are required unless --inventory is given")
+    if args.inventory is not None and (args.watch is not None or args.serve_metrics is not None):
+        parser.error("--inventory cannot be combined with --watch or --serve-metrics")
+    if args.format != 'text' and (args.watch is not None or args.serve_metrics is not None):
+        parser.error("--format cannot be combined with --watch or --serve-metrics")
+    if args.watch is not None and args.watch <= 0:
+        parser.error("--watch must be greater than zero")
+    if args.metrics_interval <= 0:
+        parser.error("--metrics-interval must be greater than zero")
+    return args
+
+# Collector results shared between sections and the alerts stage
+SHARED_RESULTS = {
+    'system': lambda client: JenkinsSystemCollector(client).get_system_info(),
+    'jobs_overview': lambda client: JenkinsJobsCollector(client).get_jobs_overview(),
+    'nodes_overview': lambda client: JenkinsNodesCollector(client).get_nodes_overview(),
+    'queue': lambda client: JenkinsQueueCollector(client).get_queue_summary(),
+    'plugins': lambda client: JenkinsPluginsCollector(client).get_plugins_summary(),
+    'disk': lambda client: JenkinsDiskCollector(client).get_disk_summary(),
+}
+
+# Shared results analyzed by the alerts stage, with the analyzer method for each
+ALERT_SOURCES = [
+    ('disk', 'analyze_disk_usage'),
+    ('nodes_overview', 'analyze_nodes'),
+    ('jobs_overview', 'analyze_jobs'),
+    ('queue', 'analyze_queue'),
+    ('plugins', 'analyze_plugins'),
+    ('system', 'analyze_system'),
+]
+
+def get_shared_result(client, results, name):
+    """
+    Get a shared collector result, collecting it only if no section has yet
+
+    Args:
+        client: Authenticated JenkinsClient
+        results: ResultsRegistry for the current run
+        name: Key in SHARED_RESULTS
+
+    Returns:
+        dict: Collector result
+    """
+    return results.get_or_collect(name, partial(SHARED_RESULTS[name], client))
+
+def collect_alerts(client, results):
+    """
+    Generate alerts from the results already collected in this run
+
+    Args:
+        client: Authenticated JenkinsClient
+        results: ResultsRegistry for the current run
+
+    Returns:
+        dict: Alerts summary
+    """
+    alerts_collector = JenkinsAlertsCollector(client)
+
+    # Each source is optional; skip the ones that fail
+    for name, analyzer in ALERT_SOURCES:
+        try:
+            getattr(alerts_collector, analyzer)(get_shared_result(client, results, name))
+        except Exception:
+            pass
 
-    return parser.parse_args()
+    return alerts_collector.get_alerts_summary()
 
 def display_overview(client):
     """
@@ -205,10 +368,11 @@ def display_overview(client):
     """
     print(format_header("JENKINS DASHBOARD OVERVIEW"))
 
+    results = ResultsRegistry()
+
     # Display system information
     try:
-        system_collector = JenkinsSystemCollector(client)
-        system_info = system_collector.get_system_info()
+        system_info = get_shared_result(client, results, 'system')
         display_system_summary(system_info)
     except Exception as e:
         print(f"{Colors.ERROR}Error collecting system information: {str(e)}{Colors.RESET}")
@@ -231,24 +395,21 @@ def display_overview(client):
 
     # Display queue information
     try:
-        queue_collector = JenkinsQueueCollector(client)
-        queue_info = queue_collector.get_queue_summary()
+        queue_info = get_shared_result(client, results, 'queue')
         display_queue_summary(queue_info)
     except Exception as e:
         print(f"{Colors.ERROR}Error collecting queue information: {str(e)}{Colors.RESET}")
 
     # Display plugins information
     try:
-        plugins_collector = JenkinsPluginsCollector(client)
-        plugins_info = plugins_collector.get_plugins_summary()
+        plugins_info = get_shared_result(client, results, 'plugins')
         display_plugins_summary(plugins_info)
     except Exception as e:
         print(f"{Colors.ERROR}Error collecting plugins information: {str(e)}{Colors.RESET}")
 
     # Display disk usage information
     try:
-        disk_collector = JenkinsDiskCollector(client)
-        disk_info = disk_collector.get_disk_summary()
+        disk_info = get_shared_result(client, results, 'disk')
         display_disk_summary(disk_info)
     except Exception as e:
         print(f"{Colors.ERROR}Error collecting disk information: {str(e)}{Colors.RESET}")
@@ -276,8 +437,7 @@ def display_overview(client):
         display_os_distribution(os_info)
 
         # Display detailed OS distribution if available
-        nodes_collector = JenkinsNodesCollector(client)
-        nodes_overview = nodes_collector.get_nodes_overview()
+        nodes_overview = get_shared_result(client, results, 'nodes_overview')
         if 'os_distribution' in nodes_overview:
             display_detailed_os_distribution(nodes_overview['os_distribution'])
     except Exception as e:
@@ -291,339 +451,754 @@ def display_overview(client):
     except Exception as e:
         print(f"{Colors.ERROR}Error collecting failed jobs information: {str(e)}{Colors.RESET}")
 
-    # Generate and display alerts
+    # Generate and display alerts from the data collected above
     try:
-        alerts_collector = JenkinsAlertsCollector(client)
+        alerts_info = collect_alerts(client, results)
+        display_alerts(alerts_info)
+    except Exception as e:
+        print(f"{Colors.ERROR}Error generating alerts: {str(e)}{Colors.RESET}")
 
-        # Get data from previous collectors if available
-        try:
-            alerts_collector.analyze_disk_usage(disk_info)
-        except:
-            pass
+    print(format_header("JENKINS DASHBOARD OVERVIEW END"))
 
-        try:
-            alerts_collector.analyze_nodes(nodes_info)
-        except:
-            pass
+def _collect_users(client, results):
+    """Collect users, LDAP and permissions information"""
+    return JenkinsUsersCollector(client).get_users_info()
+
+def _display_users(users_info):
+    """Display users, LDAP and permissions information"""
+    display_users_info(users_info)
+    display_ldap_settings(users_info)
+    display_permissions_info(users_info)
+
+def _collect_job_details(client, results):
+    """Collect jobs overview, job types and recent builds"""
+    jobs_collector = JenkinsJobsCollector(client)
+    return {
+        'jobs_overview': get_shared_result(client, results, 'jobs_overview'),
+        'job_types': jobs_collector.get_job_types(),
+        'recent_builds': jobs_collector.get_recent_builds(10)
+    }
+
+def _display_job_details(details):
+    """Display jobs overview, job types and recent builds"""
+    display_jobs_overview(details['jobs_overview'])
+    display_job_types(details['job_types'])
+    display_recent_builds(details['recent_builds'])
+
+def _collect_build_stats(client, results):
+    """Collect build durations and frequencies"""
+    build_stats_collector = JenkinsBuildStatsCollector(client)
+    return {
+        'build_durations': build_stats_collector.get_build_durations(),
+        'build_frequencies': build_stats_collector.get_build_frequencies()
+    }
+
+def _display_build_stats(stats):
+    """Display build durations and frequencies"""
+    display_build_durations(stats['build_durations'])
+    display_build_frequencies(stats['build_frequencies'])
+
+def _collect_os(client, results):
+    """Collect OS distribution, detailed OS distribution and Linux details"""
+    os_collector = JenkinsOSDetailCollector(client)
+    return {
+        'os_info': os_collector.get_os_details(),
+        'nodes_overview': get_shared_result(client, results, 'nodes_overview'),
+        'linux_info': os_collector.get_linux_details()
+    }
+
+def _display_os(details):
+    """Display OS distribution, detailed OS distribution and Linux details"""
+    display_os_distribution(details['os_info'], detailed=True)
+
+    nodes_overview = details['nodes_overview']
+    if 'os_distribution' in nodes_overview:
+        display_detailed_os_distribution(nodes_overview['os_distribution'])
+
+    display_linux_details(details['linux_info'])
+    display_os_details_table(details['os_info'])
+
+def _collect_labels(client, results):
+    """Collect node labels and their usage in jobs"""
+    labels_collector = JenkinsLabelsCollector(client)
+    return {
+        'labels_info': labels_collector.get_labels_details(),
+        'labels_usage': labels_collector.get_label_usage()
+    }
+
+def _display_labels(details):
+    """Display node labels and their usage in jobs"""
+    display_node_labels_distribution(details['labels_info'])
+    display_node_labels_table(details['labels_info'])
+    display_label_usage(details['labels_usage'])
+
+# Tasks that prefetch the shared node and job snapshots for the sections using them
+NODES_SNAPSHOT_TASK = 'nodes_snapshot'
+JOBS_SNAPSHOT_TASK = 'jobs_snapshot'
+
+# Sections of the comprehensive overview, in display order.
+# Collection runs concurrently; display always follows this order.
+Section = namedtuple('Section', ['name', 'header', 'collect', 'display', 'error_message', 'depends'])
+
+COMPREHENSIVE_SECTIONS = [
+    # System Information Section
+    Section('system', "SYSTEM INFORMATION",
+            partial(get_shared_result, name='system'),
+            display_system_summary,
+            "Error collecting system information", ()),
+    Section('info', None,
+            lambda client, results: JenkinsInfoCollector(client).get_jenkins_info(),
+            display_jenkins_info,
+            "Error collecting detailed system information", ()),
+    Section('security', None,
+            lambda client, results: JenkinsSecurityCollector(client).get_security_config(),
+            display_security_config,
+            "Error collecting security information", ()),
+    Section('users', None, _collect_users, _display_users,
+            "Error collecting users information", ()),
 
-        try:
-            alerts_collector.analyze_jobs(jobs_info)
-        except:
-            pass
+    # Jobs Section
+    Section('jobs_summary', "JOBS INFORMATION",
+            lambda client, results: JenkinsJobsStatCollector(client).get_jobs_summary(),
+            display_jobs_summary,
+            "Error collecting jobs summary", (JOBS_SNAPSHOT_TASK,)),
+    Section('job_details', None, _collect_job_details, _display_job_details,
+            "Error collecting detailed jobs information", (JOBS_SNAPSHOT_TASK,)),
+    Section('failed_jobs', None,
+            lambda client, results: JenkinsFailedJobsCollector(client).get_failed_jobs(),
+            display_failed_jobs,
+            "Error collecting failed jobs information", (JOBS_SNAPSHOT_TASK,)),
+    Section('build_stats', None, _collect_build_stats, _display_build_stats,
+            "Error collecting build statistics", (JOBS_SNAPSHOT_TASK,)),
+    Section('artifacts', None,
+            lambda client, results: JenkinsBuildArtifactsCollector(client).get_build_artifacts(),
+            display_build_artifacts,
+            "Error collecting build artifacts information", (JOBS_SNAPSHOT_TASK,)),
 
-        try:
-            alerts_collector.analyze_queue(queue_info)
-        except:
-            pass
+    # Nodes Section
+    Section('nodes_summary', "NODES INFORMATION",
+            lambda client, results: JenkinsNodesStatCollector(client).get_nodes_summary(),
+            display_nodes_summary,
+            "Error collecting nodes summary", (NODES_SNAPSHOT_TASK,)),
+    Section('nodes_overview', None,
+            partial(get_shared_result, name='nodes_overview'),
+            display_nodes_overview,
+            "Error collecting detailed nodes information", (NODES_SNAPSHOT_TASK,)),
 
-        try:
-            alerts_collector.analyze_plugins(plugins_info)
-        except:
-            pass
+    # Node detailed information section
+    Section('node_details', "NODES DETAILED INFORMATION",
+            lambda client, results: JenkinsNodeDetailsCollector(client).get_all_node_details(),
+            display_all_node_details,
+            "Error collecting detailed node information", (NODES_SNAPSHOT_TASK,)),
+    Section('os', None, _collect_os, _display_os,
+            "Error collecting OS information", (NODES_SNAPSHOT_TASK,)),
+    Section('labels', None, _collect_labels, _display_labels,
+            "Error collecting labels information", (NODES_SNAPSHOT_TASK,)),
+    Section('executors', None,
+            lambda client, results: JenkinsExecutorUsageCollector(client).get_executor_usage(),
+            display_executor_usage,
+            "Error collecting executor usage information", (NODES_SNAPSHOT_TASK,)),
+    Section('hardware', None,
+            lambda client, results: JenkinsHardwareCollector(client).get_hardware_info(),
+            display_hardware_summary,
+            "Error collecting hardware information", (NODES_SNAPSHOT_TASK,)),
 
-        try:
-            alerts_collector.analyze_system(system_info)
-        except:
-            pass
+    # Infrastructure Section
+    Section('plugins', "INFRASTRUCTURE INFORMATION",
+            partial(get_shared_result, name='plugins'),
+            display_plugins_summary,
+            "Error collecting plugins information", ()),
+    Section('queue', None,
+            partial(get_shared_result, name='queue'),
+            display_queue_summary,
+            "Error collecting queue information", ()),
+    Section('disk', None,
+            partial(get_shared_result, name='disk'),
+            display_disk_summary,
+            "Error collecting disk information", (NODES_SNAPSHOT_TASK,)),
+    Section('tools', None,
+            lambda client, results: JenkinsToolsCollector(client).get_tools_info(),
+            display_tools_info,
+            "Error collecting tools information", ()),
 
-        alerts_info = alerts_collector.get_alerts_summary()
-        display_alerts(alerts_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error generating alerts: {str(e)}{Colors.RESET}")
+    # Configuration Section
+    Section('email', "CONFIGURATION INFORMATION",
+            lambda client, results: JenkinsEmailCollector(client).get_email_settings(),
+            display_email_settings,
+            "Error collecting email settings", ()),
+    Section('notifications', None,
+            lambda client, results: JenkinsNotificationCollector(client).get_notification_info(),
+            display_notification_info,
+            "Error collecting notification systems information", ()),
 
-    print(format_header("JENKINS DASHBOARD OVERVIEW END"))
+    # Alerts and Warnings
+    # Alerts are computed from the sections above instead of collecting again
+    Section('alerts', "ALERTS AND WARNINGS", collect_alerts, display_alerts,
+            "Error generating alerts",
+            ('disk', 'nodes_overview', 'job_details', 'queue', 'plugins', 'system')),
+]
+
+def add_section_tasks(scheduler, client, results, sections, prefix=''):
+    """
+    Register the tasks collecting some sections on a scheduler
+
+    The shared node and job snapshots are prefetched only when a section needs
+    them, and dependencies on sections that are not part of this run are ignored.
+
+    Args:
+        scheduler: CollectorScheduler to add the tasks to
+        client: Authenticated JenkinsClient
+        results: ResultsRegistry for the current run
+        sections: Sections to collect, in display order
+        prefix: Prefix of the task names, to register several clients on one scheduler
+
+    Returns:
+        dict: Sections by task name
+    """
+    registered = set()
+
+    needed = {dependency for section in sections for dependency in section.depends}
+    if NODES_SNAPSHOT_TASK in needed:
+        scheduler.add(prefix + NODES_SNAPSHOT_TASK, lambda: BaseCollector(client).fetch_nodes_snapshot())
+        registered.add(NODES_SNAPSHOT_TASK)
+    if JOBS_SNAPSHOT_TASK in needed:
+        scheduler.add(prefix + JOBS_SNAPSHOT_TASK, lambda: BaseCollector(client).fetch_jobs_snapshot())
+        registered.add(JOBS_SNAPSHOT_TASK)
+
+    tasks = {}
+    for section in sections:
+        depends = [prefix + dependency for dependency in section.depends if dependency in registered]
+        scheduler.add(prefix + section.name, partial(section.collect, client, results), depends=depends)
+        registered.add(section.name)
+        tasks[prefix + section.name] = section
+
+    return tasks
+
+def collect_sections(client, results, sections, max_parallel=DEFAULT_MAX_PARALLEL):
+    """
+    Collect sections concurrently
+
+    Args:
+        client: Authenticated JenkinsClient
+        results: ResultsRegistry for the current run
+        sections: Sections to collect, in display order
+        max_parallel: Maximum number of collectors running at the same time
+
+    Yields:
+        tuple: (section, result, error) in the order of sections
+    """
+    scheduler = CollectorScheduler(max_workers=max_parallel)
+    tasks = add_section_tasks(scheduler, client, results, sections)
+
+    for name, result, error in scheduler.run():
+        if name in tasks:
+            yield tasks[name], result, error
+
+def display_section(section, result, error, header=True):
+    """
+    Display a collected section, or its error message
+
+    Args:
+        section: Section that was collected
+        result: Collector result
+        error: Exception raised while collecting, or None
+        header: Whether to print the section group header
+    """
+    if header and section.header:
+        print(format_header(section.header))
+
+    if error is None:
+        try:
+            section.display(result)
+        except Exception as e:
+            error = e
+
+    if error is not None:
+        print(f"{Colors.ERROR}{section.error_message}: {str(error)}{Colors.RESET}")
 
-def display_comprehensive_overview(client):
+def display_comprehensive_overview(client, max_parallel=DEFAULT_MAX_PARALLEL):
     """
     Display a comprehensive overview of all Jenkins information
 
+    Independent sections are collected concurrently, but output is printed
+    in the usual section order.
+
     Args:
         client: Authenticated JenkinsClient
+        max_parallel: Maximum number of collectors running at the same time
     """
     print(format_header("COMPREHENSIVE JENKINS DASHBOARD"))
 
-    # System Information Section
-    print(format_header("SYSTEM INFORMATION"))
+    results = ResultsRegistry()
 
-    # Basic system information
-    try:
-        system_collector = JenkinsSystemCollector(client)
-        system_info = system_collector.get_system_info()
-        display_system_summary(system_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting system information: {str(e)}{Colors.RESET}")
+    for section, result, error in collect_sections(client, results, COMPREHENSIVE_SECTIONS, max_parallel):
+        display_section(section, result, error)
 
-    # Detailed system information
-    try:
-        info_collector = JenkinsInfoCollector(client)
-        jenkins_info = info_collector.get_jenkins_info()
-        display_jenkins_info(jenkins_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting detailed system information: {str(e)}{Colors.RESET}")
+    print(format_header("COMPREHENSIVE JENKINS DASHBOARD END"))
 
-    # Security configuration
-    try:
-        security_collector = JenkinsSecurityCollector(client)
-        security_info = security_collector.get_security_config()
-        display_security_config(security_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting security information: {str(e)}{Colors.RESET}")
+# How often (seconds) watch mode refreshes each section and shared result.
+# Anything not listed (the queue and executors) follows the --watch interval.
+WATCH_CADENCES = {
+    'nodes_summary': 30,
+    'nodes_overview': 30,
+    'alerts': 60,
+    'jobs_summary': 60,
+    'job_details': 60,
+    'jobs_overview': 60,
+    'failed_jobs': 60,
+    'build_stats': 300,
+    'artifacts': 300,
+    'disk': 300,
+    'hardware': 300,
+    'node_details': 300,
+    'os': 300,
+    'labels': 300,
+    'system': 300,
+    'info': 900,
+    'plugins': 3600,
+    'security': 3600,
+    'users': 3600,
+    'tools': 3600,
+    'email': 3600,
+    'notifications': 3600,
+}
+
+# Result fields that change on every refresh (times relative to now), left
+# out when watch mode looks for changes
+WATCH_IGNORED_FIELDS = {
+    'queue': ('avg_wait_time', 'wait_time', 'wait_seconds'),
+    'info': ('uptime', 'startupTime'),
+    'artifacts': ('age',),
+}
+
+# Sections selected by each display option (for --watch and --format)
+OPTION_SECTIONS = [
+    ('info', ['info']),
+    ('system', ['system']),
+    ('security', ['security']),
+    ('users', ['users']),
+    ('ldap', ['users']),
+    ('jobs', ['jobs_summary', 'job_details']),
+    ('failed_jobs', ['failed_jobs']),
+    ('build_stats', ['build_stats']),
+    ('artifacts', ['artifacts']),
+    ('nodes', ['nodes_summary', 'nodes_overview']),
+    ('node_details', ['node_details']),
+    ('node_os', ['node_details']),
+    ('node_hw', ['node_details']),
+    ('node_sw', ['node_details']),
+    ('os', ['os']),
+    ('os_summary', ['os']),
+    ('labels', ['labels']),
+    ('executors', ['executors']),
+    ('hardware', ['hardware']),
+    ('plugins', ['plugins']),
+    ('queue', ['queue']),
+    ('disk', ['disk']),
+    ('tools', ['tools']),
+    ('email', ['email']),
+    ('notifications', ['notifications']),
+    ('alerts', ['alerts']),
+]
+
+def select_sections(args):
+    """
+    Get the sections for the selected display options
 
-    # Users and permissions
-    try:
-        users_collector = JenkinsUsersCollector(client)
-        users_info = users_collector.get_users_info()
-        display_users_info(users_info)
-        display_ldap_settings(users_info)
-        display_permissions_info(users_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting users information: {str(e)}{Colors.RESET}")
+    Args:
+        args: Parsed command line arguments
 
-    # Jobs Section
-    print(format_header("JOBS INFORMATION"))
+    Returns:
+        list: Sections in display order (all of them if no option is selected)
+    """
+    names = set()
+    for option, section_names in OPTION_SECTIONS:
+        if getattr(args, option):
+            names.update(section_names)
 
-    # Jobs summary
-    try:
-        jobs_collector = JenkinsJobsStatCollector(client)
-        jobs_info = jobs_collector.get_jobs_summary()
-        display_jobs_summary(jobs_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting jobs summary: {str(e)}{Colors.RESET}")
+    if args.all or not names:
+        return list(COMPREHENSIVE_SECTIONS)
+    return [section for section in COMPREHENSIVE_SECTIONS if section.name in names]
 
-    # Detailed jobs information
-    try:
-        jobs_collector = JenkinsJobsCollector(client)
-        jobs_overview = jobs_collector.get_jobs_overview()
-        display_jobs_overview(jobs_overview)
+def watch_dashboard(client, sections, interval, max_parallel=DEFAULT_MAX_PARALLEL):
+    """
+    Keep refreshing sections until interrupted, printing only what changed
 
-        job_types = jobs_collector.get_job_types()
-        display_job_types(job_types)
+    Each section (and each shared result the alerts use) is refreshed on its
+    own cadence from WATCH_CADENCES, never more often than interval. The
+    first pass prints every section in full; later passes compare each
+    section's result with the previous one (leaving out WATCH_IGNORED_FIELDS)
+    and print only the values that changed and the table rows that were
+    added, changed or removed.
 
-        recent_builds = jobs_collector.get_recent_builds(10)
-        display_recent_builds(recent_builds)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting detailed jobs information: {str(e)}{Colors.RESET}")
+    Args:
+        client: Authenticated JenkinsClient
+        sections: Sections to watch, in display order
+        interval: Seconds between passes
+        max_parallel: Maximum number of collectors running at the same time
+    """
+    print(format_header("JENKINS DASHBOARD WATCH"))
+    print(f"{Colors.INFO}Refreshing every {interval:g}s, press Ctrl+C to stop{Colors.RESET}")
 
-    # Failed jobs
-    try:
-        failed_jobs_collector = JenkinsFailedJobsCollector(client)
-        failed_jobs_info = failed_jobs_collector.get_failed_jobs()
-        display_failed_jobs(failed_jobs_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting failed jobs information: {str(e)}{Colors.RESET}")
+    # Keep collector progress messages out of the watch output
+    client.debug_mode = False
+
+    results = ResultsRegistry()
+    tracker = CadenceTracker(WATCH_CADENCES, interval)
+    differ = ResultDiffer(WATCH_IGNORED_FIELDS)
+    names = [section.name for section in sections] + list(SHARED_RESULTS)
 
-    # Build statistics
     try:
-        build_stats_collector = JenkinsBuildStatsCollector(client)
-        build_durations = build_stats_collector.get_build_durations()
-        display_build_durations(build_durations)
+        while True:
+            started = time.monotonic()
+            due = tracker.due(names, started)
+
+            # Shared results that are due are collected again by whichever section asks first
+            for name in due:
+                results.discard(name)
+            client.clear_snapshots()
+
+            due_sections = [section for section in sections if section.name in due]
+            collected = []
+            if due_sections:
+                collected.extend(collect_sections(client, results, due_sections, max_parallel))
+            tracker.mark(due, started)
+
+            stamp = time.strftime("%H:%M:%S")
+            printed = 0
+            for section, result, error in collected:
+                if error is not None:
+                    result = {"error": f"{section.error_message}: {str(error)}"}
+
+                first = section.name not in differ
+                changes = differ.update(section.name, result)
+                if not first and changes is None:
+                    continue
+
+                print(format_subheader(f"[{stamp}] {section.header or section.name.replace('_', ' ').upper()}"))
+                if first:
+                    display_section(section, result, error, header=False)
+                else:
+                    display_result_changes(changes)
+                printed += 1
+
+            if collected and not printed:
+                print(f"{Colors.INFO}[{stamp}] No changes in {len(collected)} refreshed section(s){Colors.RESET}")
+
+            time.sleep(max(0, interval - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        print(format_header("JENKINS DASHBOARD WATCH END"))
+
+def write_structured_output(client, sections, output_format, stream, max_parallel=DEFAULT_MAX_PARALLEL):
+    """
+    Write section results in a machine-readable format instead of tables
 
-        build_frequencies = build_stats_collector.get_build_frequencies()
-        display_build_frequencies(build_frequencies)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting build statistics: {str(e)}{Colors.RESET}")
+    Args:
+        client: Authenticated JenkinsClient
+        sections: Sections to collect, in output order
+        output_format: One of STRUCTURED_FORMATS
+        stream: Text stream to write to
+        max_parallel: Maximum number of collectors running at the same time
+    """
+    writer = StructuredWriter(output_format, stream)
+    results = ResultsRegistry()
 
-    # Build artifacts
-    try:
-        artifacts_collector = JenkinsBuildArtifactsCollector(client)
-        artifacts_info = artifacts_collector.get_build_artifacts()
-        display_build_artifacts(artifacts_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting build artifacts information: {str(e)}{Colors.RESET}")
+    for section, result, error in collect_sections(client, results, sections, max_parallel):
+        if error is not None:
+            result = {"error": f"{section.error_message}: {str(error)}"}
+        writer.write(section.name, result)
 
-    # Nodes Section
-    print(format_header("NODES INFORMATION"))
+    writer.close()
 
-    # Nodes summary
-    try:
-        nodes_collector = JenkinsNodesStatCollector(client)
-        nodes_info = nodes_collector.get_nodes_summary()
-        display_nodes_summary(nodes_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting nodes summary: {str(e)}{Colors.RESET}")
+# Shared results exported as metrics; executors and alerts are collected on top of them
+METRIC_RESULTS = ['nodes_overview', 'queue', 'jobs_overview', 'disk', 'plugins']
 
-    # Detailed nodes information
-    try:
-        nodes_collector = JenkinsNodesCollector(client)
-        nodes_overview = nodes_collector.get_nodes_overview()
-        display_nodes_overview(nodes_overview)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting detailed nodes information: {str(e)}{Colors.RESET}")
+# Shared results using the node snapshot, which is prefetched for them
+METRIC_NODE_RESULTS = ('nodes_overview', 'disk')
 
-    # Node detailed information section
-    print(format_header("NODES DETAILED INFORMATION"))
+# How often (seconds) the metrics exporter refreshes shared results that are
+# slow to collect and change slowly. Anything not listed follows --metrics-interval.
+METRIC_CADENCES = {
+    'jobs_overview': 300,
+    'plugins': 3600,
+}
 
-    # Node OS, Hardware, and Software details
-    try:
-        node_details_collector = JenkinsNodeDetailsCollector(client)
-        node_details = node_details_collector.get_all_node_details()
-        display_all_node_details(node_details)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting detailed node information: {str(e)}{Colors.RESET}")
+def collect_metric_results(client, results, refresh, max_parallel=DEFAULT_MAX_PARALLEL):
+    """
+    Collect results for the metrics exporter
 
-    # OS information
-    try:
-        os_collector = JenkinsOSDetailCollector(client)
-        os_info = os_collector.get_os_details()
-        display_os_distribution(os_info, detailed=True)
+    Shared results are kept in results between calls; only those named in
+    refresh (and those missing or failed) are collected again.
 
-        # Display detailed OS distribution
-        nodes_collector = JenkinsNodesCollector(client)
-        nodes_overview = nodes_collector.get_nodes_overview()
-        if 'os_distribution' in nodes_overview:
-            display_detailed_os_distribution(nodes_overview['os_distribution'])
+    Args:
+        client: Authenticated JenkinsClient
+        results: ResultsRegistry kept across refreshes
+        refresh: Names of the shared results to collect again
+        max_parallel: Maximum number of collectors running at the same time
+
+    Returns:
+        dict: Collector results keyed by name; failed collectors are left out
+    """
+    for name in refresh:
+        results.discard(name)
+    client.clear_snapshots()
+
+    scheduler = CollectorScheduler(max_workers=max_parallel)
+    scheduler.add(NODES_SNAPSHOT_TASK, lambda: BaseCollector(client).fetch_nodes_snapshot())
+    for name in METRIC_RESULTS:
+        depends = (NODES_SNAPSHOT_TASK,) if name in METRIC_NODE_RESULTS else ()
+        scheduler.add(name, partial(get_shared_result, client, results, name), depends=depends)
+    scheduler.add('executors', lambda: JenkinsExecutorUsageCollector(client).get_executor_usage(),
+                  depends=(NODES_SNAPSHOT_TASK,))
+    scheduler.add('alerts', partial(collect_alerts, client, results), depends=METRIC_RESULTS)
+
+    collected = {name: result for name, result, error in scheduler.run()
+                 if error is None and name != NODES_SNAPSHOT_TASK}
+
+    # Failed results are collected again on the next refresh rather than kept
+    for name in METRIC_RESULTS:
+        if "error" in results.get(name, {}):
+            results.discard(name)
+
+    return collected
+
+def serve_metrics(client, port, interval, max_parallel=DEFAULT_MAX_PARALLEL):
+    """
+    Serve collector results as OpenMetrics until interrupted
 
-        linux_info = os_collector.get_linux_details()
-        display_linux_details(linux_info)
+    Collection runs in the background every interval seconds; scrapes get the
+    last collected values. Shared results listed in METRIC_CADENCES are only
+    collected again once their own cadence has elapsed.
 
-        display_os_details_table(os_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting OS information: {str(e)}{Colors.RESET}")
+    Args:
+        client: Authenticated JenkinsClient
+        port: TCP port to listen on
+        interval: Seconds between refreshes
+        max_parallel: Maximum number of collectors running at the same time
+    """
+    results = ResultsRegistry()
+    tracker = CadenceTracker(METRIC_CADENCES, interval)
 
-    # Labels information
-    try:
-        labels_collector = JenkinsLabelsCollector(client)
-        labels_info = labels_collector.get_labels_details()
-        display_node_labels_distribution(labels_info)
-        display_node_labels_table(labels_info)
+    def collect():
+        started = time.monotonic()
+        refresh = tracker.due(METRIC_RESULTS, started)
+        collected = collect_metric_results(client, results, refresh, max_parallel)
+        tracker.mark(refresh, started)
+        return build_metric_families(collected)
 
-        labels_usage = labels_collector.get_label_usage()
-        display_label_usage(labels_usage)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting labels information: {str(e)}{Colors.RESET}")
+    # Keep collector progress messages off the exporter console
+    client.debug_mode = False
 
-    # Executor usage
-    try:
-        executor_collector = JenkinsExecutorUsageCollector(client)
-        executor_info = executor_collector.get_executor_usage()
-        display_executor_usage(executor_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting executor usage information: {str(e)}{Colors.RESET}")
+    exporter = MetricsExporter(collect, interval)
 
-    # Hardware information
+    print(f"{Colors.INFO}Serving metrics on http://0.0.0.0:{port}/metrics, refreshing every {interval:g}s "
+          f"(press Ctrl+C to stop){Colors.RESET}")
     try:
-        hardware_collector = JenkinsHardwareCollector(client)
-        hardware_info = hardware_collector.get_hardware_info()
-        display_hardware_summary(hardware_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting hardware information: {str(e)}{Colors.RESET}")
+        exporter.serve(port)
+    except KeyboardInterrupt:
+        print(f"{Colors.INFO}Metrics server stopped{Colors.RESET}")
+    except OSError as e:
+        print(f"{Colors.ERROR}Error: could not serve metrics on port {port}: {str(e)}{Colors.RESET}")
+        sys.exit(1)
 
-    # Infrastructure Section
-    print(format_header("INFRASTRUCTURE INFORMATION"))
+def _collect_fleet_data(client, results):
+    """Collect the per-controller data aggregated into the fleet views"""
+    plugins = BaseCollector(client).fetch_snapshot("pluginManager/api/json?depth=1")
+    return {
+        'nodes_overview': get_shared_result(client, results, 'nodes_overview'),
+        'jobs_overview': get_shared_result(client, results, 'jobs_overview'),
+        'queue': get_shared_result(client, results, 'queue'),
+        'plugins': {plugin.get('shortName'): plugin.get('version', 'Unknown')
+                    for plugin in plugins.get('plugins', []) if plugin.get('shortName')}
+    }
+
+# Collected on every controller in federation mode and aggregated into the fleet views
+FLEET_SECTION = Section('fleet', None, _collect_fleet_data, None,
+                        "Error collecting fleet information", (NODES_SNAPSHOT_TASK, JOBS_SNAPSHOT_TASK))
+
+def connection_pool_size(args):
+    """Keep-alive connections per client: enough for every collector and its folder fetches"""
+    return max(DEFAULT_POOL_SIZE, args.max_parallel + FOLDER_FETCH_WORKERS)
+
+def create_client(args, skip_ssl, profiler=None):
+    """
+    Create a JenkinsClient configured from the command line
 
-    # Plugins information
-    try:
-        plugins_collector = JenkinsPluginsCollector(client)
-        plugins_info = plugins_collector.get_plugins_summary()
-        display_plugins_summary(plugins_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting plugins information: {str(e)}{Colors.RESET}")
+    Args:
+        args: Parsed command line arguments
+        skip_ssl: Whether to skip SSL certificate verification
+        profiler: Optional RequestProfiler recording the client's requests
 
-    # Queue information
-    try:
-        queue_collector = JenkinsQueueCollector(client)
-        queue_info = queue_collector.get_queue_summary()
-        display_queue_summary(queue_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting queue information: {str(e)}{Colors.RESET}")
+    Returns:
+        JenkinsClient: Client that is not logged in yet
+    """
+    client = JenkinsClient(skip_ssl_verify=skip_ssl, pool_size=connection_pool_size(args),
+                           timeout=args.timeout, retries=args.retries)
+    client.profiler = profiler
+    return client
 
-    # Disk usage information
-    try:
-        disk_collector = JenkinsDiskCollector(client)
-        disk_info = disk_collector.get_disk_summary()
-        display_disk_summary(disk_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting disk information: {str(e)}{Colors.RESET}")
+def open_local_caches(client, args):
+    """
+    Attach the persistent caches to a client unless --no-cache is given
 
-    # Tools information
-    try:
-        tools_collector = JenkinsToolsCollector(client)
-        tools_info = tools_collector.get_tools_info()
-        display_tools_info(tools_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting tools information: {str(e)}{Colors.RESET}")
+    The stores key their data by controller URL and are safe to share
+    between clients.
 
-    # Configuration Section
-    print(format_header("CONFIGURATION INFORMATION"))
+    Args:
+        client: JenkinsClient
+        args: Parsed command line arguments
+    """
+    if args.no_cache:
+        return
 
-    # Email settings
+    # Keep build history, job configs and slow-changing pages locally so later runs only fetch what changed
     try:
-        email_collector = JenkinsEmailCollector(client)
-        email_info = email_collector.get_email_settings()
-        display_email_settings(email_info)
+        client.build_store = BuildHistoryStore(os.path.join(args.cache_dir, 'builds.sqlite'))
+        client.config_store = ConfigStore(os.path.join(args.cache_dir, 'configs.sqlite'))
+        client.http_cache = HttpCache(os.path.join(args.cache_dir, 'http.sqlite'))
+        client.session_store = SessionStore(os.path.join(args.cache_dir, 'sessions.sqlite'))
     except Exception as e:
-        print(f"{Colors.ERROR}Error collecting email settings: {str(e)}{Colors.RESET}")
+        print(f"{Colors.WARNING}Local cache disabled: {str(e)}{Colors.RESET}")
+        client.build_store = client.config_store = client.http_cache = client.session_store = None
 
-    # Notification systems
-    try:
-        notification_collector = JenkinsNotificationCollector(client)
-        notification_info = notification_collector.get_notification_info()
-        display_notification_info(notification_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error collecting notification systems information: {str(e)}{Colors.RESET}")
+def run_federation(args, output_stream, profiler=None):
+    """
+    Query every controller in the inventory and display fleet-wide views
 
-    # Alerts and Warnings
-    print(format_header("ALERTS AND WARNINGS"))
+    All controllers are logged into in parallel. The selected sections of every
+    controller then run on one scheduler, so --max-parallel is a budget for
+    the whole fleet, and fan-out requests share one semaphore across clients.
 
-    # Generate and display alerts
+    Args:
+        args: Parsed command line arguments
+        output_stream: Stream for --format output
+        profiler: Optional RequestProfiler shared by every controller's client
+    """
     try:
-        alerts_collector = JenkinsAlertsCollector(client)
+        controllers = load_inventory(args.inventory, no_ssl_verify=args.no_ssl_verify)
+    except ValueError as e:
+        print(f"{Colors.ERROR}Error: {str(e)}{Colors.RESET}")
+        sys.exit(1)
 
-        # Try to get data from already collected information
-        try:
-            disk_collector = JenkinsDiskCollector(client)
-            disk_info = disk_collector.get_disk_summary()
-            alerts_collector.analyze_disk_usage(disk_info)
-        except:
-            pass
+    print(f"{Colors.INFO}Connecting to {len(controllers)} Jenkins controllers...{Colors.RESET}")
+
+    clients = []
+    for controller in controllers:
+        client = create_client(args, controller.no_ssl_verify, profiler)
+        if clients:
+            client.build_store = clients[0].build_store
+            client.config_store = clients[0].config_store
+            client.http_cache = clients[0].http_cache
+            client.session_store = clients[0].session_store
+        else:
+            open_local_caches(client, args)
+        clients.append(client)
+
+    # One budget for fan-out requests across the whole fleet
+    fetch_semaphore = threading.BoundedSemaphore(connection_pool_size(args))
+    for client in clients:
+        client.fetch_semaphore = fetch_semaphore
+
+    def login(pair):
+        controller, client = pair
+        return client.login(controller.url, controller.username, controller.password)
+
+    # Login chatter from parallel logins would interleave; report one line per controller instead
+    login_results = []
+    with ThreadPoolExecutor(max_workers=min(len(clients), max(1, args.max_parallel))) as pool:
+        capture_output(lambda: login_results.extend(pool.map(login, zip(controllers, clients))))
+
+    connected = []
+    fleet_data = []
+    for controller, client, login_result in zip(controllers, clients, login_results):
+        if login_result.get('success', False):
+            print(f"{Colors.SUCCESS}{controller.name}: connected to Jenkins {login_result.get('version', 'Unknown')}{Colors.RESET}")
+            connected.append((controller, client, login_result.get('version', 'Unknown')))
+        else:
+            print(f"{Colors.ERROR}{controller.name}: {login_result.get('message', 'Unknown login error')}{Colors.RESET}")
+            fleet_data.append((controller.name, {'error': login_result.get('message', 'Unknown login error')}))
+
+    if not connected:
+        print(f"{Colors.ERROR}Error: could not connect to any controller{Colors.RESET}")
+        sys.exit(1)
 
-        try:
-            nodes_collector = JenkinsNodesCollector(client)
-            nodes_info = nodes_collector.get_nodes_overview()
-            alerts_collector.analyze_nodes(nodes_info)
-        except:
-            pass
+    # Sections shown for each controller, plus the data behind the fleet views
+    any_option = args.all or any(getattr(args, option) for option, _ in OPTION_SECTIONS)
+    sections = (select_sections(args) if any_option else []) + [FLEET_SECTION]
+
+    scheduler = CollectorScheduler(max_workers=args.max_parallel)
+    tasks = {}
+    for controller, client, _ in connected:
+        tasks.update({name: (controller, section) for name, section in
+                      add_section_tasks(scheduler, client, ResultsRegistry(), sections,
+                                        prefix=f"{controller.name}/").items()})
+
+    versions = {controller.name: version for controller, _, version in connected}
+    writer = StructuredWriter(args.format, output_stream) if args.format != 'text' else None
+    current = None
+
+    for name, result, error in scheduler.run():
+        if name not in tasks:
+            continue
+        controller, section = tasks[name]
+
+        if section is FLEET_SECTION:
+            data = dict(result) if error is None else {'error': f"{section.error_message}: {str(error)}"}
+            data['version'] = versions[controller.name]
+            fleet_data.append((controller.name, data))
+            continue
+
+        if writer is not None:
+            if error is not None:
+                result = {"error": f"{section.error_message}: {str(error)}"}
+            writer.write(f"{controller.name}/{section.name}", result)
+            continue
+
+        if controller is not current:
+            print(format_header(f"CONTROLLER: {controller.name}"))
+            current = controller
+        display_section(section, result, error)
+
+    # Keep the fleet views in inventory order, with unreachable controllers in place
+    order = {controller.name: position for position, controller in enumerate(controllers)}
+    fleet_info = aggregate_fleet(sorted(fleet_data, key=lambda item: order[item[0]]))
+
+    if writer is not None:
+        writer.write('fleet', fleet_info)
+        writer.close()
+        return
 
-        try:
-            jobs_collector = JenkinsJobsCollector(client)
-            jobs_info = jobs_collector.get_jobs_overview()
-            alerts_collector.analyze_jobs(jobs_info)
-        except:
-            pass
+    print(format_header("JENKINS FLEET SUMMARY"))
+    display_fleet_summary(fleet_info)
+    print(format_header("JENKINS FLEET SUMMARY END"))
 
-        try:
-            queue_collector = JenkinsQueueCollector(client)
-            queue_info = queue_collector.get_queue_summary()
-            alerts_collector.analyze_queue(queue_info)
-        except:
-            pass
+def report_profile(profiler, trace_path=None):
+    """
+    Print the request profile and optionally write it as a Chrome trace
 
-        try:
-            plugins_collector = JenkinsPluginsCollector(client)
-            plugins_info = plugins_collector.get_plugins_summary()
-            alerts_collector.analyze_plugins(plugins_info)
-        except:
-            pass
+    Args:
+        profiler: RequestProfiler
+        trace_path: Chrome trace-event output file, or None
+    """
+    print(format_header("REQUEST PROFILE"))
+    display_profile(profiler.summary())
 
+    if trace_path:
         try:
-            system_collector = JenkinsSystemCollector(client)
-            system_info = system_collector.get_system_info()
-            alerts_collector.analyze_system(system_info)
-        except:
-            pass
-
-        alerts_info = alerts_collector.get_alerts_summary()
-        display_alerts(alerts_info)
-    except Exception as e:
-        print(f"{Colors.ERROR}Error generating alerts: {str(e)}{Colors.RESET}")
+            profiler.write_chrome_trace(trace_path)
+            print(f"{Colors.INFO}Chrome trace written to {trace_path}{Colors.RESET}")
+        except OSError as e:
+            print(f"{Colors.ERROR}Error: cannot write trace to {trace_path}: {str(e)}{Colors.RESET}")
 
-    print(format_header("COMPREHENSIVE JENKINS DASHBOARD END"))
-
-def main():
-    """Main entry point"""
-    # Parse command line arguments
-    args = parse_arguments()
+def run_controller(args, output_stream, profiler=None):
+    """
+    Display (or export) the selected information of a single controller
 
+    Args:
+        args: Parsed command line arguments
+        output_stream: Stream for --format output
+        profiler: Optional RequestProfiler recording the client's requests
+    """
     print(f"{Colors.INFO}Connecting to Jenkins at {args.url}...{Colors.RESET}")
 
     # Create client and login
@@ -631,7 +1206,10 @@ def main():
     if skip_ssl:
         print(f"{Colors.WARNING}SSL verification: Disabled{Colors.RESET}")
 
-    client = JenkinsClient(skip_ssl_verify=skip_ssl)
+    client = create_client(args, skip_ssl, profiler)
+
+    # Opened before login so a saved session can be reused
+    open_local_caches(client, args)
     login_result = client.login(args.url, args.username, args.password)
 
     if not login_result.get('success', False):
@@ -640,12 +1218,28 @@ def main():
 
     print(f"{Colors.SUCCESS}Successfully connected to Jenkins {login_result.get('version', 'Unknown')}{Colors.RESET}")
 
+    # Export metrics for Prometheus instead of printing the dashboard
+    if args.serve_metrics is not None:
+        serve_metrics(client, args.serve_metrics, args.metrics_interval, max_parallel=args.max_parallel)
+        return
+
+    # Keep one authenticated client and refresh sections until interrupted
+    if args.watch:
+        watch_dashboard(client, select_sections(args), args.watch, max_parallel=args.max_parallel)
+        return
+
+    # Write results for other programs instead of tables
+    if args.format != 'text':
+        write_structured_output(client, select_sections(args), args.format, output_stream,
+                                max_parallel=args.max_parallel)
+        return
+
     # Determine what information to display
     show_all = args.all
 
     # For comprehensive overview, show everything
     if show_all:
-        display_comprehensive_overview(client)
+        display_comprehensive_overview(client, max_parallel=args.max_parallel)
         return
 
     # Check if any specific options are selected
@@ -663,6 +1257,9 @@ def main():
         display_overview(client)
         return
 
+    # Results shared between the selected sections and the alerts stage
+    results = ResultsRegistry()
+
     # Show specific information based on flags
     if args.info:
         print(format_header("JENKINS INFORMATION"))
@@ -676,8 +1273,7 @@ def main():
     if args.system:
         print(format_header("JENKINS SYSTEM INFORMATION"))
         try:
-            system_collector = JenkinsSystemCollector(client)
-            system_info = system_collector.get_system_info()
+            system_info = get_shared_result(client, results, 'system')
             display_system_summary(system_info)
         except Exception as e:
             print(f"{Colors.ERROR}Error: {str(e)}{Colors.RESET}")
@@ -692,7 +1288,7 @@ def main():
 
             # Get detailed jobs information
             jobs_collector = JenkinsJobsCollector(client)
-            jobs_overview = jobs_collector.get_jobs_overview()
+            jobs_overview = get_shared_result(client, results, 'jobs_overview')
             display_jobs_overview(jobs_overview)
 
             job_types = jobs_collector.get_job_types()
@@ -712,8 +1308,7 @@ def main():
             display_nodes_summary(nodes_summary)
 
             # Get detailed nodes information
-            nodes_collector = JenkinsNodesCollector(client)
-            nodes_overview = nodes_collector.get_nodes_overview()
+            nodes_overview = get_shared_result(client, results, 'nodes_overview')
             display_nodes_overview(nodes_overview)
             display_node_labels_distribution(nodes_overview)
 
@@ -751,8 +1346,7 @@ def main():
     if args.plugins:
         print(format_header("JENKINS PLUGINS INFORMATION"))
         try:
-            plugins_collector = JenkinsPluginsCollector(client)
-            plugins_info = plugins_collector.get_plugins_summary()
+            plugins_info = get_shared_result(client, results, 'plugins')
             display_plugins_summary(plugins_info)
         except Exception as e:
             print(f"{Colors.ERROR}Error: {str(e)}{Colors.RESET}")
@@ -760,8 +1354,7 @@ def main():
     if args.queue:
         print(format_header("JENKINS QUEUE INFORMATION"))
         try:
-            queue_collector = JenkinsQueueCollector(client)
-            queue_info = queue_collector.get_queue_summary()
+            queue_info = get_shared_result(client, results, 'queue')
             display_queue_summary(queue_info)
         except Exception as e:
             print(f"{Colors.ERROR}Error: {str(e)}{Colors.RESET}")
@@ -769,8 +1362,7 @@ def main():
     if args.disk:
         print(format_header("JENKINS DISK USAGE INFORMATION"))
         try:
-            disk_collector = JenkinsDiskCollector(client)
-            disk_info = disk_collector.get_disk_summary()
+            disk_info = get_shared_result(client, results, 'disk')
             display_disk_summary(disk_info)
         except Exception as e:
             print(f"{Colors.ERROR}Error: {str(e)}{Colors.RESET}")
@@ -792,8 +1384,7 @@ def main():
             display_os_distribution(os_info, detailed=True)
 
             # Display detailed OS distribution
-            nodes_collector = JenkinsNodesCollector(client)
-            nodes_overview = nodes_collector.get_nodes_overview()
+            nodes_overview = get_shared_result(client, results, 'nodes_overview')
             if 'os_distribution' in nodes_overview:
                 display_detailed_os_distribution(nodes_overview['os_distribution'])
 
@@ -919,38 +1510,33 @@ def main():
     if args.alerts:
         print(format_header("JENKINS ALERTS AND WARNINGS"))
         try:
-            # Initialize needed collectors
-            disk_collector = JenkinsDiskCollector(client)
-            disk_info = disk_collector.get_disk_summary()
-
-            nodes_collector = JenkinsNodesCollector(client)
-            nodes_info = nodes_collector.get_nodes_overview()
-
-            jobs_collector = JenkinsJobsCollector(client)
-            jobs_info = jobs_collector.get_jobs_overview()
-
-            queue_collector = JenkinsQueueCollector(client)
-            queue_info = queue_collector.get_queue_summary()
-
-            plugins_collector = JenkinsPluginsCollector(client)
-            plugins_info = plugins_collector.get_plugins_summary()
-
-            system_collector = JenkinsSystemCollector(client)
-            system_info = system_collector.get_system_info()
-
-            # Analyze data and show alerts
-            alerts_collector = JenkinsAlertsCollector(client)
-            alerts_collector.analyze_disk_usage(disk_info)
-            alerts_collector.analyze_nodes(nodes_info)
-            alerts_collector.analyze_jobs(jobs_info)
-            alerts_collector.analyze_queue(queue_info)
-            alerts_collector.analyze_plugins(plugins_info)
-            alerts_collector.analyze_system(system_info)
-
-            alerts_info = alerts_collector.get_alerts_summary()
+            # Reuse anything the sections above already collected
+            alerts_info = collect_alerts(client, results)
             display_alerts(alerts_info)
         except Exception as e:
             print(f"{Colors.ERROR}Error: {str(e)}{Colors.RESET}")
 
+def main():
+    """Main entry point"""
+    # Parse command line arguments
+    args = parse_arguments()
+
+    # Structured output owns stdout; status messages and collector progress go to stderr
+    output_stream = sys.stdout
+    if args.format != 'text':
+        sys.stdout = sys.stderr
+
+    # Record every request and report at exit, however the run ends
+    profiler = RequestProfiler() if args.profile or args.profile_trace else None
+    try:
+        # Query a fleet of controllers from an inventory file
+        if args.inventory:
+            run_federation(args, output_stream, profiler)
+        else:
+            run_controller(args, output_stream, profiler)
+    finally:
+        if profiler is not None:
+            report_profile(profiler, args.profile_trace)
+
 if __name__ == "__main__":
     main()
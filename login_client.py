@@ -7,24 +7,58 @@ This module provides functionality to authenticate with Jenkins.
 import requests
 import urllib3
 import json
-from utils.api_helpers import get_jenkins_api_url, extract_crumb, extract_jenkins_version
+import threading
+from utils.api_helpers import get_jenkins_api_url, crumb_from_response, extract_jenkins_version
+from utils.transport import create_session, DEFAULT_POOL_SIZE, DEFAULT_READ_TIMEOUT, DEFAULT_RETRIES
+from utils.profiler import trace_request
 
 class JenkinsClient:
     """Simple Jenkins client for authentication and basic API calls"""
 
-    def __init__(self, skip_ssl_verify=True):
+    def __init__(self, skip_ssl_verify=True, pool_size=DEFAULT_POOL_SIZE,
+                 timeout=DEFAULT_READ_TIMEOUT, retries=DEFAULT_RETRIES):
         """
         Initialize Jenkins client
 
         Args:
             skip_ssl_verify: Whether to skip SSL certificate verification
+            pool_size: Number of keep-alive connections to Jenkins
+            timeout: Read timeout in seconds for each request
+            retries: Number of retries for connection errors and 502/503/504
         """
-        self.session = requests.Session()
+        self.session = create_session(pool_size=pool_size, read_timeout=timeout, retries=retries)
+
+        # Caps concurrent fan-out requests (see BaseCollector.afetch) at the pool size
+        self.fetch_semaphore = threading.BoundedSemaphore(pool_size)
         self.url = None
         self.username = None
         self.crumb = None
+        # Jenkins version from the X-Jenkins header of the login request
+        self.version = None
+        self._user_info = None
+        self._lazy_lock = threading.Lock()
         self.debug_mode = True  # Set to False in production
 
+        # Run-scoped cache of shared API responses (see BaseCollector.fetch_snapshot)
+        self.snapshots = {}
+        self.snapshot_locks = {}
+        self.snapshot_lock = threading.Lock()
+
+        # Optional persistent build history (utils.build_store.BuildHistoryStore)
+        self.build_store = None
+
+        # Optional persistent job configurations (utils.config_store.ConfigStore)
+        self.config_store = None
+
+        # Optional persistent cache of rarely changing pages (utils.http_cache.HttpCache)
+        self.http_cache = None
+
+        # Optional saved session cookies (utils.session_store.SessionStore)
+        self.session_store = None
+
+        # Optional record of every request made (utils.profiler.RequestProfiler)
+        self.profiler = None
+
         # Disable SSL verification if requested
         if skip_ssl_verify:
             self.session.verify = False
@@ -35,6 +69,12 @@ class JenkinsClient:
         """
         Login to Jenkins and return basic information
 
+        Credentials are validated with a single minimal request whose
+        X-Jenkins header gives the version; the user details and the CSRF
+        crumb are only fetched when something asks for them (see
+        get_user_info and get_crumb_header). With a session store attached,
+        the session cookies of a recent run are reused.
+
         Args:
             url: Jenkins URL
             username: Username for authentication
@@ -60,37 +100,30 @@ class JenkinsClient:
 
             # Check if we can connect
             print(f"Connecting to Jenkins at {url}")
-            response = self.session.get(f"{url}api/json")
+            restored = self._restore_session()
+            response = self._validate_login()
+
+            if restored and response.status_code in (401, 403):
+                # The saved session is no longer valid; start a new one
+                print("Saved session rejected, logging in again")
+                self._forget_session()
+                restored = False
+                response = self._validate_login()
 
             if response.status_code == 200:
-                server_info = response.json()
-                print(f"Successfully connected to Jenkins API")
-
-                # Get user info
-                user_response = self.session.get(f"{url}me/api/json")
-                if user_response.status_code == 200:
-                    user_info = user_response.json()
-                    print(f"Successfully retrieved user info for {user_info.get('fullName', username)}")
-                else:
-                    user_info = {}
-                    print(f"Failed to retrieve user info: {user_response.status_code}")
+                print(f"Successfully connected to Jenkins API{' (reused saved session)' if restored else ''}")
+                self._save_session()
 
                 # Get version from headers or API
                 jenkins_version = extract_jenkins_version(response)
+                self.version = jenkins_version
                 print(f"Jenkins version: {jenkins_version}")
 
-                # Get CSRF crumb if available
-                self.crumb = extract_crumb(self.session, self.url)
-                if self.crumb:
-                    print("Successfully obtained CSRF crumb")
-                else:
-                    print("No CSRF crumb available or couldn't retrieve it")
-
                 # Return the basic information
                 return {
                     'success': True,
                     'url': url,
-                    'user': user_info.get('fullName', username),
+                    'user': username,
                     'version': jenkins_version
                 }
             else:
@@ -107,6 +140,97 @@ class JenkinsClient:
                 'message': f"Connection error: {str(e)}"
             }
 
+    def _validate_login(self):
+        """
+        Check the credentials with the smallest API request Jenkins answers
+
+        Returns:
+            Response: Response of api/json?tree=mode
+        """
+        url = f"{self.url}api/json"
+        params = {'tree': 'mode'}
+        with trace_request(self, 'login', url, params) as span:
+            response = self.session.get(url, params=params)
+            span.set_response(response)
+        return response
+
+    def _restore_session(self):
+        """
+        Load the cookies of a recent session from the session store
+
+        Returns:
+            bool: True if saved cookies were loaded
+        """
+        if self.session_store is None:
+            return False
+
+        cookies = self.session_store.get(self.url, self.username)
+        if not cookies:
+            return False
+
+        for cookie in cookies:
+            self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'],
+                                     path=cookie['path'], secure=cookie['secure'], expires=cookie['expires'])
+        return True
+
+    def _save_session(self):
+        """Save the session cookies to the session store, if one is attached"""
+        if self.session_store is None:
+            return
+
+        cookies = [{'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain,
+                    'path': cookie.path, 'secure': cookie.secure, 'expires': cookie.expires}
+                   for cookie in self.session.cookies]
+        if cookies:
+            self.session_store.put(self.url, self.username, cookies)
+        else:
+            self.session_store.delete(self.url, self.username)
+
+    def _forget_session(self):
+        """Drop the session cookies, locally and in the session store"""
+        self.session.cookies.clear()
+        if self.session_store is not None:
+            self.session_store.delete(self.url, self.username)
+
+    def get_user_info(self):
+        """
+        Get the details of the logged-in user, fetched on first use
+
+        Returns:
+            dict: me/api/json data or empty dict if not available
+        """
+        with self._lazy_lock:
+            if self._user_info is None:
+                url = f"{self.url}me/api/json"
+                with trace_request(self, 'login', url) as span:
+                    response = self.session.get(url)
+                    span.set_response(response)
+                self._user_info = span.decode_json(response) if response.status_code == 200 else {}
+            return self._user_info
+
+    def clear_snapshots(self):
+        """Drop all cached API snapshots so the next collector run refetches them"""
+        with self.snapshot_lock:
+            self.snapshots.clear()
+            # Per-key locks would otherwise pile up across watch and metrics refreshes
+            self.snapshot_locks.clear()
+
+    def cached_get(self, url, params=None, headers=None):
+        """
+        GET a URL, going through the HTTP cache when one is configured
+
+        Args:
+            url: Full request URL
+            params: Query parameters
+            headers: Extra request headers
+
+        Returns:
+            Response (or cached equivalent)
+        """
+        if self.http_cache is None:
+            return self.session.get(url, params=params, headers=headers)
+        return self.http_cache.get(self.session, url, params=params, headers=headers, scope=self.username or '')
+
     def get_api_url(self, endpoint):
         """
         Get full API URL for the given endpoint
@@ -121,12 +245,22 @@ class JenkinsClient:
 
     def get_crumb_header(self):
         """
-        Get CSRF crumb header for POST requests
+        Get CSRF crumb header for POST requests, fetched on first use
 
         Returns:
             dict: Crumb header or empty dict if not available
         """
-        return self.crumb or {}
+        with self._lazy_lock:
+            if self.crumb is None:
+                url = self.get_api_url("crumbIssuer/api/json")
+                try:
+                    with trace_request(self, 'login', url) as span:
+                        response = self.session.get(url)
+                        span.set_response(response)
+                    self.crumb = crumb_from_response(response)
+                except requests.exceptions.RequestException:
+                    self.crumb = {}
+            return self.crumb
 
     def fetch_jenkins_data(self, endpoint, params=None):
         """
@@ -145,23 +279,22 @@ class JenkinsClient:
             print(f"Fetching data from: {url}")
 
         try:
-            # Add headers if we have a crumb
-            headers = self.get_crumb_header()
+            with trace_request(self, type(self).__name__, url, params) as span:
+                # Make the request (GETs need no CSRF crumb)
+                response = self.cached_get(url, params=params)
+                span.set_response(response)
 
-            # Make the request
-            response = self.session.get(url, params=params, headers=headers)
-
-            if response.status_code == 200:
-                # Try to parse JSON
-                try:
-                    return response.json()
-                except json.JSONDecodeError:
-                    # If not JSON, return the text content
-                    return {"content": response.text}
-            else:
-                if self.debug_mode:
-                    print(f"Error fetching {url}: HTTP {response.status_code}")
-                return {"error": f"HTTP error {response.status_code}"}
+                if response.status_code == 200:
+                    # Try to parse JSON
+                    try:
+                        return span.decode_json(response)
+                    except json.JSONDecodeError:
+                        # If not JSON, return the text content
+                        return {"content": response.text}
+                else:
+                    if self.debug_mode:
+                        print(f"Error fetching {url}: HTTP {response.status_code}")
+                    return {"error": f"HTTP error {response.status_code}"}
 
         except requests.RequestException as e:
             if self.debug_mode:
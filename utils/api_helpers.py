@@ -7,7 +7,6 @@ This module provides helper functions for working with the Jenkins API.
 import requests
 import json
 import re
-import time
 from urllib.parse import urljoin
 
 def get_jenkins_api_url(base_url, endpoint):
@@ -59,53 +58,39 @@ def handle_api_response(response):
     else:
         return {"content": response.text}
 
-def retry_api_call(func, max_retries=3, retry_delay=2, *args, **kwargs):
+def extract_crumb(session, jenkins_url):
     """
-    Retry an API call function with exponential backoff
+    Extract CSRF crumb from Jenkins for authenticated requests
 
     Args:
-        func: Function to call
-        max_retries: Maximum number of retry attempts
-        retry_delay: Initial delay between retries in seconds
-        *args, **kwargs: Arguments to pass to the function
+        session: Requests session object
+        jenkins_url: Jenkins base URL
 
     Returns:
-        Whatever the function returns
+        dict: Crumb header dict or empty dict if not available
     """
-    retries = 0
-    while retries <= max_retries:
-        try:
-            return func(*args, **kwargs)
-        except requests.exceptions.RequestException as e:
-            retries += 1
-            if retries > max_retries:
-                raise
-
-            # Calculate delay with exponential backoff
-            delay = retry_delay * (2 ** (retries - 1))
-            print(f"API call failed, retrying in {delay} seconds... ({retries}/{max_retries})")
-            time.sleep(delay)
+    try:
+        url = get_jenkins_api_url(jenkins_url, "crumbIssuer/api/json")
+        return crumb_from_response(session.get(url))
+    except Exception:
+        return {}
 
-def extract_crumb(session, jenkins_url):
+def crumb_from_response(response):
     """
-    Extract CSRF crumb from Jenkins for authenticated requests
+    Build the CSRF crumb header from a crumbIssuer/api/json response
 
     Args:
-        session: Requests session object
-        jenkins_url: Jenkins base URL
+        response: Requests response object
 
     Returns:
         dict: Crumb header dict or empty dict if not available
     """
     try:
-        url = get_jenkins_api_url(jenkins_url, "crumbIssuer/api/json")
-        response = session.get(url)
-
         if response.status_code == 200:
             data = response.json()
             if 'crumb' in data and 'crumbRequestField' in data:
                 return {data['crumbRequestField']: data['crumb']}
-    except Exception:
+    except ValueError:
         pass
 
     return {}
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Build History Store Module for Jenkins Dashboard
+This module keeps a local SQLite copy of build history so that later runs only
+need to fetch builds newer than the ones already recorded.
+"""
+
+import threading
+from collections.abc import Mapping
+from utils.cache import open_database
+from utils.records import BuildRecord
+
+class BuildHistoryStore:
+    """Persistent build history keyed by controller URL, job full name and build number"""
+
+    def __init__(self, path):
+        """
+        Open (and create if needed) the store
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = open_database(path)
+
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS builds (
+                    controller TEXT NOT NULL,
+                    job TEXT NOT NULL,
+                    number INTEGER NOT NULL,
+                    result TEXT,
+                    timestamp INTEGER,
+                    duration INTEGER,
+                    PRIMARY KEY (controller, job, number)
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    controller TEXT NOT NULL,
+                    job TEXT NOT NULL,
+                    last_number INTEGER NOT NULL,
+                    PRIMARY KEY (controller, job)
+                )
+            """)
+            # Build number ranges skipped because too many builds arrived between runs
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS gaps (
+                    controller TEXT NOT NULL,
+                    job TEXT NOT NULL,
+                    first_number INTEGER NOT NULL,
+                    last_number INTEGER NOT NULL,
+                    timestamp INTEGER,
+                    PRIMARY KEY (controller, job, first_number)
+                )
+            """)
+
+    def get_last_numbers(self, controller):
+        """
+        Get the highest fully recorded build number of every job
+
+        Args:
+            controller: Jenkins URL
+
+        Returns:
+            dict: Mapping of job full name to build number
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job, last_number FROM jobs WHERE controller = ?", (controller,)
+            ).fetchall()
+        return dict(rows)
+
+    def add_builds(self, controller, job, builds):
+        """
+        Record builds of a job and move its last recorded build number
+
+        Builds still in progress (no result yet) are stored too, but the last
+        recorded number stays below them so they are fetched again next run.
+
+        Args:
+            controller: Jenkins URL
+            job: Job full name
+            builds: BuildRecords (or dictionaries) with number, result, timestamp and duration
+        """
+        rows = [
+            (controller, job, build['number'], build.get('result'),
+             build.get('timestamp'), build.get('duration'))
+            for build in builds
+            if isinstance(build, Mapping) and isinstance(build.get('number'), int)
+        ]
+        if not rows:
+            return
+
+        running = [row[2] for row in rows if row[3] is None]
+        newest = max(row[2] for row in rows)
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO builds (controller, job, number, result, timestamp, duration) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+            if running:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO jobs (controller, job, last_number) VALUES (?, ?, ?)",
+                    (controller, job, min(running) - 1)
+                )
+            else:
+                self._conn.execute(
+                    "INSERT INTO jobs (controller, job, last_number) VALUES (?, ?, ?) "
+                    "ON CONFLICT (controller, job) DO UPDATE SET last_number = MAX(last_number, excluded.last_number)",
+                    (controller, job, newest)
+                )
+
+    def get_builds(self, controller, job, since=None, min_count=0):
+        """
+        Get recorded builds of a job, newest first
+
+        Args:
+            controller: Jenkins URL
+            job: Job full name
+            since: Return builds started at or after this time (ms since epoch);
+                   all builds when None
+            min_count: Always return at least this many of the newest builds
+
+        Returns:
+            list: BuildRecords with number, result, timestamp and duration
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT number, result, timestamp, duration FROM builds "
+                "WHERE controller = ? AND job = ? ORDER BY number DESC",
+                (controller, job)
+            ).fetchall()
+
+        builds = []
+        for index, (number, result, timestamp, duration) in enumerate(rows):
+            if index >= min_count and since is not None and (timestamp or 0) < since:
+                break
+            builds.append(BuildRecord(number, result, timestamp, duration))
+
+        return builds
+
+    def reset_job(self, controller, job):
+        """
+        Forget everything recorded for a job, such as after it was recreated
+
+        Args:
+            controller: Jenkins URL
+            job: Job full name
+        """
+        with self._lock, self._conn:
+            for table in ('builds', 'jobs', 'gaps'):
+                self._conn.execute(f"DELETE FROM {table} WHERE controller = ? AND job = ?", (controller, job))
+
+    def add_gap(self, controller, job, first_number, last_number, timestamp):
+        """
+        Record a range of builds that was never fetched
+
+        Args:
+            controller: Jenkins URL
+            job: Job full name
+            first_number: First missing build number
+            last_number: Last missing build number
+            timestamp: Start time of the build following the gap (ms since epoch);
+                       the gap is pruned with builds older than that
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO gaps (controller, job, first_number, last_number, timestamp) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (controller, job, first_number, last_number, timestamp)
+            )
+
+    def get_gaps(self, controller):
+        """
+        Get the missing build ranges of every job
+
+        Args:
+            controller: Jenkins URL
+
+        Returns:
+            dict: Mapping of job full name to (first, last) build number ranges
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job, first_number, last_number FROM gaps WHERE controller = ? "
+                "ORDER BY job, first_number", (controller,)
+            ).fetchall()
+
+        gaps = {}
+        for job, first_number, last_number in rows:
+            gaps.setdefault(job, []).append((first_number, last_number))
+        return gaps
+
+    def prune(self, controller, before, keep=0):
+        """
+        Delete builds started before a given time, except each job's newest ones
+
+        Keeping the newest builds of every job means jobs that have not been
+        built for a long time still have a history, since their recorded
+        build number stops them from being fetched again.
+
+        Args:
+            controller: Jenkins URL
+            before: Time in milliseconds since epoch
+            keep: Number of newest builds of each job kept regardless of age
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM builds WHERE rowid IN ("
+                "  SELECT rowid FROM ("
+                "    SELECT rowid, timestamp,"
+                "           ROW_NUMBER() OVER (PARTITION BY job ORDER BY number DESC) AS position"
+                "    FROM builds WHERE controller = ?"
+                "  ) WHERE position > ? AND timestamp < ?"
+                ")",
+                (controller, keep, before)
+            )
+            self._conn.execute(
+                "DELETE FROM gaps WHERE controller = ? AND timestamp < ?", (controller, before)
+            )
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
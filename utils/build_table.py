@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Build Table Module for Jenkins Dashboard
+This module keeps the build history of every job in one columnar table of
+NumPy arrays (job, number, timestamp, duration, result) and computes build
+statistics for all jobs at once with vectorized group-by operations, so
+statistics over millions of builds take seconds rather than minutes.
+
+Rows are grouped by job, in the order the jobs were given, and ordered newest
+first within each job, like the build history they are built from. Grouped
+reductions rely on that order.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+# Result column codes; builds still running (no result) are RUNNING
+RESULTS = ('SUCCESS', 'UNSTABLE', 'FAILURE', 'NOT_BUILT', 'ABORTED')
+RESULT_CODES = {result: code for code, result in enumerate(RESULTS)}
+RUNNING = -1
+
+PERCENTILES = (50, 90, 99)
+
+def _group_percentiles(groups, values, percentiles=PERCENTILES):
+    """
+    Compute percentiles of values per group (linear interpolation, as numpy.percentile)
+
+    Args:
+        groups: Group id of every value
+        values: Values
+        percentiles: Percentiles to compute (0-100)
+
+    Returns:
+        tuple: (group ids, {percentile: array of values per group id})
+    """
+    order = np.lexsort((values, groups))
+    sorted_values = values[order].astype(np.float64)
+    present, starts, counts = np.unique(groups[order], return_index=True, return_counts=True)
+
+    result = {}
+    for percentile in percentiles:
+        position = (counts - 1) * (percentile / 100)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        low_values = sorted_values[starts + lower]
+        high_values = sorted_values[starts + upper]
+        result[percentile] = low_values + (high_values - low_values) * (position - lower)
+    return present, result
+
+class BuildTable:
+    """Build history of many jobs as NumPy columns"""
+
+    def __init__(self, job_names, job_ids, ranks, numbers, timestamps, durations, results):
+        """
+        Wrap existing columns (use from_history to build a table from builds)
+
+        Args:
+            job_names: Job name of every job id
+            job_ids: Job id column (index into job_names)
+            ranks: Position of every build in its job's history, 0 for the newest
+            numbers: Build number column
+            timestamps: Start time column in milliseconds since epoch (0 if unknown)
+            durations: Duration column in milliseconds (0 if unknown)
+            results: Result code column (see RESULTS, RUNNING)
+        """
+        self.job_names = job_names
+        self.job_ids = job_ids
+        self.ranks = ranks
+        self.numbers = numbers
+        self.timestamps = timestamps
+        self.durations = durations
+        self.results = results
+
+    @classmethod
+    def from_history(cls, jobs, builds_by_job):
+        """
+        Build a table from per-job build histories
+
+        Args:
+            jobs: (key, name) pairs, key being the job's key in builds_by_job
+            builds_by_job: Mapping of job key to its BuildRecords, newest first
+
+        Returns:
+            BuildTable: Table with one row per build
+        """
+        job_names = []
+        counts = []
+        numbers = []
+        timestamps = []
+        durations = []
+        results = []
+
+        for key, name in jobs:
+            builds = builds_by_job.get(key) or []
+            job_names.append(name)
+            counts.append(len(builds))
+            for build in builds:
+                numbers.append(build.number or 0)
+                timestamps.append(build.timestamp or 0)
+                durations.append(build.duration or 0)
+                results.append(RESULT_CODES.get(build.result, RUNNING))
+
+        counts = np.array(counts, dtype=np.int64)
+        starts = np.cumsum(counts) - counts
+        job_ids = np.repeat(np.arange(len(job_names), dtype=np.int32), counts)
+
+        return cls(
+            job_names,
+            job_ids,
+            np.arange(len(job_ids), dtype=np.int64) - np.repeat(starts, counts),
+            np.array(numbers, dtype=np.int64),
+            np.array(timestamps, dtype=np.int64),
+            np.array(durations, dtype=np.int64),
+            np.array(results, dtype=np.int8)
+        )
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    def duration_stats(self, last=10):
+        """
+        Duration statistics of every job over its last builds
+
+        Builds with no duration are left out. The trend compares the average
+        of the newer half of those builds with that of the older half.
+
+        Args:
+            last: Number of newest builds of each job to look at
+
+        Returns:
+            dict: Arrays indexed like 'job_ids' (jobs with at least one
+                  duration): 'avg', 'min', 'max', 'last' (duration of the
+                  newest build), 'trend' (percent) and 'count'
+        """
+        mask = (self.ranks < last) & (self.durations > 0)
+        jobs = self.job_ids[mask]
+        values = self.durations[mask].astype(np.float64)
+        if not len(values):
+            empty = np.array([], dtype=np.float64)
+            return {'job_ids': np.array([], dtype=np.int32), 'count': np.array([], dtype=np.int64),
+                    'avg': empty, 'min': empty, 'max': empty, 'last': empty, 'trend': empty}
+
+        # Rows are grouped by job, so each job is one contiguous run
+        present, starts, counts = np.unique(jobs, return_index=True, return_counts=True)
+        sums = np.add.reduceat(values, starts)
+        group = np.repeat(np.arange(len(present)), counts)
+
+        half = counts // 2
+        newer = (np.arange(len(values)) - np.repeat(starts, counts)) < np.repeat(half, counts)
+        newer_sums = np.bincount(group, weights=np.where(newer, values, 0), minlength=len(present))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newer_avg = newer_sums / half
+            older_avg = (sums - newer_sums) / (counts - half)
+            trend = np.where((half > 0) & (newer_avg > 0), (older_avg - newer_avg) / newer_avg * 100, 0.0)
+
+        newest = self.ranks == 0
+        last_durations = np.zeros(len(self.job_names), dtype=np.float64)
+        last_durations[self.job_ids[newest]] = self.durations[newest]
+
+        return {
+            'job_ids': present,
+            'count': counts,
+            'avg': sums / counts,
+            'min': np.minimum.reduceat(values, starts),
+            'max': np.maximum.reduceat(values, starts),
+            'last': last_durations[present],
+            'trend': trend
+        }
+
+    def duration_percentiles(self, percentiles=PERCENTILES):
+        """
+        Duration percentiles of every job over all its builds
+
+        Args:
+            percentiles: Percentiles to compute (0-100)
+
+        Returns:
+            tuple: (job ids, {percentile: array of durations in ms per job id})
+        """
+        mask = self.durations > 0
+        return _group_percentiles(self.job_ids[mask], self.durations[mask], percentiles)
+
+    def overall_percentiles(self, percentiles=PERCENTILES):
+        """
+        Duration percentiles over all builds of all jobs
+
+        Args:
+            percentiles: Percentiles to compute (0-100)
+
+        Returns:
+            dict: {percentile: duration in ms}, empty if no build has a duration
+        """
+        durations = self.durations[self.durations > 0]
+        if not len(durations):
+            return {}
+        return dict(zip(percentiles, np.percentile(durations, percentiles).tolist()))
+
+    def frequency_stats(self, now):
+        """
+        Build counts of every job over the last day, week and month
+
+        The average per day is the last month's count over 30 days or, for
+        jobs not built that month, all builds over the days since the oldest.
+
+        Args:
+            now: Current time in milliseconds since epoch
+
+        Returns:
+            dict: Arrays indexed by job id: 'total', 'today', 'week', 'month'
+                  and 'avg_per_day'
+        """
+        size = len(self.job_names)
+        total = np.bincount(self.job_ids, minlength=size)
+        today = np.bincount(self.job_ids[self.timestamps >= now - DAY_MS], minlength=size)
+        week = np.bincount(self.job_ids[self.timestamps >= now - 7 * DAY_MS], minlength=size)
+        month = np.bincount(self.job_ids[self.timestamps >= now - 30 * DAY_MS], minlength=size)
+
+        # The oldest build of a job is the last row of its run
+        oldest = np.full(size, now, dtype=np.float64)
+        built = total > 0
+        ends = np.cumsum(total) - 1
+        oldest[built] = self.timestamps[ends[built]]
+        oldest[oldest <= 0] = now
+
+        days = (now - oldest) / DAY_MS
+        with np.errstate(divide='ignore', invalid='ignore'):
+            all_time = np.where(days > 0, total / days, 0.0)
+
+        return {
+            'total': total,
+            'today': today,
+            'week': week,
+            'month': month,
+            'avg_per_day': np.where(month > 0, month / 30, all_time)
+        }
+
+    def daily_histogram(self, days=30, window=7, today=None):
+        """
+        Builds, failures and average duration per calendar day
+
+        Args:
+            days: Number of days, ending today
+            window: Days in the trailing moving average of builds per day
+            today: Date of the last day (local time); today by default
+
+        Returns:
+            list: One dictionary per day, oldest first, with 'date', 'builds',
+                  'failures', 'avg_duration' (ms, None without builds) and
+                  'builds_moving_avg'
+        """
+        today = today or datetime.now().date()
+        first_date = today - timedelta(days=days - 1)
+
+        # Local midnights of each day and of the day after the range; days are
+        # 23 or 25 hours long when daylight saving time starts or ends
+        day_starts = np.array([
+            datetime.combine(first_date + timedelta(days=day), datetime.min.time()).timestamp() * 1000
+            for day in range(days + 1)
+        ])
+
+        index = np.searchsorted(day_starts, self.timestamps, side='right') - 1
+        in_range = (self.timestamps > 0) & (index >= 0) & (index < days)
+        failed = in_range & (self.results == RESULT_CODES['FAILURE'])
+        timed = in_range & (self.durations > 0)
+
+        builds = np.bincount(index[in_range], minlength=days)
+        failures = np.bincount(index[failed], minlength=days)
+        timed_builds = np.bincount(index[timed], minlength=days)
+        duration_sums = np.bincount(index[timed], weights=self.durations[timed], minlength=days)
+
+        # Trailing average, over fewer days at the start of the range
+        cumulative = np.concatenate(([0], np.cumsum(builds)))
+        positions = np.arange(days)
+        spans = np.minimum(positions + 1, window)
+        moving_avg = (cumulative[positions + 1] - cumulative[positions + 1 - spans]) / spans
+
+        return [
+            {
+                'date': (first_date + timedelta(days=day)).strftime('%Y-%m-%d'),
+                'builds': int(builds[day]),
+                'failures': int(failures[day]),
+                'avg_duration': float(duration_sums[day] / timed_builds[day]) if timed_builds[day] else None,
+                'builds_moving_avg': float(moving_avg[day])
+            }
+            for day in range(days)
+        ]
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Cache Location Module for Jenkins Dashboard
+This module decides where persistent caches are stored between runs and
+opens their databases with owner-only permissions.
+"""
+
+import os
+import sqlite3
+
+def default_cache_dir():
+    """
+    Get the default directory for persistent caches
+
+    Returns:
+        str: $XDG_CACHE_HOME/jenkins_dashboard, or ~/.cache/jenkins_dashboard
+    """
+    base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'jenkins_dashboard')
+
+def open_database(path):
+    """
+    Open (and create if needed) a SQLite database readable by the current user only
+
+    Cached responses, configs and build history can reveal as much as the
+    Jenkins pages they come from, and session cookies grant access like the
+    credentials do. A directory created for the database is made 0700 and
+    the database file 0600, including files left by earlier versions.
+
+    Args:
+        path: Path of the SQLite database file
+
+    Returns:
+        sqlite3.Connection: Connection usable from several threads
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    # Create the file with restricted permissions before SQLite opens it
+    try:
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        os.chmod(path, 0o600)
+    except OSError:
+        pass
+
+    return sqlite3.connect(path, check_same_thread=False)
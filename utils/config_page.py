@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Config Page Module for Jenkins Dashboard
+This module parses Jenkins configuration pages (configure, configureTools,
+configureSecurity) once into indexes of form fields, labels, sections, words
+and element classes, so collectors can look settings up instead of searching
+the whole page again. The raw HTML is not kept.
+"""
+
+import re
+from html.parser import HTMLParser
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'legend')
+SECTION_TITLE_CLASSES = ('section-header', 'jenkins-section__title')
+
+WORD_PATTERN = re.compile(r"\w+")
+
+def _normalize(text):
+    return " ".join(text.split()).rstrip(':').strip().lower()
+
+class ConfigPage:
+    """Indexed form of a Jenkins configuration page"""
+
+    def __init__(self, html):
+        """
+        Parse a page
+
+        Args:
+            html: Page HTML
+        """
+        # Form fields in page order: dicts with name, value and section
+        self.fields = []
+        # Visible text chunks in page order, with the number of fields before each
+        self._texts = []
+        self._label_index = {}
+        self._strings = set()
+        self._words = set()
+        self._classes = {}
+        self._fields_by_name = {}
+        self._sections = {}
+
+        parser = _ConfigPageParser(self)
+        parser.feed(html)
+        parser.close()
+
+    def contains(self, text):
+        """
+        Check whether a text node or attribute value contains some text
+
+        Args:
+            text: Text to look for (case-insensitive)
+
+        Returns:
+            bool: True if found
+        """
+        wanted = _normalize(text)
+        return any(wanted in string for string in self._strings)
+
+    def mentions(self, phrase):
+        """
+        Check whether a text node or attribute value contains a word or phrase
+        as whole words, so "IRC" does not match "circle"
+
+        Args:
+            phrase: Word or phrase to look for (case-insensitive)
+
+        Returns:
+            bool: True if found
+        """
+        wanted = _normalize(phrase)
+        words = WORD_PATTERN.findall(wanted)
+        if not words or not all(word in self._words for word in words):
+            return False
+        if len(words) == 1:
+            return True
+
+        pattern = re.compile(rf"\b{re.escape(wanted)}\b")
+        return any(pattern.search(string) for string in self._strings)
+
+    def class_names(self, prefix=""):
+        """
+        Get the CSS class names used on the page
+
+        Args:
+            prefix: Only return class names starting with this prefix
+
+        Returns:
+            list: Class names in order of first use
+        """
+        return [name for name in self._classes if name.startswith(prefix)]
+
+    def has_text(self, text):
+        """
+        Check whether a text node or attribute value equals some text
+
+        Args:
+            text: Text to look for (case and surrounding spaces are ignored)
+
+        Returns:
+            bool: True if found
+        """
+        return _normalize(text) in self._strings
+
+    def field(self, name, default=None):
+        """
+        Get the value of the first form field with a given name
+
+        The name may be the full field name or its last part without the
+        Stapler prefix, so "server" matches "_.server" and "ldap.server".
+
+        Args:
+            name: Field name
+            default: Value returned if there is no such field
+
+        Returns:
+            str: Field value or default
+        """
+        values = self._fields_by_name.get(name)
+        return values[0] if values else default
+
+    def field_values(self, name):
+        """
+        Get the values of every form field with a given name
+
+        Args:
+            name: Field name (full or last part)
+
+        Returns:
+            list: Field values in page order
+        """
+        return list(self._fields_by_name.get(name, []))
+
+    def value_after_label(self, *labels):
+        """
+        Get the value of the first field following a label text
+
+        Args:
+            labels: Label texts to try in order; an exact (case-insensitive)
+                    match is preferred, otherwise the first text containing
+                    the label is used
+
+        Returns:
+            str: Stripped field value, or None if not found
+        """
+        for label in labels:
+            wanted = _normalize(label)
+            start = self._label_index.get(wanted)
+            if start is None:
+                start = next((position for text, position in self._texts if wanted in text), None)
+            if start is None:
+                continue
+
+            for field in self.fields[start:]:
+                if field['value'] is not None:
+                    return field['value'].strip()
+        return None
+
+    def section_titles(self):
+        """
+        Get the titles of all sections
+
+        Returns:
+            list: Section titles in page order
+        """
+        return list(self._sections)
+
+    def fields_in_section(self, keyword):
+        """
+        Get the form fields of the sections whose title contains a keyword
+
+        Args:
+            keyword: Text to look for in section titles (case-insensitive)
+
+        Returns:
+            list: Field dicts with name, value and section
+        """
+        keyword = keyword.lower()
+        fields = []
+        for title, section_fields in self._sections.items():
+            if keyword in title.lower():
+                fields.extend(section_fields)
+        return fields
+
+    def _add_text(self, text):
+        normalized = _normalize(text)
+        if not normalized:
+            return
+        position = len(self.fields)
+        self._texts.append((normalized, position))
+        self._label_index.setdefault(normalized, position)
+        self._add_string(normalized)
+
+    def _add_string(self, normalized):
+        if normalized not in self._strings:
+            self._strings.add(normalized)
+            self._words.update(WORD_PATTERN.findall(normalized))
+
+    def _add_field(self, name, value, section):
+        field = {'name': name, 'value': value, 'section': section}
+        self.fields.append(field)
+
+        if section is not None:
+            self._sections.setdefault(section, []).append(field)
+
+        if name and value is not None:
+            short_name = name.split('.')[-1]
+            self._fields_by_name.setdefault(name, []).append(value)
+            if short_name != name:
+                self._fields_by_name.setdefault(short_name, []).append(value)
+
+class _ConfigPageParser(HTMLParser):
+    """Single-pass parser that fills a ConfigPage"""
+
+    def __init__(self, page):
+        super().__init__(convert_charrefs=True)
+        self.page = page
+        self.section = None
+        self._title_depth = 0
+        self._title_tag = None
+        self._title_text = []
+        self._textarea = None
+        self._select = None
+        self._skip = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self._skip = tag
+            return
+
+        attributes = dict(attrs)
+        for value in attributes.values():
+            if value:
+                self.page._add_string(_normalize(value))
+
+        # Section titles are headings or elements with a section title class
+        css_class = attributes.get('class') or ''
+        for name in css_class.split():
+            self.page._classes.setdefault(name, None)
+        if self._title_tag is None and (tag in HEADING_TAGS or
+                                        any(name in css_class for name in SECTION_TITLE_CLASSES)):
+            self._title_tag = tag
+            self._title_depth = 1
+            self._title_text = []
+        elif self._title_tag == tag:
+            self._title_depth += 1
+
+        if tag == 'input':
+            input_type = (attributes.get('type') or 'text').lower()
+            value = attributes.get('value')
+            if input_type in ('checkbox', 'radio') and 'checked' not in attributes:
+                value = None
+            self.page._add_field(attributes.get('name'), value, self.section)
+        elif tag == 'textarea':
+            self._textarea = {'name': attributes.get('name'), 'text': []}
+        elif tag == 'select':
+            self._select = {'name': attributes.get('name'), 'value': None}
+        elif tag == 'option' and self._select is not None:
+            if 'selected' in attributes or self._select['value'] is None:
+                self._select['value'] = attributes.get('value', '')
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag != 'input':
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag == self._skip:
+            self._skip = None
+            return
+
+        if tag == 'textarea' and self._textarea is not None:
+            self.page._add_field(self._textarea['name'], "".join(self._textarea['text']), self.section)
+            self._textarea = None
+        elif tag == 'select' and self._select is not None:
+            self.page._add_field(self._select['name'], self._select['value'], self.section)
+            self._select = None
+
+        if self._title_tag == tag:
+            self._title_depth -= 1
+            if self._title_depth == 0:
+                title = " ".join("".join(self._title_text).split())
+                if title:
+                    self.section = title
+                self._title_tag = None
+
+    def handle_data(self, data):
+        if self._skip is not None:
+            return
+
+        if self._textarea is not None:
+            self._textarea['text'].append(data)
+            return
+
+        if self._title_tag is not None:
+            self._title_text.append(data)
+
+        self.page._add_text(data)
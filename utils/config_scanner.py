@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Config Scanner Module for Jenkins Dashboard
+This module parses each job config.xml once with a streaming XML parser and
+hands its elements to every registered analyzer, so tool, notification, label
+and SCM usage are all collected in a single pass.
+"""
+
+import io
+import re
+import xml.etree.ElementTree as ET
+
+# Characters that separate label atoms in label expressions such as "linux && !arm"
+LABEL_SEPARATORS = re.compile(r"[\s&|!()]+")
+
+# label 'x', label("x"), node('x') in Pipeline scripts
+SCRIPT_LABEL_REFERENCE = re.compile(r"""\b(?:label|node)\s*\(?\s*(['"])(.+?)\1""")
+
+class ConfigAnalyzer:
+    """Base class for analyzers fed by ConfigScanner"""
+
+    # Key of the analyzer's result in ConfigScanner.results()
+    name = None
+
+    # Element tags the analyzer handles, or None for every element
+    tags = None
+
+    def start_job(self, job_name):
+        """Called before the elements of a job's config are handed over"""
+        self.job_name = job_name
+
+    def element(self, elem):
+        """Called for each handled element once it has been fully parsed"""
+
+    def end_job(self):
+        """Called after the last element of a job's config"""
+
+    def result(self):
+        """Return the analyzer's result"""
+        return None
+
+class KeywordAnalyzer(ConfigAnalyzer):
+    """Finds which keyword categories occur in tag names, attribute values or text"""
+
+    # Mapping of category to lowercase keywords
+    categories = {}
+
+    def __init__(self):
+        self._category_of = {}
+        for category, keywords in self.categories.items():
+            for keyword in keywords:
+                self._category_of[keyword] = category
+
+        # Longest keywords first so "node.js" is not cut short by a shorter keyword
+        keywords = sorted(self._category_of, key=len, reverse=True)
+        self._regex = re.compile("|".join(re.escape(keyword) for keyword in keywords))
+        self._found = set()
+
+    def start_job(self, job_name):
+        super().start_job(job_name)
+        self._found = set()
+
+    def element(self, elem):
+        if len(self._found) == len(self.categories):
+            return
+
+        parts = [elem.tag]
+        parts.extend(elem.attrib.values())
+        if elem.text:
+            parts.append(elem.text)
+
+        for match in self._regex.finditer(" ".join(parts).lower()):
+            self._found.add(self._category_of[match.group(0)])
+
+class ToolUsageAnalyzer(KeywordAnalyzer):
+    """Lists the jobs that reference each build tool"""
+
+    name = 'tools'
+    categories = {
+        'jdk': ('jdk',),
+        'git': ('git',),
+        'maven': ('maven',),
+        'ant': ('ant',),
+        'gradle': ('gradle',),
+        'docker': ('docker',),
+        'nodejs': ('nodejs', 'node.js'),
+        'sonarqube': ('sonar',)
+    }
+
+    def __init__(self):
+        super().__init__()
+        self._jobs = {}
+
+    def end_job(self):
+        for category in self.categories:
+            if category in self._found:
+                self._jobs.setdefault(category, []).append(self.job_name)
+
+    def result(self):
+        return self._jobs
+
+class NotificationUsageAnalyzer(KeywordAnalyzer):
+    """Counts the jobs that use each notification system"""
+
+    name = 'notifications'
+    categories = {
+        'slack': ('slack',),
+        'teams': ('teams', 'office365', 'office-365'),
+        'email': ('mailto', 'email', 'e-mail'),
+        'other': ('telegram', 'irc', 'jabber', 'xmpp', 'mattermost', 'discord', 'webhook', 'notification')
+    }
+
+    def __init__(self):
+        super().__init__()
+        self._counts = {category: 0 for category in self.categories}
+
+    def end_job(self):
+        for category in self._found:
+            self._counts[category] += 1
+
+    def result(self):
+        return self._counts
+
+class LabelUsageAnalyzer(ConfigAnalyzer):
+    """Indexes the jobs by the node labels they ask for"""
+
+    name = 'labels'
+    tags = ('assignedNode', 'label', 'script')
+
+    def __init__(self):
+        self._jobs_by_label = {}
+        self._labels = set()
+
+    def start_job(self, job_name):
+        super().start_job(job_name)
+        self._labels = set()
+
+    def element(self, elem):
+        text = elem.text or ''
+        if elem.tag == 'script':
+            expressions = [match.group(2) for match in SCRIPT_LABEL_REFERENCE.finditer(text)]
+        else:
+            expressions = [text]
+
+        for expression in expressions:
+            self._labels.update(atom for atom in LABEL_SEPARATORS.split(expression) if atom)
+
+    def end_job(self):
+        for label in self._labels:
+            self._jobs_by_label.setdefault(label, []).append(self.job_name)
+
+    def result(self):
+        return self._jobs_by_label
+
+class ScmUsageAnalyzer(ConfigAnalyzer):
+    """Counts jobs by source control system"""
+
+    name = 'scm'
+    tags = ('scm', 'source')
+
+    SCM_TYPES = (
+        ('git', 'Git'),
+        ('subversion', 'Subversion'),
+        ('mercurial', 'Mercurial'),
+        ('perforce', 'Perforce'),
+        ('p4', 'Perforce'),
+        ('cvs', 'CVS'),
+        ('nullscm', 'None')
+    )
+
+    def __init__(self):
+        self._counts = {}
+        self._scm = None
+
+    def start_job(self, job_name):
+        super().start_job(job_name)
+        self._scm = None
+
+    def element(self, elem):
+        scm_class = elem.attrib.get('class')
+        if self._scm is not None or not scm_class:
+            return
+
+        simple_class = scm_class.split('.')[-1]
+        for keyword, scm_type in self.SCM_TYPES:
+            if keyword in simple_class.lower():
+                self._scm = scm_type
+                return
+        self._scm = simple_class
+
+    def end_job(self):
+        scm_type = self._scm or 'None'
+        self._counts[scm_type] = self._counts.get(scm_type, 0) + 1
+
+    def result(self):
+        return self._counts
+
+class ConfigScanner:
+    """Feeds the elements of job configs to a set of analyzers in one pass"""
+
+    def __init__(self, analyzers):
+        """
+        Register analyzers
+
+        Args:
+            analyzers: ConfigAnalyzer instances
+        """
+        self.analyzers = list(analyzers)
+        self.jobs_scanned = 0
+        self._every_element = []
+        self._by_tag = {}
+
+        for analyzer in self.analyzers:
+            if analyzer.tags is None:
+                self._every_element.append(analyzer)
+            else:
+                for tag in analyzer.tags:
+                    self._by_tag.setdefault(tag, []).append(analyzer)
+
+    def scan(self, job_name, content):
+        """
+        Parse one config.xml and hand its elements to the analyzers
+
+        Elements are released as soon as they have been handled. A config that
+        is not well-formed contributes whatever was parsed before the error.
+
+        Args:
+            job_name: Full name of the job
+            content: config.xml text
+        """
+        for analyzer in self.analyzers:
+            analyzer.start_job(job_name)
+
+        try:
+            for _, elem in ET.iterparse(io.BytesIO(content.encode('utf-8'))):
+                for analyzer in self._by_tag.get(elem.tag, ()):
+                    analyzer.element(elem)
+                for analyzer in self._every_element:
+                    analyzer.element(elem)
+                elem.clear()
+        except ET.ParseError:
+            pass
+        finally:
+            for analyzer in self.analyzers:
+                analyzer.end_job()
+
+        self.jobs_scanned += 1
+
+    def results(self):
+        """
+        Collect the analyzers' results
+
+        Returns:
+            dict: Result of each analyzer keyed by its name
+        """
+        return {analyzer.name: analyzer.result() for analyzer in self.analyzers}
+
+def default_analyzers():
+    """
+    Create the analyzers used for the shared job config analysis
+
+    Returns:
+        list: New analyzer instances
+    """
+    return [ToolUsageAnalyzer(), NotificationUsageAnalyzer(), LabelUsageAnalyzer(), ScmUsageAnalyzer()]
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Config Store Module for Jenkins Dashboard
+This module keeps a local SQLite copy of job config.xml files. Bodies are
+stored once per content hash, so jobs created from the same template share a
+copy. Each config.xml URL points at its current body along with a change
+signature of the job and the time it was downloaded. Jenkins sends no ETag or
+Last-Modified for config.xml, so a stored copy is reused without a request
+while the job's signature (its last build) is unchanged and the copy is
+younger than CONFIG_MAX_AGE; configs served with validators are revalidated
+with conditional requests instead.
+"""
+
+import hashlib
+import threading
+import time
+from utils.cache import open_database
+
+# Schema version kept in PRAGMA user_version; older databases are migrated once
+SCHEMA_VERSION = 1
+
+# Stored configs are downloaded again after this many seconds even if their
+# job has not built since, so edits to idle jobs are eventually seen
+CONFIG_MAX_AGE = 24 * 60 * 60
+
+def content_hash(content):
+    """
+    Hash a config body
+
+    Args:
+        content: config.xml text
+
+    Returns:
+        str: SHA-256 hex digest of the UTF-8 encoded text
+    """
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+class ConfigStore:
+    """Persistent job configurations keyed by config.xml URL and content hash"""
+
+    def __init__(self, path):
+        """
+        Open (and create if needed) the store
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = open_database(path)
+
+        with self._lock, self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                # Earlier versions kept one body per URL, then URLs without signatures
+                self._conn.execute("DROP TABLE IF EXISTS configs")
+                self._conn.execute("DROP TABLE IF EXISTS config_urls")
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS config_urls (
+                    url TEXT PRIMARY KEY,
+                    hash TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    signature TEXT,
+                    fetched REAL NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS config_bodies (
+                    hash TEXT PRIMARY KEY,
+                    content TEXT NOT NULL
+                )
+            """)
+
+    def get(self, url):
+        """
+        Get a stored configuration
+
+        Args:
+            url: config.xml URL
+
+        Returns:
+            tuple: (etag, last_modified, signature, fetched, content), or None
+                   if not stored
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT config_urls.etag, config_urls.last_modified, config_urls.signature, "
+                "config_urls.fetched, config_bodies.content "
+                "FROM config_urls JOIN config_bodies ON config_bodies.hash = config_urls.hash "
+                "WHERE config_urls.url = ?", (url,)
+            ).fetchone()
+
+    def get_current(self, url, signature, max_age=CONFIG_MAX_AGE):
+        """
+        Get a stored configuration that can be used without asking Jenkins
+
+        Args:
+            url: config.xml URL
+            signature: Current change signature of the job, or None if unknown
+            max_age: Age in seconds after which a stored copy is not reused
+
+        Returns:
+            str: Stored config text, or None if it is missing, stale or the
+                 job changed since it was downloaded
+        """
+        if signature is None:
+            return None
+
+        stored = self.get(url)
+        if not stored:
+            return None
+        _, _, stored_signature, fetched, content = stored
+        if stored_signature != signature or time.time() - fetched > max_age:
+            return None
+        return content
+
+    def put(self, url, etag, last_modified, content, signature=None):
+        """
+        Store a configuration with its validators and job signature, if any
+
+        Args:
+            url: config.xml URL
+            etag: ETag response header or None
+            last_modified: Last-Modified response header or None
+            content: config.xml text
+            signature: Change signature of the job when the config was downloaded
+
+        Returns:
+            bool: Whether the content differs from the stored copy (True for new URLs)
+        """
+        digest = content_hash(content)
+
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT hash FROM config_urls WHERE url = ?", (url,)).fetchone()
+            previous = row[0] if row else None
+
+            self._conn.execute(
+                "INSERT OR IGNORE INTO config_bodies (hash, content) VALUES (?, ?)", (digest, content)
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO config_urls (url, hash, etag, last_modified, signature, fetched) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, digest, etag, last_modified, signature, time.time())
+            )
+
+            # Drop the old body once no URL points at it any more
+            if previous and previous != digest:
+                self._conn.execute(
+                    "DELETE FROM config_bodies WHERE hash = ? "
+                    "AND NOT EXISTS (SELECT 1 FROM config_urls WHERE hash = ?)",
+                    (previous, previous)
+                )
+
+        return previous != digest
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Federation Module for Jenkins Dashboard
+This module loads the inventory of Jenkins controllers used by federation mode
+and aggregates per-controller results into fleet-wide views.
+"""
+
+import json
+import os
+from collections import namedtuple
+from urllib.parse import urlparse
+
+Controller = namedtuple('Controller', ['name', 'url', 'username', 'password', 'no_ssl_verify'])
+
+def load_inventory(path, no_ssl_verify=False):
+    """
+    Load the controllers listed in an inventory file
+
+    The file is JSON: either a list of controllers or an object with a
+    "controllers" list. Each controller has "url" and "username", and either
+    "password" or "password_env" (the name of an environment variable holding
+    the password or API token). "name" defaults to the URL host and
+    "no_ssl_verify" to the command line setting.
+
+    Args:
+        path: Inventory file path
+        no_ssl_verify: Default for controllers that do not set no_ssl_verify
+
+    Returns:
+        list: Controller tuples
+
+    Raises:
+        ValueError: If the file cannot be read or an entry is invalid
+    """
+    try:
+        with open(path, encoding='utf-8') as inventory_file:
+            inventory = json.load(inventory_file)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Cannot read inventory {path}: {str(e)}")
+
+    entries = inventory.get('controllers', []) if isinstance(inventory, dict) else inventory
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"Inventory {path} lists no controllers")
+
+    controllers = []
+    names = set()
+    for position, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or not entry.get('url') or not entry.get('username'):
+            raise ValueError(f"Inventory entry {position} needs a url and a username")
+
+        password = entry.get('password')
+        if password is None and entry.get('password_env'):
+            password = os.environ.get(entry['password_env'])
+            if password is None:
+                raise ValueError(f"Inventory entry {position}: environment variable {entry['password_env']} is not set")
+        if password is None:
+            raise ValueError(f"Inventory entry {position} needs a password or password_env")
+
+        url = entry['url']
+        name = entry.get('name') or urlparse(url if '://' in url else f"https://{url}").hostname or url
+        if name in names:
+            raise ValueError(f"Inventory lists controller '{name}' more than once")
+        names.add(name)
+
+        controllers.append(Controller(name, url, entry['username'], password,
+                                      bool(entry.get('no_ssl_verify', no_ssl_verify))))
+
+    return controllers
+
+def _ok(info):
+    return isinstance(info, dict) and "error" not in info
+
+def aggregate_fleet(fleet_data):
+    """
+    Aggregate per-controller fleet data into fleet-wide views
+
+    Args:
+        fleet_data: List of (controller name, data) in inventory order, where
+                    data has 'version', 'nodes_overview', 'jobs_overview',
+                    'queue' and 'plugins' ({short name: version}), or 'error'
+
+    Returns:
+        dict: Per-controller rows, fleet totals, failing jobs across the fleet
+              and plugins whose version differs between controllers
+    """
+    controllers = []
+    totals = {
+        'controllers': len(fleet_data),
+        'reachable': 0,
+        'nodes': 0,
+        'nodes_online': 0,
+        'nodes_offline': 0,
+        'total_executors': 0,
+        'busy_executors': 0,
+        'idle_executors': 0,
+        'jobs': 0,
+        'failing_jobs': 0,
+        'queue_items': 0
+    }
+    failing_jobs = []
+    plugin_versions = {}
+
+    for name, data in fleet_data:
+        row = {'controller': name, 'version': data.get('version', 'Unknown')}
+        if "error" in data:
+            row['error'] = data['error']
+            controllers.append(row)
+            continue
+        totals['reachable'] += 1
+
+        nodes = data.get('nodes_overview')
+        if _ok(nodes):
+            status_counts = nodes.get('status_counts', {})
+            offline = status_counts.get('offline', 0) + status_counts.get('temp_offline', 0)
+            row.update({
+                'nodes': nodes.get('total_nodes', 0),
+                'nodes_offline': offline,
+                'total_executors': nodes.get('total_executors', 0),
+                'busy_executors': nodes.get('busy_executors', 0)
+            })
+            totals['nodes'] += row['nodes']
+            totals['nodes_online'] += status_counts.get('online', 0)
+            totals['nodes_offline'] += offline
+            totals['total_executors'] += row['total_executors']
+            totals['busy_executors'] += row['busy_executors']
+
+        jobs = data.get('jobs_overview')
+        if _ok(jobs):
+            failing = [job for job in jobs.get('jobs', [])
+                       if job.get('color') and job['color'].split()[0] == 'Failed']
+            row['jobs'] = jobs.get('total_jobs', 0)
+            row['failing_jobs'] = len(failing)
+            totals['jobs'] += row['jobs']
+            totals['failing_jobs'] += len(failing)
+            for job in failing:
+                failing_jobs.append({
+                    'controller': name,
+                    'name': job.get('name', 'Unknown'),
+                    'last_build': job.get('last_build_number', 'N/A'),
+                    'last_build_time': job.get('last_build_timestamp'),
+                    'url': job.get('url', '')
+                })
+
+        queue = data.get('queue')
+        if _ok(queue):
+            row['queue_items'] = queue.get('items_in_queue', 0)
+            totals['queue_items'] += row['queue_items']
+
+        for plugin, version in data.get('plugins', {}).items():
+            plugin_versions.setdefault(plugin, {})[name] = version
+
+        controllers.append(row)
+
+    totals['idle_executors'] = totals['total_executors'] - totals['busy_executors']
+
+    # A plugin is skewed when the controllers that have it run different versions
+    plugin_skew = []
+    for plugin, versions in sorted(plugin_versions.items()):
+        if len(set(versions.values())) > 1:
+            plugin_skew.append({'plugin': plugin, 'versions': versions})
+
+    return {
+        'controllers': controllers,
+        'totals': totals,
+        'failing_jobs': failing_jobs,
+        'plugin_skew': plugin_skew
+    }
@@ -5,7 +5,6 @@ This module provides consistent formatting and color functionality across the da
 """
 
 from colorama import Fore, Back, Style, init
-from tabulate import tabulate
 
 # Initialize colorama
 init(autoreset=True)
@@ -220,11 +219,12 @@ def color_table(data, headers, tablefmt='grid', colorize_columns=None):
     Returns:
         Tabulated string with colored cells
     """
-    # Make a copy of the data to avoid modifying the original
-    colored_data = [row[:] for row in data]
+    # Only copy the rows when cells are recolored, to avoid modifying the original
+    colored_data = data
     
     # Apply color functions to specified columns
     if colorize_columns:
+        colored_data = [list(row) for row in data]
         for row in colored_data:
             for col_idx, color_func in colorize_columns.items():
                 if col_idx < len(row):
@@ -232,7 +232,9 @@ def color_table(data, headers, tablefmt='grid', colorize_columns=None):
     
     # Color the headers
     colored_headers = [f"{Colors.HEADER}{h}{Colors.RESET}" for h in headers]
-    
+
+    # Imported here so that runs printing no tables (--format, --serve-metrics) never load tabulate
+    from tabulate import tabulate
     return tabulate(colored_data, headers=colored_headers, tablefmt=tablefmt)
 
 def display_table(title, data, headers, tablefmt='grid', colorize_columns=None):
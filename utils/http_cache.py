@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+HTTP Cache Module for Jenkins Dashboard
+This module keeps responses of rarely changing Jenkins pages on disk. Fresh
+entries are served without a request; stale ones are revalidated with
+If-None-Match / If-Modified-Since and reused when Jenkins answers 304.
+"""
+
+import json
+import re
+import threading
+import time
+from utils.cache import open_database
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# How long (seconds) a response may be served without asking Jenkins again,
+# by URL path. Endpoints not listed here are never cached.
+CACHE_TTLS = (
+    (re.compile(r"/pluginManager/"), 3600),
+    (re.compile(r"/updateCenter/"), 3600),
+    (re.compile(r"/configure(Tools|Security)?/?$"), 900),
+    (re.compile(r"/systemInfo/?$"), 900),
+)
+
+def ttl_for(url):
+    """
+    Get the cache lifetime of a URL
+
+    Args:
+        url: Request URL, possibly with a query string
+
+    Returns:
+        int: Lifetime in seconds, or None if the URL is not cacheable
+    """
+    path = url.split('?', 1)[0]
+    for pattern, ttl in CACHE_TTLS:
+        if pattern.search(path):
+            return ttl
+    return None
+
+class CachedResponse:
+    """Minimal stand-in for a requests response served from the cache"""
+
+    def __init__(self, text, content_type):
+        self.status_code = 200
+        self.headers = {'Content-Type': content_type or ''}
+        self.text = text
+        self.from_cache = True
+
+    @property
+    def content(self):
+        return self.text.encode('utf-8')
+
+    def json(self):
+        return json.loads(self.text)
+
+class HttpCache:
+    """Persistent cache of GET responses with validators and LRU size eviction"""
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Open (and create if needed) the cache
+
+        Args:
+            path: Path of the SQLite database file
+            max_bytes: Total size of cached bodies to keep
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = open_database(path)
+
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_type TEXT,
+                    body TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+
+    def get(self, session, url, params=None, headers=None, scope=''):
+        """
+        GET a URL through the cache
+
+        Args:
+            session: Requests session used on a cache miss
+            url: Request URL
+            params: Query parameters
+            headers: Extra request headers
+            scope: Identity the response belongs to (such as the user name)
+
+        Returns:
+            Response or CachedResponse
+        """
+        ttl = ttl_for(url)
+        if ttl is None:
+            return session.get(url, params=params, headers=headers)
+
+        key = self._key(scope, url, params)
+        now = time.time()
+        entry = self._load(key)
+
+        if entry and now - entry['stored_at'] < ttl:
+            self._touch(key, now, refreshed=False)
+            return CachedResponse(entry['body'], entry['content_type'])
+
+        request_headers = dict(headers or {})
+        if entry:
+            if entry['etag']:
+                request_headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                request_headers['If-Modified-Since'] = entry['last_modified']
+
+        response = session.get(url, params=params, headers=request_headers)
+
+        if response.status_code == 304 and entry:
+            self._touch(key, now, refreshed=True)
+            return CachedResponse(entry['body'], entry['content_type'])
+
+        if response.status_code == 200:
+            self._store(key, response, now)
+
+        return response
+
+    def clear(self):
+        """Delete every cached response"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _key(self, scope, url, params):
+        query = sorted((str(name), str(value)) for name, value in (params or {}).items())
+        return json.dumps([scope, url, query])
+
+    def _load(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, content_type, body, stored_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return dict(zip(('etag', 'last_modified', 'content_type', 'body', 'stored_at'), row))
+
+    def _touch(self, key, now, refreshed):
+        with self._lock, self._conn:
+            if refreshed:
+                self._conn.execute(
+                    "UPDATE responses SET stored_at = ?, last_used = ? WHERE key = ?", (now, now, key)
+                )
+            else:
+                self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+
+    def _store(self, key, response, now):
+        body = response.text
+        size = len(body)
+        if size > self.max_bytes:
+            return
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, etag, last_modified, content_type, body, size, stored_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 response.headers.get('Content-Type'), body, size, now, now)
+            )
+
+            # Evict least recently used responses until the cache fits
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                rows = self._conn.execute(
+                    "SELECT key, size FROM responses ORDER BY last_used ASC"
+                ).fetchall()
+                for old_key, old_size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (old_key,))
+                    total -= old_size
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Lazy Import Module for Jenkins Dashboard
+This module provides stand-ins for classes and functions that import their
+module on first use. The dashboard registers every collector and display this
+way, so a run only loads the modules of the sections it shows.
+"""
+
+import threading
+
+class LazyObject:
+    """Stand-in for a module attribute, imported the first time it is used"""
+
+    def __init__(self, module_name, name):
+        """
+        Register the attribute without importing its module
+
+        Args:
+            module_name: Dotted module path, such as "collectors.queue_collector"
+            name: Attribute of the module, such as "JenkinsQueueCollector"
+        """
+        self._module_name = module_name
+        self._name = name
+        self._target = None
+        self._lock = threading.Lock()
+
+    def resolve(self):
+        """
+        Import the module (once) and get the attribute
+
+        Returns:
+            The class or function this object stands in for
+        """
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    # __import__ (unlike importlib.import_module) is timed by -X importtime
+                    module = __import__(self._module_name, fromlist=[self._name])
+                    self._target = getattr(module, self._name)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attribute):
+        # Only reached for attributes missing on the stand-in itself (or before
+        # __init__ has run, as when copying, where its own state is missing)
+        if attribute in ('_module_name', '_name', '_target', '_lock'):
+            raise AttributeError(attribute)
+        return getattr(self.resolve(), attribute)
+
+    def __repr__(self):
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<lazy {self._module_name}.{self._name} ({state})>"
+
+def lazy_import(module_name, name):
+    """
+    Get a stand-in for a module attribute that is imported on first use
+
+    Args:
+        module_name: Dotted module path
+        name: Attribute of the module
+
+    Returns:
+        LazyObject: Callable stand-in for the attribute
+    """
+    return LazyObject(module_name, name)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Log Scanner Module for Jenkins Dashboard
+This module finds known error patterns in console log lines in a single pass,
+without holding the log in memory.
+"""
+
+import re
+
+class LogPatternScanner:
+    """Matches a prioritised list of literal patterns against streamed log lines"""
+
+    def __init__(self, patterns):
+        """
+        Compile the patterns into one regular expression
+
+        Args:
+            patterns: Literal strings, most significant first
+        """
+        self.patterns = tuple(patterns)
+        self._regex = re.compile("|".join(re.escape(pattern) for pattern in self.patterns))
+
+    def scan(self, lines):
+        """
+        Find the first line containing the most significant pattern
+
+        Lines are consumed one at a time, and scanning stops as soon as the
+        first pattern is found.
+
+        Args:
+            lines: Iterable of log lines
+
+        Returns:
+            str: Matching line, or None if no pattern occurs
+        """
+        best_index = len(self.patterns)
+        best_line = None
+
+        for line in lines:
+            # One regex search rejects the vast majority of lines
+            if not self._regex.search(line):
+                continue
+
+            for index in range(best_index):
+                if self.patterns[index] in line:
+                    best_index, best_line = index, line
+                    break
+
+            if best_index == 0:
+                break
+
+        return best_line
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Metrics Module for Jenkins Dashboard
+This module encodes collector results in the OpenMetrics text format and
+serves them over HTTP. Collection runs on a background thread, so a scrape
+only ever returns the last rendered snapshot and never waits on Jenkins.
+"""
+
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+DEFAULT_METRICS_INTERVAL = 30
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_value(value):
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+class MetricFamily:
+    """A named metric with its type, help text and samples"""
+
+    def __init__(self, name, metric_type, help_text):
+        """
+        Initialize an empty family
+
+        Args:
+            name: Metric name
+            metric_type: OpenMetrics type, such as "gauge" or "gaugehistogram"
+            help_text: Description shown in the HELP line
+        """
+        self.name = name
+        self.metric_type = metric_type
+        self.help_text = help_text
+        self.samples = []
+
+    def add(self, value, labels=None, suffix=''):
+        """
+        Add a sample
+
+        Args:
+            value: Sample value
+            labels: Label names and values
+            suffix: Sample name suffix, such as "_bucket"
+        """
+        self.samples.append((suffix, dict(labels or {}), value))
+        return self
+
+def gauge(name, help_text, value=None, labels=None):
+    """
+    Create a gauge family, optionally with a first sample
+
+    Args:
+        name: Metric name
+        help_text: Description shown in the HELP line
+        value: Sample value, or None to add samples later
+        labels: Labels of the first sample
+
+    Returns:
+        MetricFamily: The gauge
+    """
+    family = MetricFamily(name, 'gauge', help_text)
+    if value is not None:
+        family.add(value, labels)
+    return family
+
+def gauge_histogram(name, help_text, values, buckets):
+    """
+    Create a gauge histogram of the current distribution of some values
+
+    Args:
+        name: Metric name
+        help_text: Description shown in the HELP line
+        values: Observed values
+        buckets: Upper bounds of the buckets in increasing order (+Inf is added)
+
+    Returns:
+        MetricFamily: The gauge histogram
+    """
+    family = MetricFamily(name, 'gaugehistogram', help_text)
+    values = sorted(values)
+
+    index = 0
+    for bound in list(buckets) + [math.inf]:
+        while index < len(values) and values[index] <= bound:
+            index += 1
+        family.add(index, {'le': _format_value(float(bound))}, '_bucket')
+
+    family.add(len(values), suffix='_gcount')
+    family.add(sum(values), suffix='_gsum')
+    return family
+
+def render_openmetrics(families):
+    """
+    Render metric families in the OpenMetrics text format
+
+    Args:
+        families: MetricFamily objects with unique names
+
+    Returns:
+        str: Exposition text ending with "# EOF"
+    """
+    lines = []
+    for family in families:
+        lines.append(f"# TYPE {family.name} {family.metric_type}")
+        lines.append(f"# HELP {family.name} {_escape(family.help_text)}")
+        for suffix, labels, value in family.samples:
+            label_text = ""
+            if labels:
+                label_text = "{" + ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items()) + "}"
+            lines.append(f"{family.name}{suffix}{label_text} {_format_value(value)}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+class MetricsExporter:
+    """Refreshes metrics in the background and serves the latest snapshot"""
+
+    def __init__(self, collect, interval=DEFAULT_METRICS_INTERVAL):
+        """
+        Initialize the exporter
+
+        Args:
+            collect: Callable taking no arguments that returns a list of MetricFamily
+            interval: Seconds between refreshes
+        """
+        self.collect = collect
+        self.interval = interval
+        self._families = []
+        self._text = render_openmetrics(self._exporter_families(None, 0, False))
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def latest(self):
+        """
+        Get the last rendered exposition
+
+        Returns:
+            str: OpenMetrics text
+        """
+        with self._lock:
+            return self._text
+
+    def refresh(self):
+        """Collect once and replace the rendered snapshot"""
+        started = time.monotonic()
+        try:
+            families = self.collect()
+            success = True
+        except Exception:
+            # Keep serving the previous values; the success gauge shows the failure
+            families = self._families
+            success = False
+
+        duration = time.monotonic() - started
+        text = render_openmetrics(list(families) + self._exporter_families(time.time(), duration, success))
+
+        with self._lock:
+            self._families = families
+            self._text = text
+
+    def run_refresh_loop(self):
+        """Refresh until stop() is called"""
+        while not self._stopped.is_set():
+            started = time.monotonic()
+            self.refresh()
+            self._stopped.wait(max(0, self.interval - (time.monotonic() - started)))
+
+    def serve(self, port, host=''):
+        """
+        Start background refreshes and serve /metrics until interrupted
+
+        Args:
+            port: TCP port to listen on
+            host: Address to bind (all interfaces by default)
+        """
+        refresher = threading.Thread(target=self.run_refresh_loop, name="metrics-refresh", daemon=True)
+        refresher.start()
+
+        server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        server.daemon_threads = True
+        server.exporter = self
+        try:
+            server.serve_forever()
+        finally:
+            self.stop()
+            server.server_close()
+
+    def stop(self):
+        """Stop the background refresh loop"""
+        self._stopped.set()
+
+    def _exporter_families(self, timestamp, duration, success):
+        families = [
+            gauge('jenkins_dashboard_refresh_success', "Whether the last refresh collected metrics", success),
+            gauge('jenkins_dashboard_refresh_duration_seconds', "Time the last refresh took", duration),
+        ]
+        if timestamp is not None:
+            families.append(gauge('jenkins_dashboard_last_refresh_timestamp_seconds',
+                                  "Unix time of the last refresh", timestamp))
+        return families
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves the exporter's latest snapshot"""
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path == '/metrics':
+            body = self.server.exporter.latest().encode('utf-8')
+            content_type = OPENMETRICS_CONTENT_TYPE
+            status = 200
+        elif path == '/':
+            body = b'<html><body><a href="/metrics">Metrics</a></body></html>'
+            content_type = "text/html; charset=utf-8"
+            status = 200
+        else:
+            body = b'Not found\n'
+            content_type = "text/plain; charset=utf-8"
+            status = 404
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes are frequent; keep them out of the console
+        pass
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Structured Output Module for Jenkins Dashboard
+This module writes collector results as JSON, NDJSON or CSV instead of
+colored tables. Results are written section by section as they are collected,
+and NDJSON/CSV are written one record at a time without building the whole
+output in memory.
+"""
+
+import csv
+import json
+from collections.abc import Mapping
+from itertools import groupby
+
+STRUCTURED_FORMATS = ('json', 'ndjson', 'csv')
+
+# Table name of the record holding a section's scalar values
+SUMMARY_TABLE = 'summary'
+
+# Fields added to every NDJSON line and CSV row; record fields with the same
+# name are written under their dotted path instead (such as "alerts.warnings.section")
+RESERVED_FIELDS = ('section', 'table')
+
+# Column holding the dictionary key of rows from lists keyed by data values
+# (such as nodes by label)
+KEY_FIELD = 'key'
+
+def _is_rows(value):
+    return isinstance(value, list) and all(isinstance(item, Mapping) for item in value)
+
+def _keyed(key, record, path):
+    row = {KEY_FIELD: key}
+    for field, value in record.items():
+        row[f"{path}.{field}" if field == KEY_FIELD else field] = value
+    return row
+
+def _split(value, path, summary, tables):
+    if isinstance(value, Mapping):
+        if path and any(value.values()) and all(_is_rows(item) for item in value.values()):
+            # Keys are data values rather than field names: one table, with
+            # the key as a column, instead of a table per key
+            tables.append((path, [_keyed(key, record, path) for key, records in value.items() for record in records]))
+            return
+        for key, item in value.items():
+            _split(item, f"{path}.{key}" if path else str(key), summary, tables)
+    elif value and _is_rows(value):
+        tables.append((path, value))
+    else:
+        summary[path or 'value'] = value
+
+def iter_records(result):
+    """
+    Split a collector result into flat records
+
+    Lists of dictionaries (jobs, nodes, queue items...) become tables named by
+    their dotted path, one record per item. Dictionaries of such lists keyed
+    by data values (nodes by label...) become a single table whose records
+    carry their dictionary key in KEY_FIELD. All remaining values are gathered
+    into a single summary record keyed by dotted path, which is written even
+    when empty so every section appears in the output.
+
+    Args:
+        result: Collector result
+
+    Yields:
+        tuple: (table, record)
+    """
+    summary = {}
+    tables = []
+    _split(result, '', summary, tables)
+
+    if summary or not tables:
+        yield SUMMARY_TABLE, summary
+    for table, records in tables:
+        for record in records:
+            yield table, record
+
+def _json_default(value):
+    # Records (utils.records) are written as objects, anything else as text
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+def _labeled(section, table, record):
+    """Put a record's fields after its section and table, renaming fields that clash with them"""
+    line = {'section': section, 'table': table}
+    for key, value in record.items():
+        line[f"{table}.{key}" if key in RESERVED_FIELDS else key] = value
+    return line
+
+def _cell(value):
+    if value is None:
+        return ''
+    if isinstance(value, (Mapping, list, tuple, set)):
+        return json.dumps(value, default=_json_default)
+    return value
+
+class StructuredWriter:
+    """Writes section results to a stream in a machine-readable format"""
+
+    def __init__(self, output_format, stream):
+        """
+        Initialize the writer
+
+        Args:
+            output_format: One of STRUCTURED_FORMATS
+            stream: Text stream to write to
+        """
+        if output_format not in STRUCTURED_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+        self.output_format = output_format
+        self.stream = stream
+        self._sections = 0
+        self._tables = 0
+
+    def write(self, section, result):
+        """
+        Write the result of one section
+
+        Args:
+            section: Section name
+            result: Collector result (error dictionaries are written as they are)
+        """
+        if self.output_format == 'json':
+            self.stream.write('{\n' if self._sections == 0 else ',\n')
+            self.stream.write(f"{json.dumps(section)}: ")
+            json.dump(result, self.stream, default=_json_default)
+        elif self.output_format == 'ndjson':
+            for table, record in iter_records(result):
+                line = _labeled(section, table, record)
+                self.stream.write(json.dumps(line, default=_json_default))
+                self.stream.write('\n')
+        else:
+            for table, records in groupby(iter_records(result), key=lambda item: item[0]):
+                self._write_csv_table(section, table, [record for _, record in records])
+
+        self._sections += 1
+        self.stream.flush()
+
+    def close(self):
+        """Finish the output"""
+        if self.output_format == 'json':
+            self.stream.write('{}\n' if self._sections == 0 else '\n}\n')
+        self.stream.flush()
+
+    def _write_csv_table(self, section, table, records):
+        rows = [{key: _cell(value) for key, value in _labeled(section, table, record).items()}
+                for record in records]
+
+        # One header per table with the fields of all its records, in order
+        # of first appearance; tables are separated by a blank line
+        fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+        if self._tables:
+            self.stream.write('\n')
+        writer = csv.DictWriter(self.stream, fieldnames=fieldnames, restval='', lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+        self._tables += 1
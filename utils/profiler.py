@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Request Profiler Module for Jenkins Dashboard
+This module records every request the collectors make (collector, endpoint
+template, status, bytes, server time and JSON decode time) and summarizes
+them per collector and per endpoint, lists URLs fetched more than once and
+exports the requests as Chrome trace events (chrome://tracing, Perfetto).
+"""
+
+import json
+import re
+import threading
+import time
+from contextlib import nullcontext
+from urllib.parse import urlencode, urlsplit
+
+# Number of endpoints listed in the slowest endpoints summary
+SLOWEST_ENDPOINTS = 10
+
+# Path segments following these ones are names or numbers, not endpoints
+_NAMED_SEGMENTS = {'job': '{name}', 'computer': '{node}', 'user': '{user}', 'view': '{view}', 'metrics': '{key}'}
+_NUMBER = re.compile(r"^\d+$")
+
+def endpoint_template(url):
+    """
+    Reduce a request URL to its endpoint template
+
+    The scheme and host are dropped, job, node and user names and build
+    numbers are replaced by placeholders, and only the names of query
+    parameters are kept, so requests to the same endpoint of different jobs
+    (or different controllers) are grouped together.
+
+    Args:
+        url: Request URL, with or without a query string
+
+    Returns:
+        str: Template such as "job/{name}/{number}/logText/progressiveText?start"
+    """
+    parts = urlsplit(url)
+    path, query = parts.path, parts.query
+
+    segments = [segment for segment in path.split('/') if segment]
+    template = []
+    for position, segment in enumerate(segments):
+        previous = segments[position - 1] if position else None
+        if previous in _NAMED_SEGMENTS and segment != 'api':
+            template.append(_NAMED_SEGMENTS[previous])
+        elif _NUMBER.match(segment):
+            template.append('{number}')
+        else:
+            template.append(segment)
+
+    template = '/'.join(template) or '/'
+    if query:
+        template += '?' + ','.join(sorted({pair.split('=', 1)[0] for pair in query.split('&') if pair}))
+    return template
+
+def request_key(url, params=None):
+    """
+    Get the full URL of a request, with its query parameters in a fixed order
+
+    Args:
+        url: Request URL
+        params: Query parameters
+
+    Returns:
+        str: URL identifying the request
+    """
+    if not params:
+        return url
+    query = urlencode(sorted((str(name), str(value)) for name, value in params.items()))
+    return f"{url}{'&' if '?' in url else '?'}{query}"
+
+class RequestSpan:
+    """Measurements of one request, filled in by the code making it"""
+
+    def __init__(self, collector, url, params=None):
+        """
+        Start measuring a request
+
+        Args:
+            collector: Name of the collector making the request
+            url: Request URL
+            params: Query parameters
+        """
+        self.collector = collector
+        self.url = url
+        self.params = params
+        self.status = None
+        self.bytes = 0
+        self.server_seconds = 0.0
+        self.decode_seconds = 0.0
+        self.cached = False
+        self.error = None
+        self.started = time.perf_counter()
+        self.finished = None
+        self.thread = threading.current_thread()
+
+    def set_response(self, response, read_body=True):
+        """
+        Record the status, size and server time of a response
+
+        Args:
+            response: Requests response or utils.http_cache.CachedResponse
+            read_body: Whether the body has been read (False for streamed
+                       responses, whose bytes are counted with add_bytes)
+        """
+        self.status = response.status_code
+        self.cached = getattr(response, 'from_cache', False)
+        elapsed = getattr(response, 'elapsed', None)
+        if elapsed is not None:
+            self.server_seconds = elapsed.total_seconds()
+        if read_body:
+            self.bytes += len(response.content)
+
+    def add_bytes(self, count):
+        """
+        Count bytes read from a streamed response
+
+        Args:
+            count: Number of bytes read
+        """
+        self.bytes += count
+
+    def decode_json(self, response):
+        """
+        Decode a JSON response, timing the decoding
+
+        Args:
+            response: Response with a JSON body
+
+        Returns:
+            Decoded JSON
+        """
+        started = time.perf_counter()
+        try:
+            return response.json()
+        finally:
+            self.decode_seconds += time.perf_counter() - started
+
+class RequestProfiler:
+    """Thread-safe record of the requests made during a run"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._spans = []
+
+    def span(self, collector, url, params=None):
+        """
+        Measure one request; the span is recorded when the block exits
+
+        Args:
+            collector: Name of the collector making the request
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Context manager yielding a RequestSpan
+        """
+        return _RecordingSpan(self, RequestSpan(collector, url, params))
+
+    def record(self, span):
+        """
+        Record a finished span
+
+        Args:
+            span: RequestSpan
+        """
+        if span.finished is None:
+            span.finished = time.perf_counter()
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self):
+        """
+        Get the recorded spans
+
+        Returns:
+            list: RequestSpan objects in completion order
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def summary(self, slowest=SLOWEST_ENDPOINTS):
+        """
+        Summarize the recorded requests
+
+        Args:
+            slowest: Number of endpoints to list by total time
+
+        Returns:
+            dict: 'totals', 'collectors', 'slowest_endpoints' and 'duplicates'
+        """
+        spans = self.spans()
+        totals = {'requests': 0, 'cached': 0, 'errors': 0, 'bytes': 0,
+                  'request_seconds': 0.0, 'decode_seconds': 0.0,
+                  'wall_seconds': time.perf_counter() - self.started}
+        collectors = {}
+        endpoints = {}
+        fetches = {}
+
+        for span in spans:
+            duration = span.finished - span.started
+            failed = span.error is not None or (span.status is not None and span.status >= 400)
+
+            totals['requests'] += 1
+            totals['cached'] += span.cached
+            totals['errors'] += failed
+            totals['bytes'] += span.bytes
+            totals['request_seconds'] += duration
+            totals['decode_seconds'] += span.decode_seconds
+
+            collector = collectors.setdefault(span.collector, {
+                'collector': span.collector, 'requests': 0, 'cached': 0, 'errors': 0,
+                'bytes': 0, 'request_seconds': 0.0, 'decode_seconds': 0.0})
+            collector['requests'] += 1
+            collector['cached'] += span.cached
+            collector['errors'] += failed
+            collector['bytes'] += span.bytes
+            collector['request_seconds'] += duration
+            collector['decode_seconds'] += span.decode_seconds
+
+            key = request_key(span.url, span.params)
+            template = endpoint_template(key)
+            endpoint = endpoints.setdefault(template, {
+                'endpoint': template, 'requests': 0, 'bytes': 0, 'total_seconds': 0.0,
+                'max_seconds': 0.0, 'server_seconds': 0.0, 'decode_seconds': 0.0})
+            endpoint['requests'] += 1
+            endpoint['bytes'] += span.bytes
+            endpoint['total_seconds'] += duration
+            endpoint['max_seconds'] = max(endpoint['max_seconds'], duration)
+            endpoint['server_seconds'] += span.server_seconds
+            endpoint['decode_seconds'] += span.decode_seconds
+
+            # Responses served from the local HTTP cache cost no request
+            if not span.cached:
+                fetch = fetches.setdefault(key, {'url': key, 'count': 0, 'bytes': 0, 'collectors': set()})
+                fetch['count'] += 1
+                fetch['bytes'] += span.bytes
+                fetch['collectors'].add(span.collector)
+
+        duplicates = []
+        for fetch in fetches.values():
+            if fetch['count'] > 1:
+                fetch['collectors'] = sorted(fetch['collectors'])
+                duplicates.append(fetch)
+
+        return {
+            'totals': totals,
+            'collectors': sorted(collectors.values(), key=lambda row: row['request_seconds'], reverse=True),
+            'slowest_endpoints': sorted(endpoints.values(), key=lambda row: row['total_seconds'], reverse=True)[:slowest],
+            'duplicates': sorted(duplicates, key=lambda row: (row['count'], row['bytes']), reverse=True)
+        }
+
+    def chrome_trace(self):
+        """
+        Build a Chrome trace-event document of the recorded requests
+
+        Each request is a complete ("X") event on the thread that made it,
+        named by its endpoint template and categorized by collector.
+
+        Returns:
+            dict: Trace document for chrome://tracing or Perfetto
+        """
+        events = []
+        thread_ids = {}
+
+        for span in self.spans():
+            thread = span.thread
+            if thread.ident not in thread_ids:
+                thread_ids[thread.ident] = len(thread_ids) + 1
+                events.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': thread_ids[thread.ident],
+                               'args': {'name': thread.name}})
+
+            events.append({
+                'name': endpoint_template(request_key(span.url, span.params)),
+                'cat': span.collector,
+                'ph': 'X',
+                'ts': round((span.started - self.started) * 1e6, 1),
+                'dur': round((span.finished - span.started) * 1e6, 1),
+                'pid': 1,
+                'tid': thread_ids[thread.ident],
+                'args': {
+                    'url': request_key(span.url, span.params),
+                    'status': span.status,
+                    'bytes': span.bytes,
+                    'cached': span.cached,
+                    'server_ms': round(span.server_seconds * 1000, 3),
+                    'decode_ms': round(span.decode_seconds * 1000, 3),
+                    'error': span.error
+                }
+            })
+
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'started_at': self.started_at}
+        }
+
+    def write_chrome_trace(self, path):
+        """
+        Write the Chrome trace-event document to a file
+
+        Args:
+            path: Output file path
+        """
+        with open(path, 'w', encoding='utf-8') as trace_file:
+            json.dump(self.chrome_trace(), trace_file)
+
+class _RecordingSpan:
+    """Context manager that records its span on exit, including failed requests"""
+
+    def __init__(self, profiler, span):
+        self.profiler = profiler
+        self.span = span
+
+    def __enter__(self):
+        return self.span
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None and exc_type is not GeneratorExit:
+            self.span.error = f"{exc_type.__name__}: {exc_value}"
+        self.profiler.record(self.span)
+        return False
+
+def trace_request(client, collector, url, params=None):
+    """
+    Measure a request if the client has a profiler attached
+
+    Args:
+        client: JenkinsClient (its 'profiler' attribute may be None)
+        collector: Name of the collector making the request
+        url: Request URL
+        params: Query parameters
+
+    Returns:
+        Context manager yielding a RequestSpan
+    """
+    profiler = getattr(client, 'profiler', None)
+    if profiler is None:
+        return nullcontext(RequestSpan(collector, url, params))
+    return profiler.span(collector, url, params)
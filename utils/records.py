@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Record Types Module for Jenkins Dashboard
+This module defines compact record types for the nodes, jobs and builds that
+collectors hold in memory. Records keep their fields in __slots__ (no
+per-instance dictionary) and store raw values, such as bytes, milliseconds
+and epoch timestamps; displays format them when printing.
+
+Records can also be read like dictionaries (record['name'], record.get(...),
+'name' in record, dict(record)), so displays, structured output and any code
+written against the former dictionaries keep working.
+"""
+
+from collections.abc import Mapping
+
+class Record(Mapping):
+    """Base class for fixed-field records readable as read-only mappings"""
+
+    __slots__ = ()
+
+    # Computed properties listed as keys after the stored fields
+    DERIVED = ()
+
+    def __getitem__(self, key):
+        if key in self.__slots__ or key in self.DERIVED:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from self.__slots__
+        yield from self.DERIVED
+
+    def __len__(self):
+        return len(self.__slots__) + len(self.DERIVED)
+
+    def get(self, key, default=None):
+        """
+        Get a field, falling back to the default for missing or unknown values
+
+        Args:
+            key: Field name
+            default: Value returned when the field does not exist or is None
+
+        Returns:
+            Field value or default
+        """
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def to_dict(self):
+        """
+        Convert the record to a plain dictionary
+
+        Returns:
+            dict: Stored and derived fields
+        """
+        return {key: getattr(self, key) for key in self}
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+class NodeRecord(Record):
+    """A Jenkins node (agent or built-in node)"""
+
+    __slots__ = ('name', 'description', 'url', 'offline', 'temporarily_offline', 'jvm_version',
+                 'labels', 'num_executors', 'idle_executors', 'disk_bytes', 'disk_path',
+                 'response_time_ms', 'architecture', 'os_name', 'os_full_name',
+                 'connection_type', 'connect_time')
+
+    DERIVED = ('status', 'busy_executors')
+
+    def __init__(self, name, description='', url='', offline=True, temporarily_offline=False,
+                 jvm_version='Unknown', labels='', num_executors=0, idle_executors=0,
+                 disk_bytes=None, disk_path='', response_time_ms=None, architecture='Unknown',
+                 os_name='Unknown', os_full_name='Unknown', connection_type='Unknown',
+                 connect_time=None):
+        """
+        Create a node record
+
+        Args:
+            name: Node display name
+            description: Node description
+            url: Node page URL
+            offline: Whether the node is offline
+            temporarily_offline: Whether the node was taken offline on purpose
+            jvm_version: Java version of the agent
+            labels: Space-separated labels
+            num_executors: Number of executors
+            idle_executors: Number of idle executors
+            disk_bytes: Free disk space in bytes, or None if unknown
+            disk_path: Path the disk space was measured on
+            response_time_ms: Average response time in milliseconds, or None if unknown
+            architecture: Architecture monitor value, such as "Linux (amd64)"
+            os_name: Operating system family
+            os_full_name: Operating system name with version
+            connection_type: How the agent is connected
+            connect_time: Last connection time in milliseconds since epoch, or None
+        """
+        self.name = name
+        self.description = description
+        self.url = url
+        self.offline = offline
+        self.temporarily_offline = temporarily_offline
+        self.jvm_version = jvm_version
+        self.labels = labels
+        self.num_executors = num_executors
+        self.idle_executors = idle_executors
+        self.disk_bytes = disk_bytes
+        self.disk_path = disk_path
+        self.response_time_ms = response_time_ms
+        self.architecture = architecture
+        self.os_name = os_name
+        self.os_full_name = os_full_name
+        self.connection_type = connection_type
+        self.connect_time = connect_time
+
+    @property
+    def status(self):
+        """str: 'Online', 'Offline' or 'Temporarily Offline'"""
+        if not self.offline:
+            return 'Online'
+        return 'Temporarily Offline' if self.temporarily_offline else 'Offline'
+
+    @property
+    def busy_executors(self):
+        """int: Number of executors running a build"""
+        return self.num_executors - self.idle_executors
+
+class JobRecord(Record):
+    """A Jenkins job and its last build"""
+
+    __slots__ = ('name', 'url', 'type', 'color', 'buildable', 'in_queue', 'first_build_number',
+                 'last_build_number', 'last_build_timestamp', 'last_build_result', 'last_build_duration')
+
+    def __init__(self, name, url='', type='Unknown', color='Not built', buildable=False, in_queue=False,
+                 first_build_number=None, last_build_number=None, last_build_timestamp=None,
+                 last_build_result=None, last_build_duration=None):
+        """
+        Create a job record
+
+        Args:
+            name: Job full name
+            url: Job URL
+            type: Human-readable job type, such as "Pipeline"
+            color: Human-readable status, such as "Failed (in progress)"
+            buildable: Whether the job can be built
+            in_queue: Whether a build of the job is queued
+            first_build_number: Number of the oldest kept build, or None
+            last_build_number: Number of the last build, or None
+            last_build_timestamp: Start of the last build in milliseconds since epoch, or None
+            last_build_result: Result of the last build, or None
+            last_build_duration: Duration of the last build in milliseconds, or None
+        """
+        self.name = name
+        self.url = url
+        self.type = type
+        self.color = color
+        self.buildable = buildable
+        self.in_queue = in_queue
+        self.first_build_number = first_build_number
+        self.last_build_number = last_build_number
+        self.last_build_timestamp = last_build_timestamp
+        self.last_build_result = last_build_result
+        self.last_build_duration = last_build_duration
+
+class BuildRecord(Record):
+    """A build of a job"""
+
+    __slots__ = ('number', 'result', 'timestamp', 'duration', 'job_name')
+
+    def __init__(self, number, result=None, timestamp=None, duration=None, job_name=None):
+        """
+        Create a build record
+
+        Args:
+            number: Build number
+            result: Build result, or None while the build is running
+            timestamp: Build start in milliseconds since epoch
+            duration: Build duration in milliseconds
+            job_name: Full name of the job, when not implied by where the record is kept
+        """
+        self.number = number
+        self.result = result
+        self.timestamp = timestamp
+        self.duration = duration
+        self.job_name = job_name
+
+    @classmethod
+    def from_api(cls, build, job_name=None):
+        """
+        Create a build record from a Jenkins API build object
+
+        Args:
+            build: Build dictionary with number, result, timestamp and duration
+            job_name: Full name of the job
+
+        Returns:
+            BuildRecord: The build
+        """
+        return cls(build.get('number'), build.get('result'), build.get('timestamp'),
+                   build.get('duration'), job_name)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Results Registry Module for Jenkins Dashboard
+This module provides a run-scoped store of collector results so that later
+stages (such as alerts) can reuse data that earlier sections already collected.
+"""
+
+import threading
+
+class ResultsRegistry:
+    """Thread-safe store of collector results keyed by name"""
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self._results = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, name):
+        return name in self._results
+
+    def get(self, name, default=None):
+        """
+        Get a stored result
+
+        Args:
+            name: Result name
+            default: Value returned if the result is not stored
+
+        Returns:
+            The stored result or default
+        """
+        return self._results.get(name, default)
+
+    def set(self, name, value):
+        """
+        Store a result
+
+        Args:
+            name: Result name
+            value: Result value
+        """
+        self._results[name] = value
+
+    def discard(self, name):
+        """
+        Drop a stored result so the next get_or_collect() collects it again
+
+        Args:
+            name: Result name
+        """
+        self._results.pop(name, None)
+
+    def get_or_collect(self, name, collect):
+        """
+        Get a stored result, collecting it first if needed
+
+        Concurrent callers asking for the same name wait for a single
+        collection. Error dictionaries are stored like any other result;
+        exceptions are not stored and propagate to the caller.
+
+        Args:
+            name: Result name
+            collect: Callable taking no arguments that returns the result
+
+        Returns:
+            The stored or freshly collected result
+        """
+        with self._lock:
+            name_lock = self._locks.setdefault(name, threading.Lock())
+
+        with name_lock:
+            if name not in self._results:
+                self._results[name] = collect()
+            return self._results[name]
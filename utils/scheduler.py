@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Collector Scheduler Module for Jenkins Dashboard
+This module runs independent data collection tasks concurrently on a bounded
+thread pool while handing results back in the order the tasks were added.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+DEFAULT_MAX_PARALLEL = 4
+
+class CollectorScheduler:
+    """Dependency-aware scheduler for collector tasks"""
+
+    def __init__(self, max_workers=DEFAULT_MAX_PARALLEL):
+        """
+        Initialize the scheduler
+
+        Args:
+            max_workers: Maximum number of tasks running at the same time
+        """
+        self.max_workers = max(1, int(max_workers or 1))
+        self._tasks = []
+        self._depends = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def add(self, name, func, depends=()):
+        """
+        Register a collection task
+
+        Args:
+            name: Unique task name
+            func: Callable taking no arguments that returns the task result
+            depends: Names of tasks that must finish before this one starts
+        """
+        if name in self._depends:
+            raise ValueError(f"Task '{name}' is already registered")
+
+        for dependency in depends:
+            if dependency not in self._depends:
+                raise ValueError(f"Task '{name}' depends on unknown task '{dependency}'")
+
+        self._tasks.append((name, func))
+        self._depends[name] = tuple(depends)
+        self._futures[name] = Future()
+
+    def result(self, name):
+        """
+        Get the result of a finished task
+
+        Args:
+            name: Task name
+
+        Returns:
+            Whatever the task returned (raises if the task failed)
+        """
+        return self._futures[name].result()
+
+    def run(self):
+        """
+        Run all registered tasks
+
+        Tasks start as soon as their dependencies have finished, whether the
+        dependencies succeeded or not.
+
+        Yields:
+            tuple: (name, result, error) in registration order, where error is
+                   the exception raised by the task or None
+        """
+        started = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+
+            def run_task(name, func):
+                future = self._futures[name]
+                try:
+                    future.set_result(func())
+                except Exception as e:
+                    future.set_exception(e)
+                submit_ready()
+
+            def submit_ready():
+                with self._lock:
+                    for name, func in self._tasks:
+                        if name in started:
+                            continue
+                        if all(self._futures[dep].done() for dep in self._depends[name]):
+                            started.add(name)
+                            pool.submit(run_task, name, func)
+
+            submit_ready()
+
+            for name, _ in self._tasks:
+                future = self._futures[name]
+                error = future.exception()
+                yield name, (None if error else future.result()), error
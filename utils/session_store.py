@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Session Store Module for Jenkins Dashboard
+This module keeps the Jenkins session cookies of recent runs in a local SQLite
+database, keyed by controller URL and user name, so the next run can resume
+the web session instead of authenticating from scratch. With password logins
+against an external realm (LDAP, Active Directory), Jenkins then skips the
+realm lookup that every new session costs.
+"""
+
+import json
+import threading
+import time
+from utils.cache import open_database
+
+# Seconds a stored session is reused; older sessions have most likely expired
+SESSION_MAX_AGE = 30 * 60
+
+class SessionStore:
+    """Persistent session cookies keyed by controller URL and user name"""
+
+    def __init__(self, path, max_age=SESSION_MAX_AGE):
+        """
+        Open (and create if needed) the store
+
+        Args:
+            path: Path of the SQLite database file
+            max_age: Seconds a stored session is reused
+        """
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._conn = open_database(path)
+
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    url TEXT NOT NULL,
+                    username TEXT NOT NULL,
+                    cookies TEXT NOT NULL,
+                    stored_at REAL NOT NULL,
+                    PRIMARY KEY (url, username)
+                )
+            """)
+
+    def get(self, url, username):
+        """
+        Get the cookies of a recent session
+
+        Args:
+            url: Jenkins URL
+            username: User the session belongs to
+
+        Returns:
+            list: Cookie dictionaries (name, value, domain, path, secure, expires),
+                  or None if there is no session younger than max_age
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cookies, stored_at FROM sessions WHERE url = ? AND username = ?", (url, username)
+            ).fetchone()
+
+        if row is None or time.time() - row[1] > self.max_age:
+            return None
+        return json.loads(row[0])
+
+    def put(self, url, username, cookies):
+        """
+        Store the cookies of a session
+
+        Args:
+            url: Jenkins URL
+            username: User the session belongs to
+            cookies: Cookie dictionaries
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (url, username, cookies, stored_at) VALUES (?, ?, ?, ?)",
+                (url, username, json.dumps(cookies), time.time())
+            )
+
+    def delete(self, url, username):
+        """
+        Forget a session
+
+        Args:
+            url: Jenkins URL
+            username: User the session belongs to
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM sessions WHERE url = ? AND username = ?", (url, username))
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
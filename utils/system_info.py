@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+System Info Module for Jenkins Dashboard
+This module parses a Jenkins systemInfo page (system properties, environment
+variables, plugins) in a single pass into a dictionary of key/value rows, so
+properties can be looked up directly instead of searching the page per key.
+"""
+
+from html.parser import HTMLParser
+
+HIDDEN_VALUE_TEXT = "Hidden value, click to show this value"
+
+def _clean_value(text):
+    """Collapse whitespace as a browser would and unwrap values hidden behind Jenkins' reveal button"""
+    value = " ".join(text.split())
+    if HIDDEN_VALUE_TEXT in value:
+        parts = value.split(HIDDEN_VALUE_TEXT)
+        if len(parts) > 1 and parts[1].strip():
+            return parts[1].strip()
+    return value
+
+def _clean_key(text):
+    return " ".join(text.split()).rstrip(':').strip()
+
+def parse_system_info(html):
+    """
+    Parse a systemInfo page into its properties
+
+    Table rows of the form <tr><td>key</td><td>value</td></tr> are read first;
+    "key: value" text outside tables is kept as a fallback. When a key appears
+    more than once the first occurrence wins.
+
+    Args:
+        html: systemInfo page HTML
+
+    Returns:
+        dict: Property values keyed by property name
+    """
+    parser = _SystemInfoParser()
+    parser.feed(html)
+    parser.close()
+
+    properties = dict(parser.rows)
+    for key, value in parser.inline:
+        properties.setdefault(key, value)
+    return properties
+
+class _SystemInfoParser(HTMLParser):
+    """Single-pass parser collecting the key/value rows of a systemInfo page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = {}
+        self.inline = []
+        self._cells = None
+        self._cell = None
+        self._table_depth = 0
+        self._skip = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self._skip = tag
+        elif tag == 'table':
+            self._table_depth += 1
+        elif tag == 'tr':
+            self._cells = []
+        elif tag in ('td', 'th') and self._cells is not None:
+            self._finish_cell()
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if tag == self._skip:
+            self._skip = None
+        elif tag in ('td', 'th'):
+            self._finish_cell()
+        elif tag == 'tr':
+            self._finish_row()
+        elif tag == 'table':
+            self._finish_row()
+            self._table_depth = max(0, self._table_depth - 1)
+
+    def handle_data(self, data):
+        if self._skip is not None:
+            return
+
+        if self._cell is not None:
+            self._cell.append(data)
+        elif self._table_depth == 0 and ':' in data:
+            key, value = data.split(':', 1)
+            key = _clean_key(key)
+            if key:
+                self.inline.append((key, _clean_value(value)))
+
+    def _finish_cell(self):
+        if self._cell is not None and self._cells is not None:
+            self._cells.append("".join(self._cell))
+        self._cell = None
+
+    def _finish_row(self):
+        self._finish_cell()
+        if self._cells and len(self._cells) >= 2:
+            key = _clean_key(self._cells[0])
+            if key:
+                self.rows.setdefault(key, _clean_value(self._cells[1]))
+        self._cells = None
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+HTTP Transport Module for Jenkins Dashboard
+This module builds the requests session used to talk to Jenkins: a connection
+pool sized for the collector parallelism, default timeouts on every request,
+compressed responses and retries with backoff for transient gateway errors.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_SIZE = 16
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 60
+DEFAULT_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (502, 503, 504)
+
+class JenkinsSession(requests.Session):
+    """Requests session that applies a default timeout to every request"""
+
+    def __init__(self, timeout=(DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)):
+        """
+        Initialize the session
+
+        Args:
+            timeout: (connect, read) timeout in seconds used when a request
+                     does not pass its own
+        """
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().request(method, url, **kwargs)
+
+def create_session(pool_size=DEFAULT_POOL_SIZE, connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+                   read_timeout=DEFAULT_READ_TIMEOUT, retries=DEFAULT_RETRIES):
+    """
+    Create a session configured for many concurrent Jenkins API calls
+
+    Args:
+        pool_size: Number of keep-alive connections kept per host
+        connect_timeout: Seconds to wait for a connection
+        read_timeout: Seconds to wait between bytes of a response
+        retries: Number of retries for connection errors and 502/503/504
+
+    Returns:
+        JenkinsSession: Configured session
+    """
+    session = JenkinsSession(timeout=(connect_timeout, read_timeout))
+
+    # Only idempotent methods are retried (urllib3's default), and the last
+    # response is returned instead of raising once retries run out
+    retry = Retry(
+        total=retries,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    # Jenkins compresses JSON and log responses when asked to
+    session.headers['Accept-Encoding'] = 'gzip, deflate'
+
+    return session
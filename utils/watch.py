@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Watch Mode Module for Jenkins Dashboard
+This module provides the bookkeeping for the long-running watch mode: which
+collectors are due for a refresh on their own cadence, and which values and
+table rows of their results changed since they were last printed.
+"""
+
+import contextlib
+import io
+import json
+from collections.abc import Mapping
+
+class CadenceTracker:
+    """Tracks when each named task was last refreshed and when it is due again"""
+
+    def __init__(self, cadences, default):
+        """
+        Initialize the tracker
+
+        Args:
+            cadences: Refresh interval in seconds by task name
+            default: Refresh interval for tasks not listed in cadences
+        """
+        self.cadences = dict(cadences)
+        self.default = default
+        self._refreshed = {}
+
+    def cadence(self, name):
+        """
+        Get the refresh interval of a task
+
+        Args:
+            name: Task name
+
+        Returns:
+            float: Interval in seconds, never shorter than the default
+        """
+        return max(self.default, self.cadences.get(name, self.default))
+
+    def due(self, names, now):
+        """
+        Get the tasks that need a refresh
+
+        Args:
+            names: Task names to check
+            now: Current monotonic time
+
+        Returns:
+            list: Names of tasks never refreshed or whose interval has elapsed
+        """
+        due = []
+        for name in names:
+            refreshed = self._refreshed.get(name)
+            if refreshed is None or now - refreshed >= self.cadence(name):
+                due.append(name)
+        return due
+
+    def mark(self, names, now):
+        """
+        Record that tasks were refreshed
+
+        Args:
+            names: Task names
+            now: Monotonic time the refresh started
+        """
+        for name in names:
+            self._refreshed[name] = now
+
+# Fields identifying a row of a result table, in the order they are tried
+ROW_KEY_FIELDS = ('name', 'node_name', 'job_name', 'artifact_name', 'number', 'build_number',
+                  'date', 'id', 'url', 'type', 'category', 'message')
+
+_MISSING = object()
+
+def _plain(value, ignore):
+    """Copy a result as plain dicts and lists, without the ignored fields"""
+    if isinstance(value, Mapping):
+        return {key: _plain(item, ignore) for key, item in value.items() if key not in ignore}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item, ignore) for item in value]
+    return value
+
+def _is_rows(value):
+    return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+
+def _keyed_rows(rows):
+    """Key the rows of a table by their identifying fields (or whole content)"""
+    keyed = {}
+    for row in rows:
+        key = tuple((field, row[field]) for field in ROW_KEY_FIELDS if row.get(field) is not None)
+        if not key:
+            key = (('row', json.dumps(row, sort_keys=True, default=str)),)
+        # Rows with the same identity are told apart by their position
+        occurrence = 0
+        while (key, occurrence) in keyed:
+            occurrence += 1
+        keyed[(key, occurrence)] = row
+    return keyed
+
+class ResultDiffer:
+    """Remembers the last result of each section to report which values and rows changed"""
+
+    def __init__(self, ignore=None):
+        """
+        Initialize with no results
+
+        Args:
+            ignore: Field names left out of the comparison by section name,
+                    for values that change on every refresh (such as wait
+                    times relative to now)
+        """
+        self.ignore = {name: frozenset(fields) for name, fields in (ignore or {}).items()}
+        self._results = {}
+
+    def __contains__(self, name):
+        return name in self._results
+
+    def update(self, name, result):
+        """
+        Record the latest result of a section and compare it with the previous one
+
+        Lists of dictionaries are compared row by row, rows being matched on
+        their identifying fields (see ROW_KEY_FIELDS); everything else is
+        compared by value.
+
+        Args:
+            name: Section name
+            result: Collector result
+
+        Returns:
+            dict: 'values' ((path, old, new) tuples) and 'rows' ((path,
+                  [(status, row)], removed row keys) tuples, status being
+                  "added" or "changed"), or None if nothing changed or the
+                  section is new
+        """
+        current = _plain(result, self.ignore.get(name, ()))
+        previous = self._results.get(name, _MISSING)
+        self._results[name] = current
+        if previous is _MISSING:
+            return None
+
+        changes = {'values': [], 'rows': []}
+        self._compare(previous, current, (), changes)
+        return changes if changes['values'] or changes['rows'] else None
+
+    def _compare(self, old, new, path, changes):
+        if isinstance(old, dict) and isinstance(new, dict):
+            for key in list(new) + [key for key in old if key not in new]:
+                self._compare(old.get(key, _MISSING), new.get(key, _MISSING), path + (key,), changes)
+        elif isinstance(old, list) and isinstance(new, list) and _is_rows(old) and _is_rows(new) and (old or new):
+            old_rows = _keyed_rows(old)
+            new_rows = _keyed_rows(new)
+            changed = [("added" if key not in old_rows else "changed", row)
+                       for key, row in new_rows.items() if old_rows.get(key) != row]
+            removed = [key for key, occurrence in old_rows if (key, occurrence) not in new_rows]
+            if changed or removed:
+                changes['rows'].append((path, changed, removed))
+        elif old != new:
+            changes['values'].append((path, None if old is _MISSING else old, None if new is _MISSING else new))
+
+def capture_output(func, *args, **kwargs):
+    """
+    Run a function and capture what it prints
+
+    Args:
+        func: Function to run
+        args: Positional arguments for func
+        kwargs: Keyword arguments for func
+
+    Returns:
+        str: Captured standard output
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        func(*args, **kwargs)
+    return buffer.getvalue()